@@ -14,10 +14,18 @@ from .helpers.api import VideoloftAPI, VideoloftApiClientError
 from .camera import VideoloftCameraStreamView
 from .helpers.coordinator import VideoloftCoordinator
 from .helpers.status_coordinator import VideoloftStatusCoordinator
+from .helpers.snapshot import LiveSnapshotStore
+from .helpers.device_index import DeviceIndex
+from .helpers.inventory import CameraInventory
 from .helpers.views import (
     VideoloftCamerasView,
     VideoloftThumbnailView,
+    VideoloftThumbnailVersionView,
+    VideoloftThumbnailManifestView,
+    VideoloftThumbnailBatchView,
+    VideoloftThumbnailHistoryView,
     VideoloftThumbnailStatsView,
+    VideoloftThumbnailRefreshJobView,
     VideoloftThumbnailPreloadView,
     VideoloftEventsView,
     EventThumbnailView,
@@ -31,6 +39,7 @@ from .helpers.views import (
     AIAnalysisView,
     AISearchView,
     VideoloftCameraDiagnosticView,
+    VideoloftStreamPoolStatsView,
     GeminiQuotaView,
     GlobalStreamStateView
 )
@@ -64,6 +73,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN][entry.entry_id] = {
             "api": api,
             "devices": [],
+            "device_index": DeviceIndex(),
             "tasks": [],
             "lpr_triggers": []
         }
@@ -84,6 +94,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "devices": cameras_info,
+        "device_index": DeviceIndex(cameras_info),
         "tasks": [],
         "lpr_triggers": []
     }
@@ -97,14 +108,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Initialize status coordinator for enhanced device monitoring
     status_coordinator = VideoloftStatusCoordinator(hass, entry, api)
     hass.data[DOMAIN][entry.entry_id]["status_coordinator"] = status_coordinator
+    await status_coordinator.status_history.async_load()
+    status_coordinator.status_history.async_start(entry)
+    await status_coordinator.async_config_entry_first_refresh()
+    # Entities subscribe per camera, which does not start the coordinator's
+    # schedule; this listener keeps the single poll running while loaded
+    entry.async_on_unload(status_coordinator.async_add_listener(lambda: None))
+
+    # Refreshes the camera list and applies additions, removals and changes
+    inventory = CameraInventory(hass, entry, api)
+    hass.data[DOMAIN][entry.entry_id]["inventory"] = inventory
+
+    # Newest proxied HLS segment per camera, used for live snapshots
+    snapshot_store = LiveSnapshotStore(hass)
+    hass.data[DOMAIN][entry.entry_id]["snapshots"] = snapshot_store
 
     # Register all views including the critical stream view
     # Store view instances for proper cleanup
     views = {
-        "camera_stream": VideoloftCameraStreamView(hass, api),
+        "camera_stream": VideoloftCameraStreamView(hass, api, snapshot_store=snapshot_store),
         "cameras": VideoloftCamerasView(hass),
         "thumbnail": VideoloftThumbnailView(hass),
+        "thumbnail_version": VideoloftThumbnailVersionView(hass),
+        "thumbnail_manifest": VideoloftThumbnailManifestView(hass),
+        "thumbnail_batch": VideoloftThumbnailBatchView(hass),
+        "thumbnail_history": VideoloftThumbnailHistoryView(hass),
         "thumbnail_stats": VideoloftThumbnailStatsView(hass),
+        "thumbnail_refresh": VideoloftThumbnailRefreshJobView(hass),
         "thumbnail_preload": VideoloftThumbnailPreloadView(hass),
         "events": VideoloftEventsView(hass),
         "event_thumbnail": EventThumbnailView(hass),
@@ -118,6 +148,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "ai_analysis": AIAnalysisView(hass),
         "ai_search": AISearchView(hass),
         "camera_diagnostic": VideoloftCameraDiagnosticView(hass),
+        "stream_pool_stats": VideoloftStreamPoolStatsView(hass),
         "gemini_quota": GeminiQuotaView(hass),
         "global_stream_state": GlobalStreamStateView(hass)
     }
@@ -177,6 +208,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.warning("Failed to register panel: %s", e)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Start after the platforms so they are listening for new cameras
+    inventory.async_start()
     return True
 
 # ----------------------------------------------------------
@@ -233,6 +266,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             except Exception as e:
                 _LOGGER.warning("Error during coordinator cleanup: %s", e)
 
+        snapshot_store = entry_data.get("snapshots")
+        if snapshot_store:
+            snapshot_store.clear()
+
+        status_coordinator = entry_data.get("status_coordinator")
+        if status_coordinator:
+            try:
+                await status_coordinator.status_history.async_flush()
+            except Exception as e:
+                _LOGGER.warning("Error saving status history: %s", e)
+
         # Step 5.5: Clean up any sensor coordinators (LPR, status, etc.)
         try:
             # Look for and cleanup any sensor coordinators that might exist
@@ -313,6 +357,22 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         except Exception as e:
             _LOGGER.warning("Error cleaning descriptions storage: %s", e)
         
+        # Remove persisted thumbnails
+        try:
+            from .helpers.disk_cache import ThumbnailDiskCache
+            await ThumbnailDiskCache(hass, entry.entry_id, 0).async_clear()
+            _LOGGER.debug("Thumbnail disk cache removed")
+        except Exception as e:
+            _LOGGER.warning("Error removing thumbnail disk cache: %s", e)
+
+        # Remove status transition history
+        try:
+            from .helpers.status_history import StatusHistory
+            await StatusHistory(hass, entry.entry_id).async_clear()
+            _LOGGER.debug("Status history removed")
+        except Exception as e:
+            _LOGGER.warning("Error removing status history: %s", e)
+
         # Remove Gemini API key storage if this was the last entry
         try:
             # Clean in-memory marker
@@ -1,8 +1,7 @@
 """Binary sensor platform for VideLoft integration."""
 
 import logging
-from typing import Any, Dict, Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -15,6 +14,8 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
 from .helpers.device_info import create_device_info, get_camera_capabilities
+from .helpers.entity import VideoloftDeviceEntity
+from .helpers.status_coordinator import VideoloftStatusCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,40 +30,52 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up VideLoft binary sensors."""
-    devices = hass.data[DOMAIN][entry.entry_id]["devices"]
-    
-    entities = []
-    for device_data in devices:
-        uidd = f"{device_data['uid']}.{device_data['id']}"
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: VideoloftStatusCoordinator = entry_data["status_coordinator"]
+
+    def _create_entities(uidd: str, device_data: Dict[str, Any]) -> List[BinarySensorEntity]:
         capabilities = get_camera_capabilities(device_data)
         
         # Always create connectivity sensor
-        entities.append(VideoloftConnectivitySensor(uidd, device_data))
+        entities = [VideoloftConnectivitySensor(coordinator, uidd, device_data)]
         
         # Create capability-based sensors
         if capabilities["cloud_recording"]:
-            entities.append(VideoloftCloudRecordingSensor(uidd, device_data))
+            entities.append(VideoloftCloudRecordingSensor(coordinator, uidd, device_data))
         
         if capabilities["analytics"]:
-            entities.append(VideoloftAnalyticsSensor(uidd, device_data))
+            entities.append(VideoloftAnalyticsSensor(coordinator, uidd, device_data))
             
         if capabilities["mainstream_live"]:
-            entities.append(VideoloftStreamStatusSensor(uidd, device_data))
+            entities.append(VideoloftStreamStatusSensor(coordinator, uidd, device_data))
+        return entities
+    
+    entities = []
+    for uidd, device_data in entry_data["device_index"].items():
+        entities.extend(_create_entities(uidd, device_data))
 
     async_add_entities(entities)
 
+    # Cameras added to the account later get their entities without a reload
+    entry.async_on_unload(
+        entry_data["inventory"].async_add_camera_listener(
+            lambda uidd, device_data: async_add_entities(_create_entities(uidd, device_data))
+        )
+    )
+
 # ----------------------------------------------------------
 # BASE BINARY SENSOR CLASS
 # ----------------------------------------------------------
 
 
-class VideoloftBinarySensorBase(BinarySensorEntity):
+class VideoloftBinarySensorBase(VideoloftDeviceEntity, BinarySensorEntity):
     """Base class for VideLoft binary sensors."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], sensor_type: str) -> None:
+    def __init__(
+        self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], sensor_type: str
+    ) -> None:
         """Initialize the binary sensor."""
-        self.uidd = uidd
-        self.device_data = device_data
+        super().__init__(coordinator, uidd, device_data)
         self.sensor_type = sensor_type
         
         # Set up basic attributes
@@ -70,13 +83,6 @@ class VideoloftBinarySensorBase(BinarySensorEntity):
         self._attr_device_info = create_device_info(uidd, device_data)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "device_id": self.uidd,
-            "last_updated": datetime.now().isoformat(),
-        }
 
 # ----------------------------------------------------------
 # BINARY SENSOR IMPLEMENTATIONS
@@ -86,9 +92,12 @@ class VideoloftBinarySensorBase(BinarySensorEntity):
 class VideoloftConnectivitySensor(VideoloftBinarySensorBase):
     """Binary sensor for camera connectivity status."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    # Changes on every check-in; not worth a recorder row each time
+    _unrecorded_attributes = frozenset({"last_logger_time", "local_live_hosts"})
+
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the connectivity sensor."""
-        super().__init__(uidd, device_data, "connectivity")
+        super().__init__(coordinator, uidd, device_data, "connectivity")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Connectivity"
@@ -100,10 +109,9 @@ class VideoloftConnectivitySensor(VideoloftBinarySensorBase):
         """Return True if camera is connected."""
         return bool(self.device_data.get("mainstreamLive", 0))
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "logger_server": self.device_data.get("logger", ""),
             "last_logger_time": self.device_data.get("lastLogger", ""),
@@ -115,9 +123,9 @@ class VideoloftConnectivitySensor(VideoloftBinarySensorBase):
 class VideoloftCloudRecordingSensor(VideoloftBinarySensorBase):
     """Binary sensor for cloud recording status."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the cloud recording sensor."""
-        super().__init__(uidd, device_data, "cloud_recording")
+        super().__init__(coordinator, uidd, device_data, "cloud_recording")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Cloud Recording"
@@ -129,10 +137,9 @@ class VideoloftCloudRecordingSensor(VideoloftBinarySensorBase):
         """Return True if cloud recording is enabled."""
         return bool(self.device_data.get("cloudRecordingEnabled", 0))
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "recorded_stream_name": self.device_data.get("recordedStreamName", ""),
             "recording_resolution": self.device_data.get("recordingResolution", ""),
@@ -143,9 +150,9 @@ class VideoloftCloudRecordingSensor(VideoloftBinarySensorBase):
 class VideoloftAnalyticsSensor(VideoloftBinarySensorBase):
     """Binary sensor for analytics status."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the analytics sensor."""
-        super().__init__(uidd, device_data, "analytics")
+        super().__init__(coordinator, uidd, device_data, "analytics")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Analytics"
@@ -157,10 +164,9 @@ class VideoloftAnalyticsSensor(VideoloftBinarySensorBase):
         """Return True if analytics is enabled."""
         return bool(self.device_data.get("analyticsEnabled", 0))
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "analytics_scheme": self.device_data.get("analyticsScheme", ""),
         })
@@ -170,9 +176,9 @@ class VideoloftAnalyticsSensor(VideoloftBinarySensorBase):
 class VideoloftStreamStatusSensor(VideoloftBinarySensorBase):
     """Binary sensor for live stream status."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the stream status sensor."""
-        super().__init__(uidd, device_data, "stream_status")
+        super().__init__(coordinator, uidd, device_data, "stream_status")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Live Stream"
@@ -184,10 +190,9 @@ class VideoloftStreamStatusSensor(VideoloftBinarySensorBase):
         """Return True if live stream is active."""
         return bool(self.device_data.get("mainstreamLive", 0))
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "video_codec": self.device_data.get("videoCodec", ""),
             "wowza_server": self.device_data.get("wowza", ""),
@@ -7,26 +7,32 @@ import logging
 import time
 from datetime import datetime
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Set
 
-from aiohttp import web, ClientResponseError, ClientError
+from aiohttp import web, ClientResponseError, ClientError, ClientTimeout
+from yarl import URL
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
-from homeassistant.util import dt as dt_util
 
 from .helpers.api import VideoloftAPI
 from .const import (
     DOMAIN,
     ICON_CAMERA,
+    STREAM_OFFLINE_AFTER_CHECKS,
+    STREAM_OFFLINE_BACKOFF_MAX,
+    STREAM_OFFLINE_BACKOFF_START,
+    STREAM_PREWARM_CONNECTIONS,
+    STREAM_PREWARM_REFRESH,
 )
 from .helpers.device_info import create_device_info, get_camera_capabilities, get_technical_specs
+from .helpers.snapshot import LiveSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,19 +47,28 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Videoloft cameras based on a config entry."""
-    api: VideoloftAPI = hass.data[DOMAIN][entry.entry_id]["api"]
-    devices: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]["devices"]
-
-    entities = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api: VideoloftAPI = entry_data["api"]
+    snapshot_store: Optional[LiveSnapshotStore] = entry_data.get("snapshots")
+    status_coordinator = entry_data.get("status_coordinator")
+    thumbnail_coordinator = entry_data.get("coordinator")
+
+    def _create_camera(uidd: str, device_data: Dict[str, Any]) -> "VideoloftCamera":
+        return VideoloftCamera(
+            hass, api, uidd, device_data, snapshot_store, status_coordinator, thumbnail_coordinator
+        )
 
-    # The 'devices' now directly contains the list of camera objects
-    for device_data in devices:
-        uidd = f"{device_data['uid']}.{device_data['id']}" # Construct uidd from flat data
-        camera = VideoloftCamera(hass, api, uidd, device_data)
-        entities.append(camera)
+    entities = [_create_camera(uidd, device_data) for uidd, device_data in entry_data["device_index"].items()]
 
     async_add_entities(entities)
 
+    # Cameras added to the account later get an entity without a reload
+    entry.async_on_unload(
+        entry_data["inventory"].async_add_camera_listener(
+            lambda uidd, device_data: async_add_entities([_create_camera(uidd, device_data)])
+        )
+    )
+
 # ----------------------------------------------------------
 # CAMERA ENTITY CLASS
 # ----------------------------------------------------------
@@ -68,6 +83,9 @@ class VideoloftCamera(Camera):
         api: VideoloftAPI,
         uidd: str,
         device_data: Dict[str, Any],
+        snapshot_store: Optional[LiveSnapshotStore] = None,
+        status_coordinator=None,
+        thumbnail_coordinator=None,
     ) -> None:
         """Initialize the camera."""
         super().__init__()
@@ -76,6 +94,9 @@ class VideoloftCamera(Camera):
         self.api = api
         self.uidd = uidd
         self.device_data = device_data
+        self.snapshot_store = snapshot_store
+        self.status_coordinator = status_coordinator
+        self.thumbnail_coordinator = thumbnail_coordinator
 
         self._attr_name = device_data.get("phonename", f"Camera {uidd}")
         self._attr_unique_id = f"videoloft_camera_{uidd}"
@@ -95,9 +116,15 @@ class VideoloftCamera(Camera):
         self._keep_alive_task = None
         self._streaming_paused = False  # Add global streaming control
 
+        # Backoff for cameras that stay offline or not live
+        self._not_live_checks = 0
+        self._offline_backoff = STREAM_OFFLINE_BACKOFF_START
+        self._wake_event = asyncio.Event()
+
         # Start the initialization process
+        self._init_task: Optional[asyncio.Task] = None
         if self.hass:
-            self.hass.loop.create_task(self.initialize_stream())
+            self._init_task = self.hass.loop.create_task(self.initialize_stream())
 
     async def initialize_stream(self) -> None:
         """Initialize the camera stream."""
@@ -117,8 +144,9 @@ class VideoloftCamera(Camera):
                 self._keep_alive_task = self.hass.loop.create_task(self.keep_stream_alive())
         await asyncio.sleep(2)  # Give keep-alive task time to start
 
+        # Retries back off on their own; the shared offline backoff belongs to keep-alive
         retry_delay = 10
-        while True:
+        while not self._stream_available:
             try:
                 status_data = await self.api.get_camera_status(self.uidd, self.logger_server)
                 owner_uid, device_uid = self.uidd.split('.')
@@ -141,6 +169,7 @@ class VideoloftCamera(Camera):
             except Exception as e:
                 _LOGGER.error(f"Stream initialization error for {self._attr_name}: {e}")
                 await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, STREAM_OFFLINE_BACKOFF_MAX)
 
     async def update_stream_url(self) -> bool:
         """Update the stream URL from current camera status."""
@@ -202,6 +231,7 @@ class VideoloftCamera(Camera):
                 if self.hass:
                     self.last_live_command_time = self.hass.loop.time()
                 _LOGGER.debug(f"Live command sent to {self._attr_name}")
+                delay = interval
 
                 # Quick stream status check with timeout
                 try:
@@ -224,6 +254,7 @@ class VideoloftCamera(Camera):
                                 _LOGGER.debug(f"Stream URL updated for {self._attr_name}")
                             self.wowza = new_wowza
                             self.live_stream_name = new_stream_name
+                        self._record_live()
                         # Update stream availability
                         if not self._stream_available:
                             self._stream_available = True
@@ -231,6 +262,7 @@ class VideoloftCamera(Camera):
                             _LOGGER.info(f"Stream became available for {self._attr_name}")
                     else:
                         # Stream is not live
+                        delay = self._record_not_live(interval)
                         if self._stream_available:
                             self._stream_available = False
                             self.async_write_ha_state()
@@ -238,18 +270,85 @@ class VideoloftCamera(Camera):
                     consecutive_failures = 0
                 except asyncio.TimeoutError:
                     _LOGGER.warning(f"Status check timeout for {self._attr_name}")
+                    delay = self._record_not_live(interval)
 
-                await asyncio.sleep(interval)
+                await self._async_sleep_or_wake(delay)
 
             except asyncio.TimeoutError:
                 consecutive_failures += 1
                 _LOGGER.warning(f"Live command timeout for {self._attr_name} (attempt {consecutive_failures})")
-                await asyncio.sleep(interval)
+                await self._async_sleep_or_wake(self._record_not_live(interval))
 
             except Exception as e:
                 consecutive_failures += 1
                 _LOGGER.error(f"Keep-alive error for {self._attr_name}: {e} (attempt {consecutive_failures})")
-                await asyncio.sleep(interval)
+                await self._async_sleep_or_wake(self._record_not_live(interval))
+
+    def _record_live(self) -> None:
+        """Reset the offline backoff after the camera was seen live."""
+        if self._not_live_checks >= STREAM_OFFLINE_AFTER_CHECKS:
+            _LOGGER.info(f"{self._attr_name} is live again, resuming normal stream checks")
+        self._not_live_checks = 0
+        self._offline_backoff = STREAM_OFFLINE_BACKOFF_START
+
+    def _record_not_live(self, default: float) -> float:
+        """Count a failed check and return the delay before the next one.
+
+        The first few failures keep the normal delay; after that the delay
+        doubles on each failure up to STREAM_OFFLINE_BACKOFF_MAX.
+        """
+        self._not_live_checks += 1
+        if self._not_live_checks < STREAM_OFFLINE_AFTER_CHECKS:
+            return default
+        if self._not_live_checks == STREAM_OFFLINE_AFTER_CHECKS:
+            _LOGGER.info(f"{self._attr_name} is not live, backing off stream checks")
+        delay = self._offline_backoff
+        self._offline_backoff = min(self._offline_backoff * 2, STREAM_OFFLINE_BACKOFF_MAX)
+        return delay
+
+    @property
+    def _is_backing_off(self) -> bool:
+        return self._not_live_checks >= STREAM_OFFLINE_AFTER_CHECKS
+
+    async def _async_sleep_or_wake(self, delay: float) -> None:
+        """Sleep for ``delay`` seconds or until the stream checks are woken."""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
+    @callback
+    def wake_stream_checks(self) -> None:
+        """Check the stream once now while backing off.
+
+        The backoff itself is only reset when that check finds the camera live,
+        so a camera that uploads thumbnails but never streams keeps backing off.
+        """
+        if not self._is_backing_off:
+            return
+        _LOGGER.debug(f"{self._attr_name} may be back, waking stream checks")
+        self._wake_event.set()
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Wake the stream checks when the bulk status poll shows the camera back."""
+        device_data = self.status_coordinator.get_device_data(self.uidd) or {}
+        if device_data.get("current_status") in ("live", "online") or device_data.get("live_active"):
+            self.wake_stream_checks()
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for cheaper signals that an offline camera is back."""
+        await super().async_added_to_hass()
+        if self.status_coordinator:
+            self.async_on_remove(
+                self.status_coordinator.async_add_device_listener(self.uidd, self._handle_status_update)
+            )
+        if self.thumbnail_coordinator:
+            # Motion listeners fire for each new thumbnail, i.e. when lastthumb changes
+            self.async_on_remove(
+                self.thumbnail_coordinator.async_add_motion_listener(self.uidd, self.wake_stream_checks)
+            )
 
     async def stream_source(self) -> Optional[str]:
         """Return the current stream source URL."""
@@ -259,6 +358,8 @@ class VideoloftCamera(Camera):
             
         # Only return stream URL if it's actually available
         if not self._stream_available:
+            # Someone wants to watch: check once now without resetting the backoff
+            self.wake_stream_checks()
             return None
             
         if not self._stream_url or "wowza1" in self._stream_url:
@@ -281,34 +382,26 @@ class VideoloftCamera(Camera):
             # Defensive programming: ensure this method always returns bytes or None, never a coroutine
             _LOGGER.debug(f"Fetching camera image for {self.uidd}")
             
-            # Get coordinator from hass data
-            coordinator = None
-            for entry_id, entry_data in self.hass.data.get(DOMAIN, {}).items():
-                if "coordinator" in entry_data:
-                    coordinator = entry_data["coordinator"]
-                    break
-            
+            coordinator = self.thumbnail_coordinator
+            if coordinator and self.snapshot_store:
+                # A camera being watched has a keyframe seconds old in the proxy,
+                # which is fresher than any cloud thumbnail
+                snapshot = await self.snapshot_store.async_get_snapshot(self.uidd)
+                if snapshot:
+                    _LOGGER.debug(f"Returning live stream snapshot for {self.uidd}")
+                    image, _ = await coordinator.async_get_image_variant(
+                        snapshot["snapshot"], snapshot["variants"], width, height
+                    )
+                    return image
+
             if coordinator:
-                # Try to get thumbnail immediately, even if slightly stale for faster display
-                thumbnail_data = await coordinator.get_cached_thumbnail_immediate(self.uidd)
-                if thumbnail_data and isinstance(thumbnail_data, bytes):
-                    # Start background refresh if cache is getting old
-                    cache_entry = coordinator._thumbnail_cache.get(self.uidd)
-                    if cache_entry:
-                        cached_time = cache_entry.get("timestamp")
-                        if cached_time:
-                            cache_age = dt_util.utcnow() - cached_time
-                            # If cache is older than refresh interval, trigger background refresh
-                            if cache_age > coordinator._thumbnail_refresh_interval:
-                                self.hass.async_create_task(coordinator.refresh_thumbnail(self.uidd, force=True))
-                    _LOGGER.debug(f"Returning cached thumbnail for {self.uidd} ({len(thumbnail_data)} bytes)")
-                    return thumbnail_data
-                
-                # If no cached thumbnail available, get fresh one
+                # Cached data is returned immediately, even if slightly stale, and revalidated
+                # in the background; concurrent callers share a single upstream fetch
                 thumbnail_data = await coordinator.ensure_thumbnail_available(self.uidd)
                 if thumbnail_data and isinstance(thumbnail_data, bytes):
-                    _LOGGER.debug(f"Returning fresh thumbnail for {self.uidd} ({len(thumbnail_data)} bytes)")
-                    return thumbnail_data
+                    _LOGGER.debug(f"Returning thumbnail for {self.uidd} ({len(thumbnail_data)} bytes)")
+                    image, _ = await coordinator.async_get_thumbnail_variant(self.uidd, thumbnail_data, width, height)
+                    return image
             
             # Fallback to direct API call if coordinator not available
             if self.logger_server:
@@ -424,6 +517,7 @@ class VideoloftCamera(Camera):
             "wowza_server": self.device_data.get("wowza", ""),
             "local_live_hosts": self.device_data.get("localLiveHosts", []),
             "tags": self.device_data.get("tags", []),
+            "stream_check_backoff": self._offline_backoff if self._is_backing_off else None,
         }
         return attributes
     
@@ -431,14 +525,15 @@ class VideoloftCamera(Camera):
         """Called when entity will be removed from hass."""
         _LOGGER.debug("Cleaning up camera entity: %s", self._attr_name)
         
-        # Stop the keep-alive task properly
-        if hasattr(self, '_keep_alive_task') and self._keep_alive_task and not self._keep_alive_task.done():
-            self._keep_alive_task.cancel()
-            try:
-                await self._keep_alive_task
-            except asyncio.CancelledError:
-                pass
-            _LOGGER.debug("Keep-alive task cancelled for camera %s", self._attr_name)
+        # Stop the initialization retry loop and the keep-alive task properly
+        for task in (self._init_task, self._keep_alive_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        _LOGGER.debug("Stream tasks cancelled for camera %s", self._attr_name)
         
         # Legacy cleanup for any other tasks (fallback)
         try:
@@ -470,10 +565,11 @@ class VideoloftCameraStreamView(HomeAssistantView):
     name = "api:videoloft:stream"
     requires_auth = False
 
-    def __init__(self, hass, api, max_connections=150):
+    def __init__(self, hass, api, max_connections=150, snapshot_store=None):
         """Initialize the stream view with optimized connection management."""
         self.hass = hass
         self.api = api
+        self.snapshot_store = snapshot_store
         from aiohttp import TCPConnector, ClientSession, ClientTimeout, CookieJar
         
         # Optimized connector for low-latency surveillance streaming
@@ -502,6 +598,11 @@ class VideoloftCameraStreamView(HomeAssistantView):
             headers={"Connection": "keep-alive"} # Ensure keep-alive
         )
 
+        # Pre-warming state: last warm-up time per Wowza host and in-flight tasks
+        self._prewarmed_hosts: Dict[str, float] = {}
+        self._prewarm_tasks: Set[asyncio.Task] = set()
+        self._prewarm_count = 0
+
     async def get(self, request, uidd: str, path: str) -> web.StreamResponse:
         """Handle GET request to proxy the stream and manage 404 errors by reinitializing the stream."""
         _LOGGER.debug(f"Proxying stream for {uidd}, path: {path}")
@@ -529,6 +630,11 @@ class VideoloftCameraStreamView(HomeAssistantView):
             _LOGGER.warning(f"Stream URL for {uidd} is still a placeholder (wowza1), waiting for valid URL.")
             return web.HTTPServiceUnavailable(text="Placeholder URL; waiting for valid stream.")
 
+        # A viewer is opening the stream: warm spare connections to the edge in
+        # parallel with the playlist fetch so the first segments skip the handshake
+        if target_url.endswith(".m3u8"):
+            self.schedule_prewarm([URL(target_url).host])
+
         headers = await self.get_auth_headers()
 
         try:
@@ -542,7 +648,7 @@ class VideoloftCameraStreamView(HomeAssistantView):
                         rewritten_playlist = self.rewrite_m3u8_playlist(playlist_content, uidd)
                         return web.Response(body=rewritten_playlist, content_type=content_type)
                     else:
-                        return await self.stream_segment_optimized(request, upstream_resp)
+                        return await self.stream_segment_optimized(request, upstream_resp, uidd)
                 elif upstream_resp.status == 404:
                     # Check if global streaming is paused before attempting reinitialize
                     if await camera_entity._is_global_streaming_paused():
@@ -561,6 +667,113 @@ class VideoloftCameraStreamView(HomeAssistantView):
             _LOGGER.exception(f"Error fetching {target_url} for {uidd}: {e}")
             return web.HTTPInternalServerError()
 
+    # ----------------------------------------------------------
+    # CONNECTION PRE-WARMING
+    # ----------------------------------------------------------
+
+    def get_known_wowza_host(self, uidd: str) -> Optional[str]:
+        """Return the Wowza edge currently serving a camera, if known."""
+        host = None
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            if not isinstance(entry_data, dict):
+                continue
+            status_coordinator = entry_data.get("status_coordinator")
+            if status_coordinator:
+                status = status_coordinator.get_device_data(uidd) or {}
+                host = status.get("current_wowza") or None
+                if host:
+                    break
+
+        if not host:
+            camera_component = self.hass.data.get("camera")
+            if camera_component:
+                camera_entity = next(
+                    (entity for entity in camera_component.entities if getattr(entity, "uidd", None) == uidd),
+                    None,
+                )
+                host = getattr(camera_entity, "wowza", None)
+
+        # wowza1 is the placeholder reported before a live stream is assigned
+        if not host or host == "wowza1":
+            return None
+        return host
+
+    def schedule_prewarm(self, hosts: Iterable[Optional[str]]) -> None:
+        """Warm connection pools for the given Wowza hosts in the background."""
+        now = self.hass.loop.time()
+        for host in set(filter(None, hosts)):
+            last_warmed = self._prewarmed_hosts.get(host)
+            if last_warmed is not None and now - last_warmed < STREAM_PREWARM_REFRESH:
+                continue
+            self._prewarmed_hosts[host] = now
+            task = self.hass.async_create_task(self._async_prewarm_host(host))
+            self._prewarm_tasks.add(task)
+            task.add_done_callback(self._prewarm_tasks.discard)
+
+    async def _async_prewarm_host(self, host: str) -> None:
+        """Open idle keep-alive connections to a host so later requests reuse them."""
+
+        async def _open_connection() -> None:
+            # HEAD is enough to complete DNS, TCP and TLS; the connection is
+            # returned to the pool once the response is released
+            async with self.session.head(
+                f"https://{host}/",
+                allow_redirects=False,
+                timeout=ClientTimeout(total=5, connect=3),
+            ):
+                pass
+
+        results = await asyncio.gather(
+            *(_open_connection() for _ in range(STREAM_PREWARM_CONNECTIONS)),
+            return_exceptions=True,
+        )
+        warmed = sum(1 for result in results if not isinstance(result, Exception))
+        self._prewarm_count += warmed
+        if warmed:
+            _LOGGER.debug("Pre-warmed %d connection(s) to %s", warmed, host)
+        else:
+            # Allow another attempt on the next trigger instead of waiting a full refresh period
+            self._prewarmed_hosts.pop(host, None)
+            _LOGGER.debug("Connection pre-warm to %s failed: %s", host, results[0])
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool occupancy for the stream proxy session."""
+        connector = self.session.connector
+        now = self.hass.loop.time()
+        hosts: Dict[str, Dict[str, Any]] = {}
+
+        # aiohttp exposes no public occupancy API, so read the pool bookkeeping defensively
+        for key, conns in (getattr(connector, "_conns", None) or {}).items():
+            host_stats = hosts.setdefault(getattr(key, "host", str(key)), {"idle": 0, "acquired": 0})
+            host_stats["idle"] += len(conns)
+        for key, conns in (getattr(connector, "_acquired_per_host", None) or {}).items():
+            host_stats = hosts.setdefault(getattr(key, "host", str(key)), {"idle": 0, "acquired": 0})
+            host_stats["acquired"] += len(conns)
+        for host, warmed_at in self._prewarmed_hosts.items():
+            host_stats = hosts.setdefault(host, {"idle": 0, "acquired": 0})
+            host_stats["last_prewarm_seconds_ago"] = round(now - warmed_at, 1)
+
+        return {
+            "limit": getattr(connector, "limit", None),
+            "limit_per_host": getattr(connector, "limit_per_host", None),
+            "acquired": len(getattr(connector, "_acquired", None) or ()),
+            "idle": sum(host_stats["idle"] for host_stats in hosts.values()),
+            "prewarmed_connections": self._prewarm_count,
+            "prewarm_in_progress": len(self._prewarm_tasks),
+            "hosts": hosts,
+            "snapshots": self.snapshot_store.get_stats() if self.snapshot_store else None,
+        }
+
+    async def cleanup(self) -> None:
+        """Cancel pre-warm tasks and close the proxy session."""
+        for task in set(self._prewarm_tasks):
+            task.cancel()
+        if self._prewarm_tasks:
+            await asyncio.gather(*self._prewarm_tasks, return_exceptions=True)
+        self._prewarm_tasks.clear()
+        if not self.session.closed:
+            await self.session.close()
+
     def construct_target_url(self, stream_url: str, path: Optional[str]) -> str:
         """Construct the target URL based on the path provided."""
         return f"{stream_url.rsplit('/', 1)[0]}/{path}" if path else stream_url
@@ -576,8 +789,12 @@ class VideoloftCameraStreamView(HomeAssistantView):
             "Connection": "keep-alive"
         }
 
-    async def stream_segment_optimized(self, request, upstream_resp):
-        """Optimized streaming of video segments with backpressure handling."""
+    async def stream_segment_optimized(self, request, upstream_resp, uidd: Optional[str] = None):
+        """Optimized streaming of video segments with backpressure handling.
+
+        When a snapshot store is configured the relayed bytes are also kept so
+        the newest segment of each watched camera can be decoded into a still.
+        """
         headers = {
             "Content-Type": upstream_resp.headers.get("Content-Type", "video/MP2T"),
             "Cache-Control": "public, max-age=10", # Slightly longer cache for stability
@@ -590,11 +807,21 @@ class VideoloftCameraStreamView(HomeAssistantView):
         resp = web.StreamResponse(headers=headers)
         await resp.prepare(request)
 
+        capture = bytearray() if self.snapshot_store and uidd else None
+
         try:
             # Use a smaller chunk size for lower latency
             async for chunk in upstream_resp.content.iter_chunked(32768):
                 await resp.write(chunk)
+                if capture is not None:
+                    if len(capture) + len(chunk) > self.snapshot_store.max_segment_bytes:
+                        capture = None
+                    else:
+                        capture.extend(chunk)
             await resp.write_eof()
+            # Only complete segments are kept; a partial one cannot be decoded reliably
+            if capture:
+                self.snapshot_store.add_segment(uidd, bytes(capture))
         except asyncio.CancelledError:
             _LOGGER.debug("Stream for segment cancelled by client.")
         except Exception as e:
@@ -602,9 +829,9 @@ class VideoloftCameraStreamView(HomeAssistantView):
         finally:
             return resp
     
-    async def stream_segment(self, request, upstream_resp):
+    async def stream_segment(self, request, upstream_resp, uidd: Optional[str] = None):
         """Fallback method for compatibility - redirects to optimized version."""
-        return await self.stream_segment_optimized(request, upstream_resp)
+        return await self.stream_segment_optimized(request, upstream_resp, uidd)
 
     async def handle_upstream_error(self, upstream_resp, uidd) -> web.Response:
         """Handle errors from upstream responses."""
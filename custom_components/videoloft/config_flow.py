@@ -14,6 +14,10 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_THUMBNAIL_HISTORY_SIZE,
+    CONF_THUMBNAIL_IDLE_MINUTES,
+    DEFAULT_THUMBNAIL_HISTORY_SIZE,
+    DEFAULT_THUMBNAIL_IDLE_MINUTES,
     DOMAIN,
     LPR_STORAGE_VERSION,
     LPR_STORAGE_KEY,
@@ -151,7 +155,21 @@ class VideoloftOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional("model", default=""): str, 
                     vol.Optional("color", default=""): str,
                 })]
-            )
+            ),
+            # Minutes without a view before a camera's thumbnail stops refreshing (0 = never)
+            vol.Optional(
+                CONF_THUMBNAIL_IDLE_MINUTES,
+                default=self.config_entry.options.get(
+                    CONF_THUMBNAIL_IDLE_MINUTES, DEFAULT_THUMBNAIL_IDLE_MINUTES
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            # Recent thumbnails kept per camera for time-lapse review (0 = off)
+            vol.Optional(
+                CONF_THUMBNAIL_HISTORY_SIZE,
+                default=self.config_entry.options.get(
+                    CONF_THUMBNAIL_HISTORY_SIZE, DEFAULT_THUMBNAIL_HISTORY_SIZE
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=500)),
         })
 
         return self.async_show_form(
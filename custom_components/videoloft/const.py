@@ -16,6 +16,7 @@ STORAGE_VERSION = 1
 LPR_STORAGE_VERSION = 1
 LPR_STORAGE_KEY = "videoloft_lpr_triggers"
 LPR_TRIGGER_STORAGE_KEY = "lpr_triggers"  # Key to store LPR triggers in hass.data
+LPR_TRIGGER_INDEX_KEY = "lpr_trigger_index"  # Key to store the compiled trigger matcher in hass.data
 
 # ----------------------------------------------------------
 # API CONFIGURATION
@@ -33,6 +34,73 @@ KEEPALIVE_INTERVAL = 30  # Interval to send livecommand tasks
 # Timeout settings
 SESSION_TIMEOUT = 30  # Timeout for HTTP sessions in seconds
 
+# Batched thumbnail sprite layout
+THUMBNAIL_SPRITE_TILE_WIDTH = 320
+THUMBNAIL_SPRITE_TILE_HEIGHT = 180
+THUMBNAIL_SPRITE_COLUMNS = 8
+
+# Resized thumbnail variants: requested sizes snap up to the nearest bucket so
+# the per-size cache stays small
+THUMBNAIL_SIZE_BUCKETS = (160, 320, 480, 640, 960, 1280, 1920)
+THUMBNAIL_VARIANT_QUALITY = 80
+THUMBNAIL_WEBP_QUALITY = 70
+THUMBNAIL_SAVE_DATA_QUALITY = 60  # JPEG quality used when the client sends Save-Data: on
+THUMBNAIL_QUALITY_LEVELS = (40, 60, 80, 95)  # Requested qualities snap to the nearest level
+THUMBNAIL_MAX_VARIANTS = 8  # Encoded variants kept per image; least recently used is dropped
+
+# Thumbnail memory caches: total bytes (originals plus variants) and seconds an
+# entry may go without being re-stored before it is dropped
+THUMBNAIL_CACHE_MAX_BYTES = 24 * 1024 * 1024
+THUMBNAIL_CACHE_TTL = 1800
+EVENT_THUMBNAIL_CACHE_MAX_BYTES = 8 * 1024 * 1024
+EVENT_THUMBNAIL_CACHE_TTL = 3600
+
+# Demand-aware thumbnail refresh scheduling
+CONF_THUMBNAIL_IDLE_MINUTES = "thumbnail_idle_minutes"
+DEFAULT_THUMBNAIL_IDLE_MINUTES = 30  # Unviewed cameras stop refreshing after this; 0 never skips
+THUMBNAIL_REFRESH_CONCURRENCY = 4  # Upstream thumbnail fetches running at once
+THUMBNAIL_SCHEDULER_TICK = 15  # Seconds between scheduling passes
+THUMBNAIL_CHANGE_HISTORY = 8  # Refreshes remembered per camera to estimate the lastthumb change rate
+
+THUMBNAIL_REFRESH_JOB_HISTORY = 10  # Finished bulk refresh jobs kept for status queries
+
+# Optional per-camera history of recent thumbnails for time-lapse review
+CONF_THUMBNAIL_HISTORY_SIZE = "thumbnail_history_size"
+DEFAULT_THUMBNAIL_HISTORY_SIZE = 0  # Thumbnails kept per camera; 0 disables history
+THUMBNAIL_HISTORY_MAX_BYTES = 16 * 1024 * 1024  # Shared by all cameras; oldest frames go first
+THUMBNAIL_TIMELAPSE_WIDTH = 640
+THUMBNAIL_TIMELAPSE_FRAME_MS = 400
+
+# Motion score from consecutive thumbnails: percentage of downscaled grayscale
+# pixels whose brightness moved by more than MOTION_PIXEL_THRESHOLD levels
+MOTION_SIGNATURE_SIZE = (64, 36)
+MOTION_PIXEL_THRESHOLD = 25
+MOTION_CHANGE_THRESHOLD = 2.0  # Scores below this count as "nothing changed"
+
+# AI search results: thumbnails of the top results are prefetched into the event cache
+AI_SEARCH_PREFETCH_COUNT = 24
+AI_SEARCH_PREFETCH_CONCURRENCY = 4
+
+# Forced thumbnail refreshes of one camera are not repeated within this many seconds
+THUMBNAIL_FORCED_REFRESH_MIN_INTERVAL = 15
+
+# Disk-backed thumbnails restored after a restart
+THUMBNAIL_DISK_MAX_EVENT_THUMBNAILS = 200
+THUMBNAIL_DISK_INDEX_SAVE_DELAY = 10  # Seconds to coalesce index writes
+
+# Live snapshots decoded from the newest proxied HLS segment
+SNAPSHOT_MAX_SEGMENT_BYTES = 4 * 1024 * 1024  # Segments larger than this are not retained
+SNAPSHOT_MAX_SEGMENT_AGE = 30  # Seconds a proxied segment is considered live
+
+# Stream proxy connection pre-warming
+STREAM_PREWARM_CONNECTIONS = 2  # Idle connections opened per Wowza edge
+STREAM_PREWARM_REFRESH = 30  # Seconds before a host is warmed again (below keepalive_timeout)
+
+# Stream checks for cameras that are offline or not live
+STREAM_OFFLINE_AFTER_CHECKS = 3  # Consecutive not-live checks before backing off
+STREAM_OFFLINE_BACKOFF_START = 60  # First backoff delay in seconds, doubled per failed check
+STREAM_OFFLINE_BACKOFF_MAX = 1800  # Ceiling for the backoff delay
+
 # ----------------------------------------------------------
 # ENTITY ICONS
 # ----------------------------------------------------------
@@ -113,4 +181,30 @@ LOOKBACK_PERIOD_HOURS = 3
 # Update intervals for different sensor types
 CONNECTIVITY_UPDATE_INTERVAL = 300  # 5 minutes
 FIRMWARE_UPDATE_INTERVAL = 43200    # 12 hours  
-STATUS_UPDATE_INTERVAL = 300        # 5 minutes
\ No newline at end of file
+STATUS_UPDATE_INTERVAL = 300        # 5 minutes
+
+# Status polling runs concurrently, capped per logger server
+STATUS_LOGGER_CONCURRENCY = 4  # Requests in flight per logger server
+STATUS_DEVICE_TIMEOUT = 20     # Seconds allowed for one camera's status poll
+
+# Adaptive per-camera status polling (seconds)
+STATUS_SCHEDULER_TICK = 30             # How often the status coordinator looks for due cameras
+STATUS_MIN_INTERVAL = 30               # Cameras whose status just changed
+STATUS_VIEWED_INTERVAL = 60            # Cameras someone is watching
+STATUS_MAX_INTERVAL = 1800             # Stable online cameras back off up to this
+STATUS_OFFLINE_MAX_INTERVAL = 3600     # Long-offline cameras back off up to this
+STATUS_FLAP_WINDOW = 900               # A status change this recent keeps a camera on short intervals
+
+# Adaptive LPR polling (seconds); the ceiling stays inside the 5 minute lookback
+LPR_MIN_POLL_INTERVAL = 15
+LPR_MAX_POLL_INTERVAL = 240
+LPR_SEEN_DETECTION_HISTORY = 500  # Detection IDs remembered to tell new vehicles from repeats
+
+# Camera inventory refresh (seconds); bypasses the API's 12 hour camera cache
+CAMERA_INVENTORY_INTERVAL = 3600
+
+# Per-camera status history
+STATUS_HISTORY_CAPACITY = 256            # Transitions kept per camera
+STATUS_HISTORY_SAVE_DELAY = 120          # Seconds to batch transitions before writing
+STATUS_HISTORY_REFRESH_INTERVAL = 900    # Seconds between availability sensor refreshes
+STATUS_FLAP_COUNT_WINDOW = 86400         # Window for the status change count sensor
@@ -184,10 +184,14 @@ class VideoloftAPI:
         device_status = status_data.get("result", {}).get(owner_uid, {}).get("devices", {}).get(device_uid, {})
         return device_status.get("lastthumb", 0)
 
-    async def get_camera_thumbnail(self, uidd, logger_server):
-        """Get the latest thumbnail image from the camera."""
+    async def get_camera_thumbnail(self, uidd, logger_server, last_thumb_time=None):
+        """Get the latest thumbnail image from the camera.
+
+        Pass ``last_thumb_time`` when it is already known to skip the status lookup.
+        """
         try:
-            last_thumb_time = await self.get_last_thumb_time(uidd, logger_server)
+            if last_thumb_time is None:
+                last_thumb_time = await self.get_last_thumb_time(uidd, logger_server)
             token = await self.get_token()
             url = f"https://{logger_server}/getthumb/{uidd}/{last_thumb_time}/{token}"
             return await self._request('get', url, binary=True, timeout=10)
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Dict, Any, Optional
+import time
+import uuid
+from collections import deque
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import asyncio
 from datetime import datetime, timedelta
 import aiofiles
@@ -14,11 +17,58 @@ from homeassistant.helpers import storage
 from homeassistant.util import dt as dt_util
 
 from ..const import (
+    AI_SEARCH_PREFETCH_CONCURRENCY,
+    CONF_THUMBNAIL_HISTORY_SIZE,
+    CONF_THUMBNAIL_IDLE_MINUTES,
+    DEFAULT_THUMBNAIL_HISTORY_SIZE,
+    DEFAULT_THUMBNAIL_IDLE_MINUTES,
     DOMAIN,
+    EVENT_THUMBNAIL_CACHE_MAX_BYTES,
+    EVENT_THUMBNAIL_CACHE_TTL,
     LPR_STORAGE_VERSION,
     LPR_STORAGE_KEY,
+    MOTION_CHANGE_THRESHOLD,
+    MOTION_PIXEL_THRESHOLD,
+    MOTION_SIGNATURE_SIZE,
+    THUMBNAIL_CACHE_MAX_BYTES,
+    THUMBNAIL_CACHE_TTL,
+    THUMBNAIL_CHANGE_HISTORY,
+    THUMBNAIL_DISK_MAX_EVENT_THUMBNAILS,
+    THUMBNAIL_FORCED_REFRESH_MIN_INTERVAL,
+    THUMBNAIL_HISTORY_MAX_BYTES,
+    THUMBNAIL_MAX_VARIANTS,
+    THUMBNAIL_QUALITY_LEVELS,
+    THUMBNAIL_REFRESH_CONCURRENCY,
+    THUMBNAIL_REFRESH_JOB_HISTORY,
+    THUMBNAIL_SCHEDULER_TICK,
+    THUMBNAIL_SPRITE_TILE_WIDTH,
+    THUMBNAIL_SPRITE_TILE_HEIGHT,
+    THUMBNAIL_SPRITE_COLUMNS,
+    THUMBNAIL_TIMELAPSE_FRAME_MS,
+    THUMBNAIL_TIMELAPSE_WIDTH,
+    THUMBNAIL_SIZE_BUCKETS,
+    THUMBNAIL_VARIANT_QUALITY,
+    THUMBNAIL_WEBP_QUALITY,
 )
 from .gemini_api import GeminiAPI
+from .image import (
+    IMAGE_CONTENT_TYPES,
+    IMAGE_FORMAT_JPEG,
+    IMAGE_FORMAT_WEBP,
+    compose_sprite,
+    compose_timelapse_gif,
+    compute_motion,
+    content_digest,
+    encode_variant,
+    snap_quality,
+    snap_thumbnail_size,
+    variant_tag,
+)
+from .device_index import DeviceIndex
+from .disk_cache import KIND_EVENT, KIND_LIVE, ThumbnailDiskCache
+from .lpr_matcher import set_lpr_triggers
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_history import ThumbnailHistory
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,13 +94,44 @@ class VideoloftCoordinator:
         self._descriptions: Dict[str, Any] = {}
         
         # Thumbnail caching
-        self._thumbnail_cache: Dict[str, Dict[str, Any]] = {}
+        self._thumbnail_cache = ThumbnailCache("thumbnail", THUMBNAIL_CACHE_MAX_BYTES, THUMBNAIL_CACHE_TTL)
+        self._event_thumbnail_cache = ThumbnailCache(
+            "event_thumbnail", EVENT_THUMBNAIL_CACHE_MAX_BYTES, EVENT_THUMBNAIL_CACHE_TTL
+        )
         self._thumbnail_refresh_task: Optional[asyncio.Task] = None
         self._thumbnail_cache_duration = timedelta(minutes=5)  # Cache for 5 minutes
         self._thumbnail_refresh_interval = timedelta(minutes=2)  # Refresh every 2 minutes
+        self._sprite_cache: Optional[Dict[str, Any]] = None  # Last composited multi-camera sprite
+        # Single-flight refreshes: one upstream fetch per camera serves every waiter
+        self._thumbnail_inflight: Dict[str, asyncio.Task] = {}
+        self._last_forced_refresh: Dict[str, float] = {}
+        self._refresh_stats = {"fetches": 0, "coalesced": 0, "rate_limited": 0}
+        self._event_thumbnail_inflight: Dict[str, asyncio.Task] = {}
+        # Caps upstream fetches from batch thumbnail requests, across all requests
+        self._batch_fetch_semaphore = asyncio.Semaphore(THUMBNAIL_REFRESH_CONCURRENCY)
+        # Demand signals for the refresh scheduler
+        self._last_viewed: Dict[str, float] = {}
+        self._lastthumb_changes: Dict[str, deque] = {}
+        self._scheduler_stats = {"passes": 0, "refreshed": 0, "skipped_idle": 0}
+        # Change score between consecutive thumbnails: uidd -> {signature, score, changed, timestamp}
+        self._motion: Dict[str, Dict[str, Any]] = {}
+        self._motion_available = True
+        self._motion_listeners: Dict[str, List[Callable[[], None]]] = {}
+        # Optional ring buffer of recent thumbnails per camera for time-lapses
+        self._thumbnail_history = ThumbnailHistory(self._get_history_size(), THUMBNAIL_HISTORY_MAX_BYTES)
+        # Bulk refresh jobs started from the API: job_id -> progress
+        self._refresh_jobs: Dict[str, Dict[str, Any]] = {}
+        self._refresh_job_tasks: Dict[str, asyncio.Task] = {}
+        # Last image per camera and recent event images survive restarts on disk
+        self._disk_cache = ThumbnailDiskCache(hass, entry.entry_id, THUMBNAIL_DISK_MAX_EVENT_THUMBNAILS)
         
         _LOGGER.debug("Initialized VideoloftCoordinator with thumbnail caching")
 
+    @property
+    def device_index(self) -> DeviceIndex:
+        """Return the integration-wide camera index."""
+        return self.hass.data[DOMAIN][self.entry.entry_id]["device_index"]
+
     async def async_setup(self) -> bool:
         """Set up the coordinator."""
         try:
@@ -73,6 +154,9 @@ class VideoloftCoordinator:
                 "descriptions": self._descriptions
             })
             
+            # Only the index is read here; persisted images load on first use
+            await self._disk_cache.async_load()
+
             # Start the thumbnail cache refresh task
             if self._thumbnail_refresh_task is None:
                 self._thumbnail_refresh_task = self.hass.loop.create_task(self._async_refresh_thumbnail_cache())
@@ -105,7 +189,7 @@ class VideoloftCoordinator:
         """Save triggers to storage."""
         await self._store.async_save(triggers)
         self._triggers = triggers
-        self.hass.data[DOMAIN][self.entry.entry_id]["lpr_triggers"] = triggers
+        set_lpr_triggers(self.hass.data[DOMAIN][self.entry.entry_id], triggers)
 
     async def process_events(self, api_key: str, selected_cameras: List[str]) -> None:
         """Process events for selected cameras."""
@@ -196,44 +280,90 @@ class VideoloftCoordinator:
             return None
 
     async def refresh_thumbnail(self, uidd: str, force: bool = False) -> Optional[bytes]:
-        """Refresh thumbnail for a specific camera."""
+        """Refresh thumbnail for a specific camera.
+
+        Concurrent callers share a single upstream fetch per camera. Forced
+        refreshes within THUMBNAIL_FORCED_REFRESH_MIN_INTERVAL of the previous
+        one return the cached image instead of fetching again.
+        """
+        cache_entry = self._thumbnail_cache.peek(uidd)
+        cached_data = cache_entry.get("data") if cache_entry else None
+
+        # Check if we need to refresh
+        if not force:
+            cached_time = cache_entry.get("timestamp") if cache_entry else None
+            if cached_time and dt_util.utcnow() - cached_time < self._thumbnail_refresh_interval:
+                return cached_data
+
+        task = self._thumbnail_inflight.get(uidd)
+        if task is not None:
+            self._refresh_stats["coalesced"] += 1
+        else:
+            if force and cached_data:
+                last_forced = self._last_forced_refresh.get(uidd)
+                if last_forced and time.monotonic() - last_forced < THUMBNAIL_FORCED_REFRESH_MIN_INTERVAL:
+                    self._refresh_stats["rate_limited"] += 1
+                    return cached_data
+                self._last_forced_refresh[uidd] = time.monotonic()
+
+            task = self.hass.async_create_task(self._async_fetch_thumbnail(uidd))
+            self._thumbnail_inflight[uidd] = task
+            task.add_done_callback(lambda done: self._thumbnail_inflight.pop(uidd, None)
+                                   if self._thumbnail_inflight.get(uidd) is done else None)
+
+        # Shield the shared fetch so one cancelled waiter does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch_thumbnail(self, uidd: str) -> Optional[bytes]:
+        """Fetch a camera's thumbnail from its logger server into the cache."""
+        self._refresh_stats["fetches"] += 1
         try:
-            # Check if we need to refresh
-            if not force:
-                cache_entry = self._thumbnail_cache.get(uidd)
-                if cache_entry:
-                    cached_time = cache_entry.get("timestamp")
-                    if cached_time:
-                        cache_age = dt_util.utcnow() - cached_time
-                        if cache_age < self._thumbnail_refresh_interval:
-                            return cache_entry.get("data")
-            
             # Get device data to find logger server
-            devices = self.hass.data[DOMAIN][self.entry.entry_id].get("devices", [])
-            device_data = None
-            for device in devices:
-                if f"{device['uid']}.{device['id']}" == uidd:
-                    device_data = device
-                    break
-                    
-            if not device_data:
+            if uidd not in self.device_index:
                 _LOGGER.warning(f"Device data not found for {uidd}")
                 return None
                 
-            logger_server = device_data.get("logger")
+            logger_server = self.device_index.get_logger(uidd)
             if not logger_server:
                 _LOGGER.warning(f"No logger server for {uidd}")
                 return None
-            
+
+            # The camera only produces a new image when lastthumb advances; if it
+            # has not, keep the cached image (and its resized variants) and skip the download
+            last_thumb_time = await self.api.get_last_thumb_time(uidd, logger_server)
+            cache_entry = self._thumbnail_cache.peek(uidd)
+            if (cache_entry and last_thumb_time
+                    and cache_entry.get("lastthumb") == last_thumb_time
+                    and isinstance(cache_entry.get("data"), bytes)):
+                cache_entry["timestamp"] = dt_util.utcnow()
+                self._thumbnail_cache.set(uidd, cache_entry)
+                self._record_lastthumb_change(uidd, False)
+                _LOGGER.debug(f"Thumbnail unchanged for {uidd} (lastthumb {last_thumb_time})")
+                return cache_entry["data"]
+
             # Fetch new thumbnail
-            thumbnail_data = await self.api.get_camera_thumbnail(uidd, logger_server)
+            thumbnail_data = await self.api.get_camera_thumbnail(uidd, logger_server, last_thumb_time)
             if thumbnail_data and isinstance(thumbnail_data, bytes):
-                # Cache the thumbnail
-                self._thumbnail_cache[uidd] = {
+                # Cache the thumbnail; replacing the entry drops variants of the old image
+                timestamp = dt_util.utcnow()
+                motion = await self._async_update_motion(uidd, thumbnail_data, timestamp)
+                # A new lastthumb with a visually identical image does not count as a change
+                self._record_lastthumb_change(uidd, motion["changed"])
+                self._thumbnail_history.resize(self._get_history_size())
+                if motion["changed"]:
+                    self._thumbnail_history.add(uidd, timestamp, thumbnail_data)
+                self._thumbnail_cache.set(uidd, {
                     "data": thumbnail_data,
-                    "timestamp": dt_util.utcnow(),
-                    "size": len(thumbnail_data)
-                }
+                    "digest": content_digest(thumbnail_data),
+                    "timestamp": timestamp,
+                    "size": len(thumbnail_data),
+                    "lastthumb": last_thumb_time,
+                    "variants": {},
+                })
+                self.hass.async_create_task(self._disk_cache.async_write(
+                    KIND_LIVE, uidd, thumbnail_data,
+                    timestamp=timestamp.isoformat(), lastthumb=last_thumb_time,
+                ))
                 _LOGGER.debug(f"Thumbnail refreshed for {uidd} ({len(thumbnail_data)} bytes)")
                 return thumbnail_data
             elif thumbnail_data is not None:
@@ -251,12 +381,9 @@ class VideoloftCoordinator:
         """Preload thumbnails for all cameras to improve frontend loading."""
         try:
             _LOGGER.debug("Starting thumbnail preload for all cameras")
-            devices = self.hass.data[DOMAIN][self.entry.entry_id].get("devices", [])
-            
             # Create tasks for parallel thumbnail loading
             tasks = []
-            for device in devices:
-                uidd = f"{device['uid']}.{device['id']}"
+            for uidd in self.device_index.uidds:
                 task = self.refresh_thumbnail(uidd, force=False)
                 tasks.append(task)
             
@@ -271,12 +398,20 @@ class VideoloftCoordinator:
 
     async def ensure_thumbnail_available(self, uidd: str) -> Optional[bytes]:
         """Ensure a thumbnail is available, using cache or fetching fresh."""
+        self.record_thumbnail_view(uidd)
         try:
-            # First try immediate cache (allows slightly stale)
+            # First try immediate cache (allows slightly stale), revalidating in the background
             thumbnail_data = await self.get_cached_thumbnail_immediate(uidd)
             if thumbnail_data and isinstance(thumbnail_data, bytes):
+                self.schedule_refresh_if_stale(uidd)
                 return thumbnail_data
             
+            # After a restart, show the last persisted image while a fresh one downloads
+            persisted_data = await self._async_load_persisted_thumbnail(uidd)
+            if persisted_data:
+                self.schedule_refresh_if_stale(uidd)
+                return persisted_data
+
             # If no cache, fetch fresh
             fresh_data = await self.refresh_thumbnail(uidd, force=True)
             if fresh_data and isinstance(fresh_data, bytes):
@@ -288,23 +423,540 @@ class VideoloftCoordinator:
             _LOGGER.error(f"Error ensuring thumbnail available for {uidd}: {e}")
             return None
 
+    async def _async_load_persisted_thumbnail(self, uidd: str) -> Optional[bytes]:
+        """Load a camera's thumbnail from disk into the memory cache.
+
+        The entry keeps its original timestamp, so it is refreshed as soon as
+        it is served; its lastthumb lets that refresh skip an unchanged image.
+        """
+        cache_entry = self._thumbnail_cache.peek(uidd)
+        if cache_entry and cache_entry.get("source") == "disk":
+            return cache_entry["data"]
+
+        metadata = self._disk_cache.get_metadata(KIND_LIVE, uidd)
+        if not metadata:
+            return None
+        data = await self._disk_cache.async_read(KIND_LIVE, uidd)
+        if not data:
+            return None
+
+        # A fresh download may have landed while reading from disk
+        if self._thumbnail_cache.peek(uidd):
+            return self._thumbnail_cache.peek(uidd)["data"]
+
+        timestamp = dt_util.parse_datetime(metadata.get("timestamp") or "") or dt_util.utc_from_timestamp(
+            metadata["stored"]
+        )
+        self._thumbnail_cache.set(uidd, {
+            "data": data,
+            "digest": content_digest(data),
+            "timestamp": timestamp,
+            "size": len(data),
+            "lastthumb": metadata.get("lastthumb"),
+            "variants": {},
+            "source": "disk",
+        })
+        _LOGGER.debug(f"Restored thumbnail for {uidd} from disk ({len(data)} bytes)")
+        return data
+
+    async def async_get_image_variant(
+        self,
+        data: bytes,
+        variants: Optional[Dict[Any, bytes]],
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        image_format: str = IMAGE_FORMAT_JPEG,
+        quality: Optional[int] = None,
+    ) -> Tuple[bytes, str]:
+        """Return an encoded variant of an image and its content type.
+
+        Encoding runs in the executor once per (size, format, quality); results
+        are stored in ``variants``, which callers keep next to the original.
+        At most THUMBNAIL_MAX_VARIANTS are kept, least recently used first out.
+        """
+        size = snap_thumbnail_size(width, height, THUMBNAIL_SIZE_BUCKETS) or (None, None)
+        quality = snap_quality(quality, THUMBNAIL_QUALITY_LEVELS)
+        if image_format not in IMAGE_CONTENT_TYPES:
+            image_format = IMAGE_FORMAT_JPEG
+        if size == (None, None) and image_format == IMAGE_FORMAT_JPEG and quality is None:
+            return data, IMAGE_CONTENT_TYPES[IMAGE_FORMAT_JPEG]
+        if quality is None:
+            quality = THUMBNAIL_WEBP_QUALITY if image_format == IMAGE_FORMAT_WEBP else THUMBNAIL_VARIANT_QUALITY
+
+        key = (size, image_format, quality)
+        if variants is not None and key in variants:
+            variants[key] = variants.pop(key)  # Mark most recently used
+            return variants[key], IMAGE_CONTENT_TYPES[image_format]
+
+        try:
+            variant = await self.hass.async_add_executor_job(
+                encode_variant, data, size[0], size[1], image_format, quality
+            )
+        except Exception as e:
+            _LOGGER.warning(f"Unable to encode {image_format} thumbnail variant: {e}")
+            return data, IMAGE_CONTENT_TYPES[IMAGE_FORMAT_JPEG]
+
+        if variants is not None:
+            while len(variants) >= THUMBNAIL_MAX_VARIANTS:
+                del variants[next(iter(variants))]
+            variants[key] = variant
+        _LOGGER.debug(f"Encoded {image_format} variant {key} ({len(data)} -> {len(variant)} bytes)")
+        return variant, IMAGE_CONTENT_TYPES[image_format]
+
+    async def async_get_thumbnail_variant(
+        self,
+        uidd: str,
+        data: bytes,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        image_format: str = IMAGE_FORMAT_JPEG,
+        quality: Optional[int] = None,
+    ) -> Tuple[bytes, str]:
+        """Return a resized and/or re-encoded variant of a camera thumbnail.
+
+        Variants are cached on the thumbnail's cache entry, so they live exactly
+        as long as the source image (uidd, lastthumb).
+        """
+        # Only cache when encoding the image currently held for this camera
+        cache_entry = self._thumbnail_cache.peek(uidd)
+        variants = None
+        if cache_entry and cache_entry.get("data") is data:
+            variants = cache_entry.setdefault("variants", {})
+        result = await self.async_get_image_variant(data, variants, width, height, image_format, quality)
+        if variants is not None:
+            self._thumbnail_cache.update_size(uidd)
+        return result
+
+    def get_thumbnail_digest(self, uidd: str, data: bytes) -> str:
+        """Return the content hash of a thumbnail, precomputed when it was cached."""
+        cache_entry = self._thumbnail_cache.peek(uidd)
+        if cache_entry and cache_entry.get("data") is data and cache_entry.get("digest"):
+            return cache_entry["digest"]
+        return content_digest(data)
+
+    def get_variant_etag(
+        self,
+        digest: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        image_format: str = IMAGE_FORMAT_JPEG,
+        quality: Optional[int] = None,
+    ) -> str:
+        """Return the ETag of the variant ``async_get_image_variant`` would produce."""
+        size = snap_thumbnail_size(width, height, THUMBNAIL_SIZE_BUCKETS)
+        if image_format not in IMAGE_CONTENT_TYPES:
+            image_format = IMAGE_FORMAT_JPEG
+        return variant_tag(digest, size, image_format, snap_quality(quality, THUMBNAIL_QUALITY_LEVELS))
+
+    def get_thumbnail_manifest(self, uidds: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the current content hash of each cached thumbnail."""
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for uidd in uidds:
+            cache_entry = self._thumbnail_cache.peek(uidd)
+            if not cache_entry or not cache_entry.get("digest"):
+                continue
+            cached_time = cache_entry.get("timestamp")
+            manifest[uidd] = {
+                "hash": cache_entry["digest"],
+                "url": f"/api/videoloft/thumbnail/{uidd}/{cache_entry['digest']}",
+                "lastthumb": cache_entry.get("lastthumb"),
+                "timestamp": cached_time.isoformat() if cached_time else None,
+            }
+        return manifest
+
+    def schedule_refresh_if_stale(self, uidd: str) -> None:
+        """Revalidate a stale thumbnail in the background while it keeps being served.
+
+        Does nothing if the image is fresh or a fetch is already in flight.
+        """
+        if uidd in self._thumbnail_inflight:
+            return
+        cache_entry = self._thumbnail_cache.peek(uidd)
+        cached_time = cache_entry.get("timestamp") if cache_entry else None
+        if cached_time and dt_util.utcnow() - cached_time > self._thumbnail_refresh_interval:
+            self.hass.async_create_task(self.refresh_thumbnail(uidd, force=True))
+
+    async def async_get_thumbnails(self, uidds: List[str]) -> Dict[str, bytes]:
+        """Get thumbnails for several cameras at once, fetching missing ones concurrently."""
+
+        async def _get(uidd: str) -> Optional[bytes]:
+            async with self._batch_fetch_semaphore:
+                return await self.ensure_thumbnail_available(uidd)
+
+        results = await asyncio.gather(*(_get(uidd) for uidd in uidds), return_exceptions=True)
+        thumbnails: Dict[str, bytes] = {}
+        for uidd, result in zip(uidds, results):
+            if isinstance(result, bytes):
+                thumbnails[uidd] = result
+        return thumbnails
+
+    def get_thumbnail_versions(self, uidds: List[str]) -> tuple:
+        """Return a hashable key identifying the cached version of each thumbnail."""
+        versions = []
+        for uidd in uidds:
+            cache_entry = self._thumbnail_cache.peek(uidd) or {}
+            versions.append((uidd, cache_entry.get("lastthumb") or cache_entry.get("timestamp")))
+        return tuple(versions)
+
+    async def async_get_thumbnail_sprite(self, uidds: List[str]) -> Optional[Dict[str, Any]]:
+        """Get a composited sprite of several thumbnails plus its offset map.
+
+        The sprite is cached until any member thumbnail changes.
+        """
+        thumbnails = await self.async_get_thumbnails(uidds)
+        if not thumbnails:
+            return None
+
+        members = [uidd for uidd in uidds if uidd in thumbnails]
+        version = self.get_thumbnail_versions(members)
+        if self._sprite_cache and self._sprite_cache["version"] == version:
+            return self._sprite_cache
+
+        sprite, offsets = await self.hass.async_add_executor_job(
+            compose_sprite,
+            [(uidd, thumbnails[uidd]) for uidd in members],
+            THUMBNAIL_SPRITE_TILE_WIDTH,
+            THUMBNAIL_SPRITE_TILE_HEIGHT,
+            THUMBNAIL_SPRITE_COLUMNS,
+        )
+        self._sprite_cache = {
+            "version": version,
+            "data": sprite,
+            "offsets": offsets,
+            "timestamp": dt_util.utcnow(),
+        }
+        _LOGGER.debug(f"Composited thumbnail sprite for {len(offsets)} cameras ({len(sprite)} bytes)")
+        return self._sprite_cache
+
+    async def async_get_event_thumbnail(
+        self, event_id: str, event_info: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the cached thumbnail entry for an event, downloading it on a miss.
+
+        ``event_info`` (the event's stored description) saves a storage load
+        when the caller already has it. Concurrent misses share one download.
+        """
+        cache_entry = self._event_thumbnail_cache.get(event_id)
+        if cache_entry:
+            return cache_entry
+
+        task = self._event_thumbnail_inflight.get(event_id)
+        if task is None:
+            task = self.hass.async_create_task(self._async_load_event_thumbnail(event_id, event_info))
+            self._event_thumbnail_inflight[event_id] = task
+            task.add_done_callback(lambda _: self._event_thumbnail_inflight.pop(event_id, None))
+        return await asyncio.shield(task)
+
+    async def _async_load_event_thumbnail(
+        self, event_id: str, event_info: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Load an event thumbnail from disk or the logger server into the cache."""
+        image_data = await self._disk_cache.async_read(KIND_EVENT, event_id)
+        if image_data:
+            cache_entry = {"data": image_data, "digest": content_digest(image_data), "variants": {}}
+            self._event_thumbnail_cache.set(event_id, cache_entry)
+            return cache_entry
+
+        if event_info is None:
+            descriptions = await self.async_load_descriptions()
+            event_info = descriptions.get(event_id)
+        if not event_info:
+            _LOGGER.warning(f"No event info found for event {event_id}")
+            return None
+
+        logger_server = event_info.get("logger_server")
+        uidd = event_info.get("uidd")
+        if not logger_server or not uidd:
+            _LOGGER.error(f"Missing required event info for {event_id}")
+            return None
+
+        image_data = await self.api.download_event_thumbnail(logger_server, uidd, event_id)
+        if not image_data:
+            _LOGGER.warning(f"No thumbnail available for event {event_id}")
+            return None
+
+        # Event thumbnails never change, so the entry only leaves through eviction
+        cache_entry = {"data": image_data, "digest": content_digest(image_data), "variants": {}}
+        self._event_thumbnail_cache.set(event_id, cache_entry)
+        self.hass.async_create_task(
+            self._disk_cache.async_write(KIND_EVENT, event_id, image_data, uidd=uidd)
+        )
+        return cache_entry
+
+    async def async_prefetch_event_thumbnails(self, events: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Warm the event thumbnail cache for ``(event_id, event_info)`` pairs.
+
+        Downloads run with bounded parallelism; returns how many are cached.
+        """
+        semaphore = asyncio.Semaphore(AI_SEARCH_PREFETCH_CONCURRENCY)
+
+        async def _prefetch(event_id: str, event_info: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    return bool(await self.async_get_event_thumbnail(event_id, event_info))
+                except Exception as e:
+                    _LOGGER.debug(f"Prefetch of event thumbnail {event_id} failed: {e}")
+                    return False
+
+        results = await asyncio.gather(*(_prefetch(event_id, info) for event_id, info in events))
+        _LOGGER.debug(f"Prefetched {sum(results)}/{len(events)} event thumbnails")
+        return sum(results)
+
+    async def async_get_event_thumbnail_variant(
+        self,
+        event_id: str,
+        cache_entry: Dict[str, Any],
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        image_format: str = IMAGE_FORMAT_JPEG,
+        quality: Optional[int] = None,
+    ) -> Tuple[bytes, str]:
+        """Return an encoded variant of an event thumbnail, cached on its entry."""
+        result = await self.async_get_image_variant(
+            cache_entry["data"], cache_entry["variants"], width, height, image_format, quality
+        )
+        self._event_thumbnail_cache.update_size(event_id)
+        return result
+
+    # ----------------------------------------------------------
+    # DEMAND-AWARE REFRESH SCHEDULING
+    # ----------------------------------------------------------
+
+    def record_thumbnail_view(self, uidd: str) -> None:
+        """Note that a client looked at a camera's thumbnail."""
+        self._last_viewed[uidd] = time.monotonic()
+
+    def is_recently_viewed(self, uidd: str, within: float) -> bool:
+        """Return True if a client looked at the camera in the last ``within`` seconds."""
+        last_viewed = self._last_viewed.get(uidd)
+        return last_viewed is not None and time.monotonic() - last_viewed <= within
+
+    def _record_lastthumb_change(self, uidd: str, changed: bool) -> None:
+        history = self._lastthumb_changes.get(uidd)
+        if history is None:
+            history = self._lastthumb_changes[uidd] = deque(maxlen=THUMBNAIL_CHANGE_HISTORY)
+        history.append(changed)
+
+    def _get_change_rate(self, uidd: str) -> float:
+        """Fraction of recent refreshes that found a visibly changed image (0.5 when unknown)."""
+        history = self._lastthumb_changes.get(uidd)
+        return sum(history) / len(history) if history else 0.5
+
+    def _get_idle_timeout(self) -> Optional[float]:
+        """Seconds without views after which a camera is no longer refreshed."""
+        minutes = self.entry.options.get(CONF_THUMBNAIL_IDLE_MINUTES, DEFAULT_THUMBNAIL_IDLE_MINUTES)
+        return minutes * 60 if minutes else None
+
+    def _get_refresh_queue(self, uidds: List[str]) -> List[str]:
+        """Return the cameras due for a refresh, most wanted first.
+
+        Cameras viewed recently come first, then those whose image changes
+        most often. Cameras not viewed within the idle timeout are skipped;
+        cameras never viewed are refreshed once so their tile is not blank.
+        """
+        now = time.monotonic()
+        idle_timeout = self._get_idle_timeout()
+        queue = []
+        for uidd in uidds:
+            cache_entry = self._thumbnail_cache.peek(uidd)
+            cached_time = cache_entry.get("timestamp") if cache_entry else None
+            if cached_time and dt_util.utcnow() - cached_time < self._thumbnail_refresh_interval:
+                continue
+
+            last_viewed = self._last_viewed.get(uidd)
+            idle = now - last_viewed if last_viewed is not None else None
+            if idle_timeout and cache_entry and (idle is None or idle > idle_timeout):
+                self._scheduler_stats["skipped_idle"] += 1
+                continue
+
+            # Recency dominates: a view in the last minute outranks any change rate
+            recency = 1.0 / (1.0 + (idle if idle is not None else idle_timeout or 3600) / 60)
+            queue.append((recency * 2 + self._get_change_rate(uidd), uidd))
+
+        queue.sort(reverse=True)
+        return [uidd for _, uidd in queue]
+
+    # ----------------------------------------------------------
+    # BULK REFRESH JOBS
+    # ----------------------------------------------------------
+
+    def async_start_bulk_refresh(self, uidds: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Start a background forced refresh of several cameras and return its job.
+
+        An empty list means every camera. If a running job already covers the
+        requested cameras, that job is returned instead of starting another.
+        """
+        uidds = list(dict.fromkeys(uidds or self.device_index.uidds))
+        for job in self._refresh_jobs.values():
+            if job["status"] == "running" and set(uidds) <= set(job["uidds"]):
+                job["coalesced"] += 1
+                return job
+
+        job_id = str(uuid.uuid4())
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "uidds": uidds,
+            "total": len(uidds),
+            "processed": 0,
+            "refreshed": 0,
+            "failed": [],
+            "coalesced": 0,
+            "start_time": dt_util.utcnow().isoformat(),
+            "end_time": None,
+        }
+        self._refresh_jobs[job_id] = job
+        self._prune_refresh_jobs()
+        self._refresh_job_tasks[job_id] = self.hass.async_create_task(self._async_run_bulk_refresh(job))
+        return job
+
+    async def _async_run_bulk_refresh(self, job: Dict[str, Any]) -> None:
+        semaphore = asyncio.Semaphore(THUMBNAIL_REFRESH_CONCURRENCY)
+
+        async def _refresh(uidd: str) -> None:
+            async with semaphore:
+                try:
+                    result = await self.refresh_thumbnail(uidd, force=True)
+                except Exception as e:
+                    _LOGGER.debug(f"Bulk refresh of {uidd} failed: {e}")
+                    result = None
+                job["processed"] += 1
+                if result:
+                    job["refreshed"] += 1
+                else:
+                    job["failed"].append(uidd)
+
+        try:
+            await asyncio.gather(*(_refresh(uidd) for uidd in job["uidds"]))
+            job["status"] = "completed"
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+            raise
+        finally:
+            job["end_time"] = dt_util.utcnow().isoformat()
+            self._refresh_job_tasks.pop(job["job_id"], None)
+            _LOGGER.debug(f"Bulk thumbnail refresh {job['job_id']} {job['status']}: "
+                          f"{job['refreshed']}/{job['total']} refreshed")
+
+    def _prune_refresh_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._refresh_jobs.items() if job["status"] != "running"]
+        for job_id in finished[:max(0, len(finished) - THUMBNAIL_REFRESH_JOB_HISTORY)]:
+            self._refresh_jobs.pop(job_id, None)
+
+    def get_refresh_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the progress of a bulk refresh job."""
+        return self._refresh_jobs.get(job_id)
+
+    # ----------------------------------------------------------
+    # MOTION SCORING
+    # ----------------------------------------------------------
+
+    async def _async_update_motion(self, uidd: str, data: bytes, timestamp: datetime) -> Dict[str, Any]:
+        """Score how much a new thumbnail differs from the previous one."""
+        previous = self._motion.get(uidd, {})
+        signature, score = None, None
+        try:
+            if self._motion_available:
+                signature, score = await self.hass.async_add_executor_job(
+                    compute_motion, data, previous.get("signature"), MOTION_SIGNATURE_SIZE, MOTION_PIXEL_THRESHOLD
+                )
+        except ImportError:
+            _LOGGER.warning("numpy is not available; thumbnail motion scoring is disabled")
+            self._motion_available = False
+        except Exception as e:
+            _LOGGER.debug(f"Unable to score motion for {uidd}: {e}")
+
+        motion = {
+            "signature": signature,
+            "score": score,
+            # Without a score to compare, assume the image changed
+            "changed": score is None or score >= MOTION_CHANGE_THRESHOLD,
+            "timestamp": timestamp,
+        }
+        self._motion[uidd] = motion
+        for listener in list(self._motion_listeners.get(uidd, ())):
+            listener()
+        return motion
+
+    def get_motion(self, uidd: str) -> Dict[str, Any]:
+        """Return the latest change score of a camera's thumbnail."""
+        motion = self._motion.get(uidd)
+        if not motion:
+            return {"motion_score": None, "scene_changed": None, "motion_updated": None}
+        return {
+            "motion_score": motion["score"],
+            "scene_changed": motion["changed"],
+            "motion_updated": motion["timestamp"].isoformat(),
+        }
+
+    def async_add_motion_listener(self, uidd: str, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` whenever a camera's motion score updates; returns a remover."""
+        self._motion_listeners.setdefault(uidd, []).append(listener)
+
+        def _remove() -> None:
+            listeners = self._motion_listeners.get(uidd, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return _remove
+
+    # ----------------------------------------------------------
+    # THUMBNAIL HISTORY
+    # ----------------------------------------------------------
+
+    def _get_history_size(self) -> int:
+        return self.entry.options.get(CONF_THUMBNAIL_HISTORY_SIZE, DEFAULT_THUMBNAIL_HISTORY_SIZE)
+
+    @property
+    def thumbnail_history_enabled(self) -> bool:
+        """Return True if thumbnail history is recorded."""
+        return self._get_history_size() > 0
+
+    def get_thumbnail_history(self, uidd: str, since: Optional[datetime] = None) -> List[Tuple[datetime, bytes]]:
+        """Return a camera's recorded thumbnails, oldest first."""
+        return self._thumbnail_history.get_frames(uidd, since)
+
+    async def async_get_history_strip(
+        self, frames: List[Tuple[datetime, bytes]]
+    ) -> Tuple[bytes, Dict[str, Dict[str, int]]]:
+        """Composite history frames into one JPEG strip keyed by ISO timestamp."""
+        return await self.hass.async_add_executor_job(
+            compose_sprite,
+            [(timestamp.isoformat(), data) for timestamp, data in frames],
+            THUMBNAIL_SPRITE_TILE_WIDTH,
+            THUMBNAIL_SPRITE_TILE_HEIGHT,
+            THUMBNAIL_SPRITE_COLUMNS,
+        )
+
+    async def async_get_history_gif(self, frames: List[Tuple[datetime, bytes]]) -> bytes:
+        """Encode history frames into an animated GIF time-lapse."""
+        return await self.hass.async_add_executor_job(
+            compose_timelapse_gif,
+            [data for _, data in frames],
+            THUMBNAIL_TIMELAPSE_WIDTH,
+            THUMBNAIL_TIMELAPSE_FRAME_MS,
+        )
+
     async def _async_refresh_thumbnail_cache(self) -> None:
-        """Background task to periodically refresh thumbnails."""
+        """Background task to refresh due thumbnails in demand order."""
         _LOGGER.debug("Starting thumbnail cache refresh task")
-        
+        semaphore = asyncio.Semaphore(THUMBNAIL_REFRESH_CONCURRENCY)
+
+        async def _refresh(uidd: str) -> None:
+            async with semaphore:
+                await self.refresh_thumbnail(uidd)
+
         while True:
             try:
-                # Get all devices
-                devices = self.hass.data[DOMAIN][self.entry.entry_id].get("devices", [])
-                
-                for device in devices:
-                    uidd = f"{device['uid']}.{device['id']}"
-                    await self.refresh_thumbnail(uidd)
-                    # Small delay between cameras to avoid overwhelming the servers
-                    await asyncio.sleep(1)
-                
-                # Wait for the next refresh cycle
-                await asyncio.sleep(self._thumbnail_refresh_interval.total_seconds())
+                queue = self._get_refresh_queue(self.device_index.uidds)
+
+                # The semaphore admits cameras in queue order, so the most wanted go first
+                if queue:
+                    await asyncio.gather(*(_refresh(uidd) for uidd in queue), return_exceptions=True)
+                    self._scheduler_stats["refreshed"] += len(queue)
+                self._scheduler_stats["passes"] += 1
+
+                await asyncio.sleep(THUMBNAIL_SCHEDULER_TICK)
                 
             except asyncio.CancelledError:
                 _LOGGER.debug("Thumbnail refresh task cancelled")
@@ -318,12 +970,33 @@ class VideoloftCoordinator:
         """Get thumbnail cache statistics."""
         total_size = sum(entry.get("size", 0) for entry in self._thumbnail_cache.values())
         cache_count = len(self._thumbnail_cache)
+        variants = [
+            variant
+            for entry in self._thumbnail_cache.values()
+            for variant in entry.get("variants", {}).values()
+        ]
         
         return {
             "cached_thumbnails": cache_count,
             "total_cache_size": total_size,
+            "cached_variants": len(variants),
+            "variant_cache_size": sum(len(variant) for variant in variants),
             "cache_duration_minutes": self._thumbnail_cache_duration.total_seconds() / 60,
-            "refresh_interval_minutes": self._thumbnail_refresh_interval.total_seconds() / 60
+            "refresh_interval_minutes": self._thumbnail_refresh_interval.total_seconds() / 60,
+            "live_cache": self._thumbnail_cache.get_stats(),
+            "event_cache": self._event_thumbnail_cache.get_stats(),
+            "disk_cache": self._disk_cache.get_stats(),
+            "history": self._thumbnail_history.get_stats(),
+            "refreshes": {**self._refresh_stats, "in_flight": len(self._thumbnail_inflight)},
+            "scheduler": {
+                **self._scheduler_stats,
+                "concurrency": THUMBNAIL_REFRESH_CONCURRENCY,
+                "idle_timeout_minutes": (self._get_idle_timeout() or 0) / 60,
+                "recently_viewed": sum(
+                    1 for viewed in self._last_viewed.values()
+                    if time.monotonic() - viewed <= (self._get_idle_timeout() or float("inf"))
+                ),
+            },
         }
 
     async def async_cleanup(self):
@@ -335,11 +1008,29 @@ class VideoloftCoordinator:
             if self._thumbnail_refresh_task is not None:
                 self._thumbnail_refresh_task.cancel()
                 self._thumbnail_refresh_task = None
+            for task in (list(self._thumbnail_inflight.values())
+                         + list(self._event_thumbnail_inflight.values())
+                         + list(self._refresh_job_tasks.values())):
+                task.cancel()
+            self._thumbnail_inflight.clear()
+            self._event_thumbnail_inflight.clear()
+            self._refresh_job_tasks.clear()
             
+            # Persist the disk index now rather than waiting for the delayed save
+            try:
+                await self._disk_cache.async_flush()
+            except Exception as e:
+                _LOGGER.warning("Error saving thumbnail disk index: %s", e)
+
             # Clear caches and reset state
             self._triggers = []
             self._descriptions = {}
-            self._thumbnail_cache = {}
+            self._thumbnail_cache.clear()
+            self._event_thumbnail_cache.clear()
+            self._thumbnail_history.clear()
+            self._motion.clear()
+            self._motion_listeners.clear()
+            self._sprite_cache = None
             
             # Clear any stored references
             if hasattr(self, 'api') and self.api:
@@ -0,0 +1,79 @@
+"""Integration-wide index of Videoloft cameras keyed by UIDD."""
+
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+def make_uidd(device_data: Dict[str, Any]) -> str:
+    """Build a camera's UIDD (``uid.id``) from its device data."""
+    return f"{device_data['uid']}.{device_data['id']}"
+
+
+class _Snapshot(NamedTuple):
+    devices: List[Dict[str, Any]]
+    by_uidd: Dict[str, Dict[str, Any]]
+    names: Dict[str, str]
+    loggers: Dict[str, Optional[str]]
+
+
+class DeviceIndex:
+    """O(1) lookup of camera data, display names and logger servers by UIDD.
+
+    The index is rebuilt off to the side and swapped in with a single
+    assignment, so readers always see either the old or the new camera list,
+    never a mix of both.
+    """
+
+    def __init__(self, devices: Iterable[Dict[str, Any]] = ()) -> None:
+        """Initialize the index."""
+        self.version = 0
+        self._snapshot = self._build(devices)
+
+    @staticmethod
+    def _build(devices: Iterable[Dict[str, Any]]) -> _Snapshot:
+        devices = list(devices)
+        by_uidd: Dict[str, Dict[str, Any]] = {}
+        names: Dict[str, str] = {}
+        loggers: Dict[str, Optional[str]] = {}
+        for device_data in devices:
+            uidd = make_uidd(device_data)
+            by_uidd[uidd] = device_data
+            names[uidd] = device_data.get("name", device_data.get("phonename", f"Camera {uidd}"))
+            loggers[uidd] = device_data.get("logger")
+        return _Snapshot(devices, by_uidd, names, loggers)
+
+    def replace(self, devices: Iterable[Dict[str, Any]]) -> None:
+        """Atomically replace the indexed cameras."""
+        self._snapshot = self._build(devices)
+        self.version += 1
+
+    @property
+    def devices(self) -> List[Dict[str, Any]]:
+        """Return the camera list in API order."""
+        return self._snapshot.devices
+
+    @property
+    def uidds(self) -> List[str]:
+        """Return every indexed UIDD in API order."""
+        return list(self._snapshot.by_uidd)
+
+    def get(self, uidd: str) -> Optional[Dict[str, Any]]:
+        """Return a camera's device data."""
+        return self._snapshot.by_uidd.get(uidd)
+
+    def get_name(self, uidd: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a camera's display name."""
+        return self._snapshot.names.get(uidd, default)
+
+    def get_logger(self, uidd: str) -> Optional[str]:
+        """Return the logger server a camera records to."""
+        return self._snapshot.loggers.get(uidd)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over ``(uidd, device_data)`` pairs."""
+        return iter(self._snapshot.by_uidd.items())
+
+    def __contains__(self, uidd: object) -> bool:
+        return uidd in self._snapshot.by_uidd
+
+    def __len__(self) -> int:
+        return len(self._snapshot.by_uidd)
@@ -0,0 +1,194 @@
+"""Disk-backed thumbnail persistence for warm restarts."""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from ..const import DOMAIN, STORAGE_VERSION, THUMBNAIL_DISK_INDEX_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_LIVE = "live"
+KIND_EVENT = "event"
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write a file atomically so a crash never leaves a truncated image.
+
+    Each write uses its own temporary file, so concurrent writes of the same
+    key cannot interleave; the last one to be renamed wins.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as handle:
+        tmp_path = handle.name
+        try:
+            handle.write(data)
+        except BaseException:
+            handle.close()
+            _remove_file(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove_file(tmp_path)
+        raise
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    """Read a file, returning None if it has gone missing."""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return None
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ThumbnailDiskCache:
+    """Persist the last thumbnail per camera and recent event thumbnails.
+
+    Images are written as individual files under ``<config>/videoloft/thumbnails``,
+    outside ``.storage``, while their metadata lives in a Home Assistant
+    storage index. Only the index is read
+    at startup; image files are read on demand the first time a key misses
+    the memory cache. All file I/O runs in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, max_event_thumbnails: int) -> None:
+        """Initialize the disk cache."""
+        self.hass = hass
+        self.max_event_thumbnails = max_event_thumbnails
+        self.directory = hass.config.path(DOMAIN, "thumbnails", entry_id)
+        # Images used to be written under .storage, which is reserved for Store JSON
+        self._legacy_directory = hass.config.path(".storage", f"{DOMAIN}_thumbnails", entry_id)
+        self._store = storage.Store(hass, STORAGE_VERSION, f"{DOMAIN}_thumbnail_index_{entry_id}")
+        # "<kind>:<key>" -> {"kind", "key", "file", "size", "stored", ...metadata}
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._reads = 0
+        self._writes = 0
+
+    def _file_path(self, kind: str, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, kind, f"{digest}.jpg")
+
+    async def async_load(self) -> None:
+        """Load the metadata index; image files stay on disk until needed."""
+        if self._loaded:
+            return
+        try:
+            self._index = await self._store.async_load() or {}
+        except Exception as e:
+            _LOGGER.warning(f"Unable to load thumbnail disk index, starting empty: {e}")
+            self._index = {}
+        self._loaded = True
+
+        # Drop entries from the old .storage location along with their files
+        legacy = {
+            index_key for index_key, metadata in self._index.items()
+            if not metadata.get("file", "").startswith(self.directory + os.sep)
+        }
+        if legacy:
+            for index_key in legacy:
+                self._index.pop(index_key)
+            self._schedule_index_save()
+        await self.hass.async_add_executor_job(shutil.rmtree, self._legacy_directory, True)
+        _LOGGER.debug(f"Loaded thumbnail disk index with {len(self._index)} entries")
+
+    def _schedule_index_save(self) -> None:
+        self._store.async_delay_save(lambda: self._index, THUMBNAIL_DISK_INDEX_SAVE_DELAY)
+
+    def get_metadata(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored metadata for a key, if persisted."""
+        return self._index.get(f"{kind}:{key}")
+
+    async def async_read(self, kind: str, key: str) -> Optional[bytes]:
+        """Read a persisted image, dropping the index entry if the file is gone."""
+        metadata = self.get_metadata(kind, key)
+        if not metadata:
+            return None
+        try:
+            data = await self.hass.async_add_executor_job(_read_file, metadata["file"])
+        except OSError as e:
+            _LOGGER.warning(f"Unable to read cached thumbnail for {key}: {e}")
+            data = None
+        if not data:
+            self._index.pop(f"{kind}:{key}", None)
+            self._schedule_index_save()
+            return None
+        self._reads += 1
+        return data
+
+    async def async_write(self, kind: str, key: str, data: bytes, **metadata: Any) -> None:
+        """Persist an image and its metadata, pruning old event thumbnails."""
+        path = self._file_path(kind, key)
+        try:
+            await self.hass.async_add_executor_job(_write_file, path, data)
+        except OSError as e:
+            _LOGGER.warning(f"Unable to persist thumbnail for {key}: {e}")
+            return
+        self._writes += 1
+        self._index[f"{kind}:{key}"] = {
+            "kind": kind,
+            "key": key,
+            "file": path,
+            "size": len(data),
+            "stored": time.time(),
+            **metadata,
+        }
+        if kind == KIND_EVENT:
+            await self._async_prune_events()
+        self._schedule_index_save()
+
+    async def async_remove(self, kind: str, key: str) -> None:
+        """Forget a persisted image."""
+        metadata = self._index.pop(f"{kind}:{key}", None)
+        if metadata:
+            await self.hass.async_add_executor_job(_remove_file, metadata["file"])
+            self._schedule_index_save()
+
+    async def _async_prune_events(self) -> None:
+        """Keep only the most recently stored event thumbnails."""
+        events = sorted(
+            (item for item in self._index.items() if item[1]["kind"] == KIND_EVENT),
+            key=lambda item: item[1]["stored"],
+        )
+        excess = len(events) - self.max_event_thumbnails
+        for index_key, metadata in events[:max(0, excess)]:
+            self._index.pop(index_key, None)
+            await self.hass.async_add_executor_job(_remove_file, metadata["file"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return disk cache statistics."""
+        return {
+            "live_entries": sum(1 for item in self._index.values() if item["kind"] == KIND_LIVE),
+            "event_entries": sum(1 for item in self._index.values() if item["kind"] == KIND_EVENT),
+            "bytes_on_disk": sum(item.get("size", 0) for item in self._index.values()),
+            "reads": self._reads,
+            "writes": self._writes,
+        }
+
+    async def async_flush(self) -> None:
+        """Write the index immediately."""
+        await self._store.async_save(self._index)
+
+    async def async_clear(self) -> None:
+        """Delete every persisted image and the index."""
+        self._index = {}
+        await self.hass.async_add_executor_job(shutil.rmtree, self.directory, True)
+        await self._store.async_remove()
@@ -0,0 +1,49 @@
+"""Base entity for per-camera entities fed by the status coordinator."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity, CoordinatorEntity
+
+from .status_coordinator import VideoloftStatusCoordinator
+
+
+class VideoloftDeviceEntity(CoordinatorEntity[VideoloftStatusCoordinator]):
+    """Entity reading one camera's data from the shared status coordinator.
+
+    Entities subscribe to their own camera rather than to the whole
+    coordinator, so a poll that changes one camera only writes state for
+    that camera's entities. Until the first poll covers the camera, the
+    device data captured at setup is used.
+    """
+
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.uidd = uidd
+        self._setup_device_data = device_data
+        self._attributes: Optional[Tuple[int, Dict[str, Any]]] = None
+
+    @property
+    def device_data(self) -> Dict[str, Any]:
+        """Return the camera's latest data."""
+        return self.coordinator.get_device_data(self.uidd) or self._setup_device_data
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the attributes, rebuilt only when the camera's data changes."""
+        version = self.coordinator.get_device_version(self.uidd)
+        if self._attributes is None or self._attributes[0] != version:
+            self._attributes = (version, self._build_attributes())
+        return self._attributes[1]
+
+    def _build_attributes(self) -> Dict[str, Any]:
+        """Return extra state attributes; subclasses extend the result."""
+        return {"device_id": self.uidd}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates for this camera only."""
+        # Skip the coordinator-wide listener BaseCoordinatorEntity would add
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(self.uidd, self._handle_coordinator_update)
+        )
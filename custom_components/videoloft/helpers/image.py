@@ -0,0 +1,251 @@
+"""Image processing helpers for Videoloft thumbnails.
+
+The decode/encode functions in this module are blocking and must be run in
+an executor, e.g. ``hass.async_add_executor_job``. Pillow and PyAV are
+imported lazily. Pillow ships with Home Assistant core; PyAV is only present
+when the stream component's requirements are installed, so keyframe
+extraction is optional. numpy is likewise optional: without it motion
+scoring is disabled and every new thumbnail is treated as changed.
+"""
+
+import hashlib
+import io
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+IMAGE_FORMAT_JPEG = "jpeg"
+IMAGE_FORMAT_WEBP = "webp"
+IMAGE_CONTENT_TYPES = {
+    IMAGE_FORMAT_JPEG: "image/jpeg",
+    IMAGE_FORMAT_WEBP: "image/webp",
+}
+
+
+def content_digest(data: bytes) -> str:
+    """Return a short content hash used for ETags and content-addressed URLs."""
+    return hashlib.blake2b(data, digest_size=12).hexdigest()
+
+
+def variant_tag(
+    digest: str,
+    size: Optional[Tuple[Optional[int], Optional[int]]],
+    image_format: str,
+    quality: Optional[int],
+) -> str:
+    """Return a strong ETag for an encoded variant of the image with ``digest``."""
+    width, height = size or (None, None)
+    return f'"{digest}-{image_format}-{width or ""}x{height or ""}-{quality or ""}"'
+
+
+# ----------------------------------------------------------
+# RESIZING
+# ----------------------------------------------------------
+
+
+def snap_thumbnail_size(
+    width: Optional[int], height: Optional[int], buckets: Sequence[int]
+) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """Round a requested bounding box up to the nearest size bucket.
+
+    Returns None when no resize was requested or the request is at least as
+    large as the biggest bucket.
+    """
+
+    def _snap(value: Optional[int]) -> Optional[int]:
+        if not value or value <= 0:
+            return None
+        return next((bucket for bucket in buckets if bucket >= value), None)
+
+    snapped = (_snap(width), _snap(height))
+    if snapped == (None, None):
+        return None
+    return snapped
+
+
+def snap_quality(quality: Optional[int], levels: Sequence[int]) -> Optional[int]:
+    """Round a requested encoder quality to the nearest fixed level."""
+    if quality is None:
+        return None
+    return min(levels, key=lambda level: (abs(level - quality), level))
+
+
+def encode_variant(
+    data: bytes,
+    width: Optional[int],
+    height: Optional[int],
+    image_format: str = IMAGE_FORMAT_JPEG,
+    quality: Optional[int] = None,
+) -> bytes:
+    """Downscale and/or re-encode a JPEG thumbnail.
+
+    The image is fitted within width x height preserving aspect ratio and is
+    never upscaled. A JPEG request without a resize or quality is returned
+    unchanged, as is a re-quantised JPEG that would come out larger.
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    box = (width or image.width, height or image.height)
+    needs_resize = image.width > box[0] or image.height > box[1]
+    if not needs_resize and image_format == IMAGE_FORMAT_JPEG and quality is None:
+        return data
+
+    if needs_resize:
+        # draft() lets libjpeg decode at a reduced scale, which is much cheaper than a full decode
+        image.draft("RGB", box)
+    image = image.convert("RGB")
+    if needs_resize:
+        image.thumbnail(box, Image.LANCZOS)
+
+    output = io.BytesIO()
+    if image_format == IMAGE_FORMAT_WEBP:
+        image.save(output, format="WEBP", quality=quality or 75, method=4)
+    else:
+        image.save(output, format="JPEG", quality=quality or 80, optimize=True, progressive=True)
+    encoded = output.getvalue()
+
+    if not needs_resize and image_format == IMAGE_FORMAT_JPEG and len(encoded) >= len(data):
+        return data
+    return encoded
+
+
+# ----------------------------------------------------------
+# SPRITE COMPOSITION
+# ----------------------------------------------------------
+
+
+def compose_sprite(
+    images: List[Tuple[str, bytes]],
+    tile_width: int,
+    tile_height: int,
+    columns: int,
+    quality: int = 80,
+) -> Tuple[bytes, Dict[str, Dict[str, int]]]:
+    """Composite thumbnails into a single JPEG grid.
+
+    Returns the sprite bytes and an offset map of ``{uidd: {x, y, w, h}}``.
+    Images that fail to decode are left out of the sprite and the map.
+    """
+    from PIL import Image, ImageOps
+
+    tiles: List[Tuple[str, Any]] = []
+    for uidd, data in images:
+        try:
+            image = Image.open(io.BytesIO(data))
+            # Let the JPEG decoder downscale while decoding, then crop to the tile
+            image.draft("RGB", (tile_width * 2, tile_height * 2))
+            tiles.append((uidd, ImageOps.fit(image.convert("RGB"), (tile_width, tile_height))))
+        except Exception as e:
+            _LOGGER.debug("Skipping undecodable thumbnail for %s in sprite: %s", uidd, e)
+
+    columns = max(1, min(columns, len(tiles) or 1))
+    rows = max(1, -(-len(tiles) // columns))
+    sprite = Image.new("RGB", (tile_width * columns, tile_height * rows))
+
+    offsets: Dict[str, Dict[str, int]] = {}
+    for index, (uidd, tile) in enumerate(tiles):
+        x = (index % columns) * tile_width
+        y = (index // columns) * tile_height
+        sprite.paste(tile, (x, y))
+        offsets[uidd] = {"x": x, "y": y, "w": tile_width, "h": tile_height}
+
+    output = io.BytesIO()
+    sprite.save(output, format="JPEG", quality=quality, optimize=True)
+    return output.getvalue(), offsets
+
+
+# ----------------------------------------------------------
+# MOTION SCORING
+# ----------------------------------------------------------
+
+
+def compute_motion(
+    data: bytes,
+    previous: Optional[bytes],
+    size: Tuple[int, int],
+    pixel_threshold: int,
+) -> Tuple[bytes, Optional[float]]:
+    """Return a grayscale signature of an image and its change score vs ``previous``.
+
+    The signature is the image downscaled to ``size`` in 8-bit grayscale. The
+    score is the percentage of signature pixels whose value differs by more
+    than ``pixel_threshold``, or None when there is nothing to compare with.
+    """
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image.draft("L", (size[0] * 2, size[1] * 2))
+    signature = image.convert("L").resize(size, Image.BILINEAR).tobytes()
+    if previous is None or len(previous) != len(signature):
+        return signature, None
+
+    current = np.frombuffer(signature, dtype=np.uint8).astype(np.int16)
+    before = np.frombuffer(previous, dtype=np.uint8).astype(np.int16)
+    changed = np.count_nonzero(np.abs(current - before) > pixel_threshold)
+    return signature, round(100.0 * changed / current.size, 2)
+
+
+# ----------------------------------------------------------
+# TIME-LAPSE
+# ----------------------------------------------------------
+
+
+def compose_timelapse_gif(frames: List[bytes], width: int, frame_ms: int) -> bytes:
+    """Encode JPEG frames, oldest first, into a looping animated GIF."""
+    from PIL import Image
+
+    images = []
+    for data in frames:
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.draft("RGB", (width, width))
+            image = image.convert("RGB")
+            image.thumbnail((width, width), Image.LANCZOS)
+            # Quantise each frame to its own adaptive palette to keep colours faithful
+            images.append(image.convert("P", palette=Image.ADAPTIVE))
+        except Exception as e:
+            _LOGGER.debug("Skipping undecodable time-lapse frame: %s", e)
+    if not images:
+        raise ValueError("No decodable frames")
+
+    output = io.BytesIO()
+    images[0].save(
+        output,
+        format="GIF",
+        save_all=True,
+        append_images=images[1:],
+        duration=frame_ms,
+        loop=0,
+        optimize=True,
+    )
+    return output.getvalue()
+
+
+# ----------------------------------------------------------
+# LIVE SEGMENT SNAPSHOTS
+# ----------------------------------------------------------
+
+
+def extract_keyframe_jpeg(segment: bytes, quality: int = 85) -> Optional[bytes]:
+    """Decode the first keyframe of an HLS media segment into a JPEG.
+
+    Non-key frames are skipped by the decoder, so only one frame is decoded.
+    Returns None when the segment has no decodable video keyframe. Raises
+    ImportError when PyAV (``av``) is not installed; callers treat that as
+    keyframe extraction being unavailable and fall back to cloud thumbnails.
+    """
+    import av
+
+    with av.open(io.BytesIO(segment), mode="r") as container:
+        if not container.streams.video:
+            return None
+        stream = container.streams.video[0]
+        stream.codec_context.skip_frame = "NONKEY"
+        for frame in container.decode(stream):
+            output = io.BytesIO()
+            frame.to_image().save(output, format="JPEG", quality=quality)
+            return output.getvalue()
+    return None
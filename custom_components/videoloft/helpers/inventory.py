@@ -0,0 +1,177 @@
+"""Camera inventory: keeps the camera list, entities and device registry in sync."""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Set
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const import CAMERA_INVENTORY_INTERVAL, DOMAIN
+from .device_index import make_uidd
+
+_LOGGER = logging.getLogger(__name__)
+
+CameraListener = Callable[[str, Dict[str, Any]], None]
+
+# Device registry fields and the camera info fields they are built from
+_REGISTRY_FIELDS = {
+    "name": ("name", "phonename"),
+    "model": ("model",),
+    "sw_version": ("cloudAdapterVersion",),
+    "hw_version": ("recordingResolution",),
+}
+
+
+def _hash_value(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class CameraInventory:
+    """Refresh the account's camera list and apply only what changed.
+
+    Each camera is fingerprinted by a hash of its info plus one hash per
+    field. On refresh, unchanged cameras are skipped outright; changed
+    cameras have their changed fields pushed to the status coordinator and
+    the device registry. New cameras are announced to the platforms, which
+    add their entities, and removed cameras are dropped from the registry,
+    which removes their entities, all without reloading the entry.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api) -> None:
+        """Initialize the inventory."""
+        self.hass = hass
+        self.entry = entry
+        self.api = api
+        self._camera_hashes: Dict[str, str] = {}
+        self._field_hashes: Dict[str, Dict[str, str]] = {}
+        self._camera_listeners: List[CameraListener] = []
+        self._stats = {"refreshes": 0, "added": 0, "removed": 0, "changed": 0}
+
+    @property
+    def _entry_data(self) -> Dict[str, Any]:
+        return self.hass.data[DOMAIN][self.entry.entry_id]
+
+    @callback
+    def async_start(self) -> None:
+        """Fingerprint the current cameras and schedule periodic refreshes."""
+        for uidd, device_data in self._entry_data["device_index"].items():
+            self._fingerprint(uidd, device_data)
+        self.entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._async_scheduled_refresh, timedelta(seconds=CAMERA_INVENTORY_INTERVAL)
+            )
+        )
+
+    @callback
+    def async_add_camera_listener(self, listener: CameraListener) -> Callable[[], None]:
+        """Call ``listener(uidd, device_data)`` for every camera added later; returns a remover."""
+        self._camera_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._camera_listeners:
+                self._camera_listeners.remove(listener)
+
+        return _remove
+
+    def _fingerprint(self, uidd: str, device_data: Dict[str, Any]) -> None:
+        self._camera_hashes[uidd] = _hash_value(device_data)
+        self._field_hashes[uidd] = {field: _hash_value(value) for field, value in device_data.items()}
+
+    def _changed_fields(self, uidd: str, device_data: Dict[str, Any]) -> Set[str]:
+        previous = self._field_hashes.get(uidd, {})
+        current = {field: _hash_value(value) for field, value in device_data.items()}
+        return {field for field in previous.keys() | current.keys() if previous.get(field) != current.get(field)}
+
+    async def _async_scheduled_refresh(self, _now=None) -> None:
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Fetch the camera list and apply the differences."""
+        cameras = await self.api.get_cameras_info(force_refresh=True)
+        if not cameras:
+            # An empty answer is far more likely an API failure than every camera leaving
+            _LOGGER.debug("Camera inventory refresh returned nothing; keeping the current cameras")
+            return
+        self._stats["refreshes"] += 1
+
+        by_uidd = {make_uidd(device_data): device_data for device_data in cameras}
+        added = [uidd for uidd in by_uidd if uidd not in self._camera_hashes]
+        removed = [uidd for uidd in self._camera_hashes if uidd not in by_uidd]
+        changed: Dict[str, Dict[str, Any]] = {}
+        for uidd, device_data in by_uidd.items():
+            if uidd in added or _hash_value(device_data) == self._camera_hashes[uidd]:
+                continue
+            fields = self._changed_fields(uidd, device_data)
+            changed[uidd] = {field: device_data.get(field) for field in fields}
+            self._fingerprint(uidd, device_data)
+
+        if not (added or removed or changed):
+            return
+
+        # Swap the camera list in first so everything below sees the new cameras
+        entry_data = self._entry_data
+        entry_data["device_index"].replace(cameras)
+        entry_data["devices"] = cameras
+
+        if changed:
+            self._stats["changed"] += len(changed)
+            self._apply_changes(changed)
+        for uidd in removed:
+            self._stats["removed"] += 1
+            self._remove_camera(uidd)
+        for uidd in added:
+            self._stats["added"] += 1
+            self._fingerprint(uidd, by_uidd[uidd])
+            for listener in list(self._camera_listeners):
+                listener(uidd, by_uidd[uidd])
+
+        _LOGGER.info(
+            "Camera inventory updated: %d added, %d removed, %d changed",
+            len(added), len(removed), len(changed),
+        )
+
+    @callback
+    def _apply_changes(self, changed: Dict[str, Dict[str, Any]]) -> None:
+        """Push changed fields to entities and the device registry."""
+        status_coordinator = self._entry_data.get("status_coordinator")
+        if status_coordinator:
+            status_coordinator.async_update_device_fields(changed)
+
+        registry = dr.async_get(self.hass)
+        for uidd, fields in changed.items():
+            device = registry.async_get_device(identifiers={(DOMAIN, uidd)})
+            if device is None:
+                continue
+            device_data = self._entry_data["device_index"].get(uidd) or {}
+            updates = {}
+            for registry_field, sources in _REGISTRY_FIELDS.items():
+                if fields.keys() & set(sources):
+                    updates[registry_field] = next(
+                        (device_data[source] for source in sources if device_data.get(source)), None
+                    )
+            if updates:
+                registry.async_update_device(device.id, **updates)
+
+    @callback
+    def _remove_camera(self, uidd: str) -> None:
+        """Forget a camera; removing its device also removes its entities."""
+        self._camera_hashes.pop(uidd, None)
+        self._field_hashes.pop(uidd, None)
+        snapshot_store = self._entry_data.get("snapshots")
+        if snapshot_store:
+            snapshot_store.remove(uidd)
+
+        registry = dr.async_get(self.hass)
+        device = registry.async_get_device(identifiers={(DOMAIN, uidd)})
+        if device is not None:
+            registry.async_update_device(device.id, remove_config_entry_id=self.entry.entry_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return inventory statistics."""
+        return {"cameras": len(self._camera_hashes), **self._stats}
@@ -0,0 +1,88 @@
+"""Compiled index of LPR triggers for constant-time detection matching."""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..const import LPR_TRIGGER_INDEX_KEY, LPR_TRIGGER_STORAGE_KEY
+
+VehicleKey = Tuple[str, str, str]
+_Candidate = Tuple[int, Dict[str, Any]]
+
+
+def normalize(value: Any) -> str:
+    """Normalise a trigger or detection field for comparison."""
+    return value.strip().lower() if isinstance(value, str) else ""
+
+
+class LPRTriggerMatcher:
+    """Match vehicle detections against triggers with dictionary lookups.
+
+    Triggers are normalised once and indexed by camera UIDD, both by licence
+    plate and by (make, model, colour). A trigger matches on its plate, or on
+    make, model and colour when all three are set. When several triggers
+    match, the one that comes first in the trigger list wins. Disabled
+    triggers are left out.
+    """
+
+    def __init__(self, triggers: List[Dict[str, Any]]) -> None:
+        """Compile the triggers."""
+        self.source = triggers
+        self._by_plate: Dict[str, Dict[str, _Candidate]] = {}
+        self._by_vehicle: Dict[str, Dict[VehicleKey, _Candidate]] = {}
+        for position, trigger in enumerate(triggers):
+            uidd = trigger.get("uidd")
+            if not uidd or not trigger.get("enabled", True):
+                continue
+            plate = normalize(trigger.get("license_plate"))
+            if plate:
+                self._by_plate.setdefault(uidd, {}).setdefault(plate, (position, trigger))
+            vehicle = (
+                normalize(trigger.get("make")),
+                normalize(trigger.get("model")),
+                normalize(trigger.get("color")),
+            )
+            if all(vehicle):
+                self._by_vehicle.setdefault(uidd, {}).setdefault(vehicle, (position, trigger))
+        self.uidds: Set[str] = set(self._by_plate) | set(self._by_vehicle)
+
+    def __bool__(self) -> bool:
+        return bool(self.uidds)
+
+    def match(self, vehicle_data: Dict[str, Any], uidd: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the trigger matching a parsed detection, or None.
+
+        Only the triggers for ``uidd`` are considered; without a UIDD the
+        triggers of every camera are.
+        """
+        plate = normalize(vehicle_data.get("license_plate"))
+        vehicle = (
+            normalize(vehicle_data.get("make")),
+            normalize(vehicle_data.get("model")),
+            normalize(vehicle_data.get("color")),
+        )
+        uidds = (uidd,) if uidd is not None else self.uidds
+        best: Optional[_Candidate] = None
+        for camera in uidds:
+            for candidate in (
+                self._by_plate.get(camera, {}).get(plate) if plate else None,
+                self._by_vehicle.get(camera, {}).get(vehicle) if all(vehicle) else None,
+            ):
+                if candidate is not None and (best is None or candidate[0] < best[0]):
+                    best = candidate
+        return best[1] if best else None
+
+
+def set_lpr_triggers(entry_data: Dict[str, Any], triggers: List[Dict[str, Any]]) -> LPRTriggerMatcher:
+    """Store triggers for an entry along with their compiled matcher."""
+    matcher = LPRTriggerMatcher(triggers)
+    entry_data[LPR_TRIGGER_STORAGE_KEY] = triggers
+    entry_data[LPR_TRIGGER_INDEX_KEY] = matcher
+    return matcher
+
+
+def get_lpr_matcher(entry_data: Dict[str, Any]) -> LPRTriggerMatcher:
+    """Return the entry's compiled matcher, compiling it if the triggers were replaced."""
+    triggers = entry_data.get(LPR_TRIGGER_STORAGE_KEY) or []
+    matcher = entry_data.get(LPR_TRIGGER_INDEX_KEY)
+    if matcher is None or matcher.source is not triggers:
+        matcher = set_lpr_triggers(entry_data, triggers)
+    return matcher
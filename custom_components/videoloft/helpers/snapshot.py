@@ -0,0 +1,121 @@
+"""Live snapshots decoded from proxied HLS segments."""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+
+from ..const import SNAPSHOT_MAX_SEGMENT_AGE, SNAPSHOT_MAX_SEGMENT_BYTES
+from .image import extract_keyframe_jpeg
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LiveSnapshotStore:
+    """Keep the newest proxied segment per camera and decode snapshots on demand.
+
+    The stream proxy hands every fully relayed media segment to the store, so a
+    camera that is being watched always has a few seconds old keyframe
+    available locally. Decoding happens lazily in the executor and at most
+    once per segment.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_segment_bytes: int = SNAPSHOT_MAX_SEGMENT_BYTES,
+        max_age: int = SNAPSHOT_MAX_SEGMENT_AGE,
+    ) -> None:
+        """Initialize the snapshot store."""
+        self.hass = hass
+        self.max_segment_bytes = max_segment_bytes
+        self.max_age = max_age
+        # uidd -> {"segment", "received", "snapshot", "variants"}
+        self._segments: Dict[str, Dict[str, Any]] = {}
+        self._decode_count = 0
+        self._decode_failures = 0
+        self._decoder_available = True
+
+    def add_segment(self, uidd: str, segment: bytes) -> None:
+        """Record the newest media segment relayed for a camera."""
+        if not segment or len(segment) > self.max_segment_bytes:
+            return
+        self._segments[uidd] = {
+            "segment": segment,
+            "received": time.monotonic(),
+            "snapshot": None,
+            "variants": {},
+        }
+
+    def has_live_segment(self, uidd: str) -> bool:
+        """Return True if a segment for the camera was relayed recently."""
+        entry = self._segments.get(uidd)
+        return bool(entry) and time.monotonic() - entry["received"] <= self.max_age
+
+    def get_segment_age(self, uidd: str) -> Optional[float]:
+        """Return the age in seconds of the newest relayed segment."""
+        entry = self._segments.get(uidd)
+        if not entry:
+            return None
+        return time.monotonic() - entry["received"]
+
+    async def async_get_snapshot(self, uidd: str) -> Optional[Dict[str, Any]]:
+        """Return the live snapshot entry for a camera, decoding it if needed.
+
+        The returned entry holds the JPEG under ``snapshot`` and a ``variants``
+        dict usable with ``VideoloftCoordinator.async_get_image_variant``.
+        """
+        if not self._decoder_available or not self.has_live_segment(uidd):
+            return None
+
+        entry = self._segments[uidd]
+        if entry["snapshot"] is None:
+            segment = entry["segment"]
+            try:
+                snapshot = await self.hass.async_add_executor_job(extract_keyframe_jpeg, segment)
+            except ImportError:
+                _LOGGER.warning("PyAV is not available; live stream snapshots are disabled")
+                self._decoder_available = False
+                return None
+            except Exception as e:
+                self._decode_failures += 1
+                _LOGGER.debug(f"Failed to decode live snapshot for {uidd}: {e}")
+                snapshot = None
+
+            # A newer segment may have replaced the entry while decoding
+            if self._segments.get(uidd) is not entry:
+                return None
+            if not snapshot:
+                # Drop the segment so it is not decoded again
+                self._segments.pop(uidd, None)
+                return None
+
+            self._decode_count += 1
+            entry["snapshot"] = snapshot
+            entry["segment"] = None  # The raw segment is no longer needed
+
+        return entry
+
+    def remove(self, uidd: str) -> None:
+        """Forget the live segment for a camera."""
+        self._segments.pop(uidd, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return snapshot store statistics."""
+        live = [uidd for uidd in self._segments if self.has_live_segment(uidd)]
+        return {
+            "tracked_cameras": len(self._segments),
+            "live_cameras": len(live),
+            "decoded_snapshots": self._decode_count,
+            "decode_failures": self._decode_failures,
+            "decoder_available": self._decoder_available,
+            "resident_bytes": sum(
+                len(entry["segment"] or b"") + len(entry["snapshot"] or b"")
+                for entry in self._segments.values()
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop all retained segments and snapshots."""
+        self._segments.clear()
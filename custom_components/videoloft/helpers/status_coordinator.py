@@ -1,31 +1,55 @@
 """Enhanced coordinator for VideLoft device status management."""
 
 import logging
-from typing import Dict, Any, List, Optional, Set
+from typing import Callable, Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 import asyncio
+import heapq
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .status_history import StatusHistory
+
 from ..const import (
     DOMAIN, 
     STATUS_UPDATE_INTERVAL,
     CONNECTIVITY_UPDATE_INTERVAL,
     FIRMWARE_UPDATE_INTERVAL,
+    STATUS_DEVICE_TIMEOUT,
+    STATUS_FLAP_WINDOW,
+    STATUS_LOGGER_CONCURRENCY,
+    STATUS_MAX_INTERVAL,
+    STATUS_MIN_INTERVAL,
+    STATUS_OFFLINE_MAX_INTERVAL,
+    STATUS_SCHEDULER_TICK,
+    STATUS_VIEWED_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields refreshed on every poll; a change in these alone does not count as a device update.
+# "status_stale" marks a failed or timed-out poll that republished the previous data.
+VOLATILE_STATUS_FIELDS = frozenset({"last_status_update", "firmware_check_time", "status_stale"})
+
+# Fields set by the firmware check, carried over between checks
+FIRMWARE_FIELDS = ("firmware_check_time", "firmware_up_to_date")
+
 # ----------------------------------------------------------
 # STATUS COORDINATOR CLASS
 # ----------------------------------------------------------
 
 
 class VideoloftStatusCoordinator(DataUpdateCoordinator):
-    """Coordinator for managing camera status updates."""
+    """Coordinator for managing camera status updates.
+
+    The coordinator ticks every ``STATUS_SCHEDULER_TICK`` seconds but only
+    polls cameras whose own adaptive interval has elapsed. Due times live in a
+    heap; cameras that just changed status or are being watched are polled
+    often, stable and long-offline cameras back off exponentially.
+    """
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api) -> None:
         """Initialize the status coordinator."""
@@ -33,52 +57,329 @@ class VideoloftStatusCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=f"{DOMAIN}_status",
-            update_interval=timedelta(seconds=STATUS_UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=STATUS_SCHEDULER_TICK),
+            always_update=False,
         )
         self.entry = entry
         self.api = api
         self._device_data: Dict[str, Dict[str, Any]] = {}
-        self._last_connectivity_check = {}
+        self.status_history = StatusHistory(hass, entry.entry_id)
+        self._device_versions: Dict[str, int] = {}
+        self._device_listeners: Dict[str, List[Callable[[], None]]] = {}
+        self._changed_uidds: Set[str] = set()
+        # logger server -> {"status", "checked"}; one health check per host
+        self._logger_health: Dict[str, Dict[str, Any]] = {}
         self._last_firmware_check = {}
+        self._logger_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._poll_stats = {"timeouts": 0, "last_cycle_seconds": None, "health_checks": 0, "polled_last_cycle": 0}
+        # Scheduler: heap of (due, uidd); entries not matching _next_due are stale
+        self._schedule: List[tuple] = []
+        self._next_due: Dict[str, float] = {}
+        self._intervals: Dict[str, float] = {}
+        self._last_status_change: Dict[str, float] = {}
 
     async def _async_update_data(self) -> Dict[str, Dict[str, Any]]:
         """Fetch status data from API."""
         try:
             # Get current devices
-            devices = self.hass.data[DOMAIN][self.entry.entry_id]["devices"]
+            device_index = self.hass.data[DOMAIN][self.entry.entry_id]["device_index"]
             updated_data = {}
             
             current_time = datetime.now()
-            
-            for device_data in devices:
-                uidd = f"{device_data['uid']}.{device_data['id']}"
-                
-                # Always update basic status
-                updated_data[uidd] = await self._update_device_status(uidd, device_data)
-                
-                # Connectivity check (every 5 minutes)
-                if self._should_update_connectivity(uidd, current_time):
-                    await self._update_connectivity_status(uidd, updated_data[uidd])
-                    self._last_connectivity_check[uidd] = current_time
-                
-                # Firmware check (every 12 hours)
-                if self._should_update_firmware(uidd, current_time):
-                    await self._update_firmware_info(uidd, updated_data[uidd])
-                    self._last_firmware_check[uidd] = current_time
-            
-            self._device_data = updated_data
-            return updated_data
+            started = self.hass.loop.time()
+
+            # Check each distinct logger server once, then fan the result out
+            await self._async_update_logger_health(
+                {device_data.get("logger") for _, device_data in device_index.items()} - {None, ""},
+                current_time,
+            )
+
+            # Poll the due cameras at once; the per-logger semaphores keep each
+            # host's load bounded so the cycle takes as long as the slowest host
+            due = self._pop_due_cameras(device_index, started)
+            results = await asyncio.gather(
+                *(self._async_poll_device(uidd, device_index.get(uidd), current_time) for uidd in due)
+            )
+            for uidd, result in zip(due, results):
+                updated_data[uidd] = result
+                self._reschedule(uidd, result)
+
+            # Cameras not polled this cycle still follow their logger's health
+            for uidd, device_data in self._device_data.items():
+                if uidd in updated_data or uidd not in device_index:
+                    continue
+                previous_status = device_data.get("connectivity_status")
+                refreshed = dict(device_data)
+                self._update_connectivity_status(uidd, refreshed)
+                if refreshed["connectivity_status"] != previous_status:
+                    updated_data[uidd] = refreshed
+
+            self._poll_stats["polled_last_cycle"] = len(due)
+            self._poll_stats["last_cycle_seconds"] = round(self.hass.loop.time() - started, 2)
+            return self._publish(updated_data, current_uidds=set(device_index.uidds))
             
         except Exception as e:
             _LOGGER.error("Error updating status data: %s", e)
             return self._device_data
 
-    def _should_update_connectivity(self, uidd: str, current_time: datetime) -> bool:
-        """Check if connectivity status should be updated."""
-        last_check = self._last_connectivity_check.get(uidd)
-        if not last_check:
+    @staticmethod
+    def _status_fields(device_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in device_data.items() if key not in VOLATILE_STATUS_FIELDS}
+
+    @callback
+    def _publish(
+        self, updated_data: Dict[str, Dict[str, Any]], current_uidds: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge polled data into the snapshot and notify only cameras that changed.
+
+        Unchanged cameras keep their previous dict (with volatile fields
+        refreshed in place) and the snapshot itself is returned as-is when
+        nothing changed, so the coordinator skips its listeners entirely.
+        Cameras missing from ``current_uidds`` are dropped.
+        """
+        changed = set()
+        merged: Dict[str, Dict[str, Any]] = {
+            uidd: data for uidd, data in self._device_data.items()
+            if current_uidds is None or uidd in current_uidds
+        }
+        for uidd, new_data in updated_data.items():
+            if not new_data.get("status_stale"):
+                self._record_history(uidd, new_data)
+            previous = self._device_data.get(uidd)
+            if previous is not None and self._status_fields(previous) == self._status_fields(new_data):
+                for key in VOLATILE_STATUS_FIELDS:
+                    if key in new_data:
+                        previous[key] = new_data[key]
+                    else:
+                        previous.pop(key, None)
+                merged[uidd] = previous
+            else:
+                merged[uidd] = new_data
+                changed.add(uidd)
+        removed = set(self._device_data) - set(merged)
+
+        self._changed_uidds = changed | removed
+        if not self._changed_uidds:
+            return self._device_data
+
+        for uidd in self._changed_uidds:
+            self._device_versions[uidd] = self._device_versions.get(uidd, 0) + 1
+        self._device_data = merged
+        _LOGGER.debug("Status changed for %d of %d cameras", len(self._changed_uidds), len(merged))
+        for uidd in self._changed_uidds:
+            for listener in list(self._device_listeners.get(uidd, ())):
+                listener()
+        return merged
+
+    def _record_history(self, uidd: str, device_data: Dict[str, Any]) -> None:
+        status = device_data.get("current_status")
+        if status and status != "unknown":
+            self.status_history.record(uidd, status == "online")
+
+    @callback
+    def async_add_device_listener(self, uidd: str, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``update_callback`` whenever a camera's status changes; returns a remover."""
+        self._device_listeners.setdefault(uidd, []).append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            listeners = self._device_listeners.get(uidd, [])
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+            if not listeners:
+                self._device_listeners.pop(uidd, None)
+
+        return _remove
+
+    @callback
+    def async_update_device_fields(self, changed: Dict[str, Dict[str, Any]]) -> None:
+        """Merge changed camera info fields into the snapshot without polling."""
+        updated = {
+            uidd: {**self._device_data[uidd], **fields}
+            for uidd, fields in changed.items()
+            if uidd in self._device_data
+        }
+        if updated:
+            data = self._publish(updated)
+            if self._changed_uidds:
+                self.async_set_updated_data(data)
+
+    def get_device_version(self, uidd: str) -> int:
+        """Return a counter that increases every time a camera's status changes."""
+        return self._device_versions.get(uidd, 0)
+
+    @property
+    def changed_uidds(self) -> Set[str]:
+        """Return the cameras whose status changed in the last update."""
+        return set(self._changed_uidds)
+
+    # ----------------------------------------------------------
+    # ADAPTIVE SCHEDULING
+    # ----------------------------------------------------------
+
+    def _pop_due_cameras(self, device_index, now: float) -> List[str]:
+        """Return the cameras whose poll is due, removing them from the schedule."""
+        due = [uidd for uidd in device_index.uidds if uidd not in self._next_due]
+        while self._schedule and self._schedule[0][0] <= now:
+            due_time, uidd = heapq.heappop(self._schedule)
+            if self._next_due.get(uidd) != due_time:
+                continue  # Superseded by a later reschedule
+            if uidd not in device_index:
+                self._forget_camera(uidd)
+                continue
+            due.append(uidd)
+        for uidd in due:
+            self._next_due[uidd] = now
+        return due
+
+    def _forget_camera(self, uidd: str) -> None:
+        self.status_history.remove(uidd)
+        self._next_due.pop(uidd, None)
+        self._intervals.pop(uidd, None)
+        self._last_status_change.pop(uidd, None)
+
+    def _schedule_poll(self, uidd: str, due_time: float) -> None:
+        self._next_due[uidd] = due_time
+        heapq.heappush(self._schedule, (due_time, uidd))
+
+    def _is_viewed(self, uidd: str) -> bool:
+        """Return True if someone is watching the camera's stream or thumbnail."""
+        entry_data = self.hass.data[DOMAIN].get(self.entry.entry_id, {})
+        snapshots = entry_data.get("snapshots")
+        if snapshots and snapshots.has_live_segment(uidd):
             return True
-        return (current_time - last_check).total_seconds() > CONNECTIVITY_UPDATE_INTERVAL
+        coordinator = entry_data.get("coordinator")
+        return bool(coordinator) and coordinator.is_recently_viewed(uidd, STATUS_VIEWED_INTERVAL * 2)
+
+    def _next_interval(self, uidd: str, device_data: Dict[str, Any], now: float) -> float:
+        """Work out how long to wait before polling a camera again."""
+        previous = self._device_data.get(uidd)
+        if (
+            previous is not None
+            and not device_data.get("status_stale")
+            and previous.get("current_status") != device_data.get("current_status")
+        ):
+            self._last_status_change[uidd] = now
+            return STATUS_MIN_INTERVAL
+
+        interval = self._intervals.get(uidd, STATUS_UPDATE_INTERVAL / 2)
+        if self._is_viewed(uidd):
+            return STATUS_VIEWED_INTERVAL
+        last_change = self._last_status_change.get(uidd)
+        if last_change is not None and now - last_change < STATUS_FLAP_WINDOW:
+            # Recently flapped: ease back towards the base interval only
+            return min(interval * 2, STATUS_UPDATE_INTERVAL)
+        ceiling = STATUS_MAX_INTERVAL if device_data.get("current_status") == "online" else STATUS_OFFLINE_MAX_INTERVAL
+        return min(max(interval * 2, STATUS_MIN_INTERVAL), ceiling)
+
+    def _reschedule(self, uidd: str, device_data: Dict[str, Any]) -> None:
+        now = self.hass.loop.time()
+        interval = self._next_interval(uidd, device_data, now)
+        self._intervals[uidd] = interval
+        self._schedule_poll(uidd, now + interval)
+
+    @callback
+    def async_request_poll(self, uidd: str) -> None:
+        """Make a camera due on the next scheduler tick."""
+        self._intervals[uidd] = STATUS_MIN_INTERVAL
+        self._schedule_poll(uidd, self.hass.loop.time())
+
+    def get_poll_interval(self, uidd: str) -> Optional[float]:
+        """Return a camera's current polling interval in seconds."""
+        return self._intervals.get(uidd)
+
+    def _get_logger_semaphore(self, logger_server: Optional[str]) -> asyncio.Semaphore:
+        """Return the semaphore capping concurrent requests to a logger server."""
+        key = logger_server or ""
+        semaphore = self._logger_semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._logger_semaphores[key] = asyncio.Semaphore(STATUS_LOGGER_CONCURRENCY)
+        return semaphore
+
+    async def _async_poll_device(
+        self, uidd: str, device_data: Dict[str, Any], current_time: datetime
+    ) -> Dict[str, Any]:
+        """Poll one camera, falling back to its previous data on timeout."""
+        async with self._get_logger_semaphore(device_data.get("logger")):
+            try:
+                return await asyncio.wait_for(
+                    self._async_poll_device_checks(uidd, device_data, current_time),
+                    timeout=STATUS_DEVICE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                self._poll_stats["timeouts"] += 1
+                _LOGGER.debug("Status poll for %s timed out after %ss", uidd, STATUS_DEVICE_TIMEOUT)
+                return self._stale_device_data(uidd, device_data)
+
+    def _stale_device_data(self, uidd: str, device_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a camera's last published data, flagged as stale."""
+        previous = self._device_data.get(uidd) or device_data
+        return {**previous, "status_stale": True}
+
+    async def _async_poll_device_checks(
+        self, uidd: str, device_data: Dict[str, Any], current_time: datetime
+    ) -> Dict[str, Any]:
+        """Run the status, connectivity and firmware checks that are due for a camera."""
+        # Always update basic status
+        updated = await self._update_device_status(uidd, device_data)
+
+        # Connectivity comes from the shared logger server health check
+        self._update_connectivity_status(uidd, updated)
+
+        # Firmware check (every 12 hours)
+        if self._should_update_firmware(uidd, current_time):
+            await self._update_firmware_info(uidd, updated)
+            self._last_firmware_check[uidd] = current_time
+        else:
+            previous = self._device_data.get(uidd, {})
+            for key in FIRMWARE_FIELDS:
+                if key in previous:
+                    updated[key] = previous[key]
+
+        return updated
+
+    def get_poll_stats(self) -> Dict[str, Any]:
+        """Return status polling statistics."""
+        intervals = list(self._intervals.values())
+        return {
+            **self._poll_stats,
+            "scheduled_cameras": len(self._next_due),
+            "mean_interval_seconds": round(sum(intervals) / len(intervals), 1) if intervals else None,
+            "polls_per_hour": round(sum(3600 / interval for interval in intervals), 1) if intervals else 0,
+        }
+
+    def _should_check_logger(self, logger_server: str, current_time: datetime) -> bool:
+        """Check if a logger server's health should be re-checked."""
+        health = self._logger_health.get(logger_server)
+        if not health:
+            return True
+        return (current_time - health["checked"]).total_seconds() > CONNECTIVITY_UPDATE_INTERVAL
+
+    async def _async_update_logger_health(self, logger_servers: Set[str], current_time: datetime) -> None:
+        """Health-check the logger servers that are due, concurrently."""
+        due = [server for server in logger_servers if self._should_check_logger(server, current_time)]
+        if due:
+            await asyncio.gather(*(self._async_check_logger_health(server, current_time) for server in due))
+
+        # Forget hosts no camera records to any more
+        for server in set(self._logger_health) - logger_servers:
+            del self._logger_health[server]
+
+    async def _async_check_logger_health(self, logger_server: str, current_time: datetime) -> None:
+        """Health-check one logger server and cache the result."""
+        async with self._get_logger_semaphore(logger_server):
+            try:
+                session = async_get_clientsession(self.hass)
+                async with session.get(f"https://{logger_server}/health", timeout=5) as response:
+                    status = "online" if response.status == 200 else "degraded"
+            except Exception:
+                status = "offline"
+        self._poll_stats["health_checks"] += 1
+        self._logger_health[logger_server] = {"status": status, "checked": current_time}
+
+    def get_logger_health(self) -> Dict[str, str]:
+        """Return the cached health status of each logger server."""
+        return {server: health["status"] for server, health in self._logger_health.items()}
 
     def _should_update_firmware(self, uidd: str, current_time: datetime) -> bool:
         """Check if firmware info should be updated."""
@@ -94,7 +395,7 @@ class VideoloftStatusCoordinator(DataUpdateCoordinator):
             logger_server = device_data.get("logger")
             if not logger_server:
                 _LOGGER.warning("No logger server for device %s", uidd)
-                return device_data.copy()
+                return self._stale_device_data(uidd, device_data)
 
             # Get current camera status
             status_data = await self.api.get_camera_status(uidd, logger_server)
@@ -115,23 +416,12 @@ class VideoloftStatusCoordinator(DataUpdateCoordinator):
 
         except Exception as e:
             _LOGGER.debug("Error updating device status for %s: %s", uidd, e)
-            return device_data.copy()
+            return self._stale_device_data(uidd, device_data)
 
-    async def _update_connectivity_status(self, uidd: str, device_data: Dict[str, Any]) -> None:
-        """Update connectivity-specific status."""
-        try:
-            # Check if camera is responsive
-            logger_server = device_data.get("logger")
-            if logger_server:
-                # Simple ping-like check
-                session = async_get_clientsession(self.hass)
-                async with session.get(f"https://{logger_server}/health", timeout=5) as response:
-                    device_data["connectivity_status"] = "online" if response.status == 200 else "degraded"
-            else:
-                device_data["connectivity_status"] = "unknown"
-                
-        except Exception:
-            device_data["connectivity_status"] = "offline"
+    def _update_connectivity_status(self, uidd: str, device_data: Dict[str, Any]) -> None:
+        """Set a camera's connectivity from its logger server's cached health."""
+        health = self._logger_health.get(device_data.get("logger") or "")
+        device_data["connectivity_status"] = health["status"] if health else "unknown"
 
     async def _update_firmware_info(self, uidd: str, device_data: Dict[str, Any]) -> None:
         """Update firmware-related information."""
@@ -154,16 +444,21 @@ class VideoloftStatusCoordinator(DataUpdateCoordinator):
     async def async_refresh_device(self, uidd: str) -> None:
         """Force refresh of a specific device."""
         try:
-            devices = self.hass.data[DOMAIN][self.entry.entry_id]["devices"]
-            device_data = next((d for d in devices if f"{d['uid']}.{d['id']}" == uidd), None)
+            device_data = self.hass.data[DOMAIN][self.entry.entry_id]["device_index"].get(uidd)
             
             if device_data:
                 updated_data = await self._update_device_status(uidd, device_data)
-                await self._update_connectivity_status(uidd, updated_data)
-                self._device_data[uidd] = updated_data
-                
-                # Notify listeners
-                self.async_update_listeners()
+                logger_server = device_data.get("logger")
+                if logger_server and logger_server not in self._logger_health:
+                    await self._async_check_logger_health(logger_server, datetime.now())
+                self._update_connectivity_status(uidd, updated_data)
+                self._reschedule(uidd, updated_data)
+
+                # Per-device listeners fire from _publish; the coordinator's
+                # own listeners only hear about it if something changed
+                data = self._publish({uidd: updated_data})
+                if self._changed_uidds:
+                    self.async_set_updated_data(data)
                 
         except Exception as e:
             _LOGGER.error("Error refreshing device %s: %s", uidd, e)
@@ -0,0 +1,232 @@
+"""Compact per-camera history of online/offline transitions."""
+
+import logging
+import time
+from array import array
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import storage
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const import (
+    DOMAIN,
+    STATUS_HISTORY_CAPACITY,
+    STATUS_HISTORY_REFRESH_INTERVAL,
+    STATUS_HISTORY_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+OFFLINE = 0
+ONLINE = 1
+
+
+class _CameraHistory:
+    """Ring buffer of (timestamp, status) transitions plus running totals."""
+
+    __slots__ = ("times", "codes", "start", "count", "status", "since", "accounted", "online", "tracked")
+
+    def __init__(self, capacity: int) -> None:
+        self.times = array("d", bytes(8 * capacity))
+        self.codes = array("b", bytes(capacity))
+        self.start = 0
+        self.count = 0
+        self.status: Optional[int] = None
+        self.since: Optional[float] = None
+        self.accounted: Optional[float] = None
+        self.online = 0.0
+        self.tracked = 0.0
+
+    def time_at(self, position: int) -> float:
+        """Return the timestamp of the ``position``-th oldest transition."""
+        return self.times[(self.start + position) % len(self.times)]
+
+    def append(self, timestamp: float, code: int) -> None:
+        capacity = len(self.times)
+        index = (self.start + self.count) % capacity
+        self.times[index] = timestamp
+        self.codes[index] = code
+        if self.count < capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % capacity
+
+    def accumulate(self, now: float) -> None:
+        """Add the time since the last update to the running totals."""
+        if self.status is not None and self.accounted is not None and now > self.accounted:
+            elapsed = now - self.accounted
+            self.tracked += elapsed
+            if self.status == ONLINE:
+                self.online += elapsed
+        self.accounted = now
+
+    def transitions(self) -> List[List[float]]:
+        return [
+            [self.time_at(position), self.codes[(self.start + position) % len(self.codes)]]
+            for position in range(self.count)
+        ]
+
+
+class StatusHistory:
+    """Record status transitions per camera and derive availability figures.
+
+    Transitions are kept in fixed-size arrays, so memory per camera is
+    constant. Online and tracked time are accumulated as transitions arrive,
+    so availability never needs a scan, and the buffer is written to storage
+    in batches via a delayed save. Time while Home Assistant was stopped is
+    not counted either way.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, capacity: int = STATUS_HISTORY_CAPACITY) -> None:
+        """Initialize the history."""
+        self.hass = hass
+        self.capacity = capacity
+        self._store = storage.Store(hass, STORAGE_VERSION, f"{DOMAIN}_status_history_{entry_id}")
+        self._cameras: Dict[str, _CameraHistory] = {}
+        self._listeners: List[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Restore persisted transitions."""
+        try:
+            data = await self._store.async_load() or {}
+        except Exception as e:
+            _LOGGER.warning(f"Unable to load status history, starting empty: {e}")
+            data = {}
+        now = time.time()
+        for uidd, stored in data.items():
+            history = self._get(uidd)
+            for timestamp, code in stored.get("transitions", [])[-self.capacity:]:
+                history.append(timestamp, int(code))
+            history.status = stored.get("status")
+            history.since = stored.get("since")
+            history.online = stored.get("online", 0.0)
+            history.tracked = stored.get("tracked", 0.0)
+            history.accounted = now  # Skip the time Home Assistant was down
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        now = time.time()
+        data = {}
+        for uidd, history in self._cameras.items():
+            history.accumulate(now)
+            data[uidd] = {
+                "transitions": history.transitions(),
+                "status": history.status,
+                "since": history.since,
+                "online": history.online,
+                "tracked": history.tracked,
+            }
+        return data
+
+    def _get(self, uidd: str) -> _CameraHistory:
+        history = self._cameras.get(uidd)
+        if history is None:
+            history = self._cameras[uidd] = _CameraHistory(self.capacity)
+        return history
+
+    @callback
+    def record(self, uidd: str, online: Optional[bool], timestamp: Optional[float] = None) -> bool:
+        """Record a camera's polled status; returns True if it was a transition.
+
+        ``None`` means the status is unknown and is ignored.
+        """
+        if online is None:
+            return False
+        now = timestamp if timestamp is not None else time.time()
+        code = ONLINE if online else OFFLINE
+        history = self._get(uidd)
+        history.accumulate(now)
+        if history.status == code:
+            return False
+        history.append(now, code)
+        history.status = code
+        history.since = now
+        self._store.async_delay_save(self._data_to_save, STATUS_HISTORY_SAVE_DELAY)
+        return True
+
+    def get_online_since(self, uidd: str) -> Optional[float]:
+        """Return when the camera last came online, or None if it is not online."""
+        history = self._cameras.get(uidd)
+        if history is None or history.status != ONLINE:
+            return None
+        return history.since
+
+    def get_availability(self, uidd: str) -> Optional[float]:
+        """Return the percentage of tracked time the camera was online."""
+        history = self._cameras.get(uidd)
+        if history is None:
+            return None
+        history.accumulate(time.time())
+        if not history.tracked:
+            return None
+        return round(100 * history.online / history.tracked, 2)
+
+    def get_flap_count(self, uidd: str, window: float) -> int:
+        """Return the number of transitions in the last ``window`` seconds."""
+        history = self._cameras.get(uidd)
+        if history is None or not history.count:
+            return 0
+        cutoff = time.time() - window
+        # Transitions are in time order, so binary search for the first one in the window
+        low, high = 0, history.count
+        while low < high:
+            middle = (low + high) // 2
+            if history.time_at(middle) < cutoff:
+                low = middle + 1
+            else:
+                high = middle
+        return history.count - low
+
+    def remove(self, uidd: str) -> None:
+        """Forget a camera's history."""
+        if self._cameras.pop(uidd, None) is not None:
+            self._store.async_delay_save(self._data_to_save, STATUS_HISTORY_SAVE_DELAY)
+
+    @callback
+    def async_start(self, entry) -> None:
+        """Periodically save the running totals and notify listeners."""
+        entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._async_notify, timedelta(seconds=STATUS_HISTORY_REFRESH_INTERVAL)
+            )
+        )
+
+    @callback
+    def _async_notify(self, _now=None) -> None:
+        # Stable cameras have no transitions to trigger a save, and entries are not
+        # unloaded on shutdown; a pending delayed save is written on final write.
+        if self._cameras:
+            self._store.async_delay_save(self._data_to_save, STATUS_HISTORY_SAVE_DELAY)
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` on every periodic refresh; returns a remover."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    async def async_flush(self) -> None:
+        """Write the history immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_clear(self) -> None:
+        """Delete all history."""
+        self._cameras.clear()
+        await self._store.async_remove()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return history statistics."""
+        return {
+            "cameras": len(self._cameras),
+            "transitions": sum(history.count for history in self._cameras.values()),
+            "capacity_per_camera": self.capacity,
+        }
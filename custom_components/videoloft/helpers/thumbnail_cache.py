@@ -0,0 +1,162 @@
+"""Byte-budgeted LRU cache for thumbnail images."""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ThumbnailCache:
+    """LRU cache of thumbnail entries bounded by total bytes and entry age.
+
+    Entries are dicts holding the original image under ``data`` and encoded
+    variants under ``variants``; both count towards the byte budget. Variants
+    are added to an entry in place, so callers report the growth with
+    ``update_size``. Entries older than ``ttl`` seconds since they were last
+    stored are dropped on access and during eviction.
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl: Optional[float] = None) -> None:
+        """Initialize the cache."""
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._stored: Dict[str, float] = {}
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def entry_size(entry: Dict[str, Any]) -> int:
+        """Return the bytes held by an entry, including its variants."""
+        size = len(entry.get("data") or b"")
+        for variant in (entry.get("variants") or {}).values():
+            size += len(variant)
+        return size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over entries without affecting recency or counters."""
+        return iter(list(self._entries.items()))
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over entries without affecting recency or counters."""
+        return iter(list(self._entries.values()))
+
+    def _is_expired(self, key: str) -> bool:
+        return self.ttl is not None and time.monotonic() - self._stored[key] > self.ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry and mark it most recently used, counting a hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(key):
+            self._remove(key)
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def peek(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry without touching recency, TTL or counters."""
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry as most recently used and restart its TTL."""
+        if key in self._entries:
+            self._remove(key)
+        size = self.entry_size(entry)
+        if size > self.max_bytes:
+            _LOGGER.debug(f"Not caching {key} in {self.name} cache: {size} bytes exceeds budget")
+            return
+        self._entries[key] = entry
+        self._sizes[key] = size
+        self._stored[key] = time.monotonic()
+        self._resident_bytes += size
+        self._evict()
+
+    def update_size(self, key: str) -> None:
+        """Re-account an entry after variants were added to it in place.
+
+        Eviction skips the entry itself, so if it alone exceeds the budget its
+        oldest variants are dropped instead.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        size = self.entry_size(entry)
+        variants = entry.get("variants")
+        while size > self.max_bytes and variants:
+            size -= len(variants.pop(next(iter(variants))))
+        self._resident_bytes += size - self._sizes[key]
+        self._sizes[key] = size
+        self._evict(keep=key)
+
+    def pop(self, key: str) -> Optional[Dict[str, Any]]:
+        """Remove and return an entry."""
+        if key not in self._entries:
+            return None
+        return self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries; counters are kept."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._stored.clear()
+        self._resident_bytes = 0
+
+    def _remove(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.pop(key)
+        self._resident_bytes -= self._sizes.pop(key)
+        self._stored.pop(key, None)
+        return entry
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Drop expired entries, then least recently used ones until within budget."""
+        if self.ttl is not None:
+            for key in [key for key in self._entries if key != keep and self._is_expired(key)]:
+                self._remove(key)
+                self._expirations += 1
+
+        while self._resident_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            if key == keep:
+                if len(self._entries) == 1:
+                    break
+                self._entries.move_to_end(key)
+                key = next(iter(self._entries))
+            self._remove(key)
+            self._evictions += 1
+            _LOGGER.debug(f"Evicted {key} from {self.name} cache")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "resident_bytes": self._resident_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else None,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
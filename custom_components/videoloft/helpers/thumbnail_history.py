@@ -0,0 +1,102 @@
+"""Per-camera ring buffers of recent thumbnails."""
+
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+Frame = Tuple[datetime, bytes]
+
+
+class ThumbnailHistory:
+    """Keep the last ``size`` thumbnails of each camera under a global byte cap.
+
+    Each camera has a fixed-length ring buffer; when the total across all
+    cameras exceeds ``max_bytes`` the globally oldest frames are dropped.
+    A size of 0 disables recording.
+    """
+
+    def __init__(self, size: int, max_bytes: int) -> None:
+        """Initialize the history."""
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._frames: Dict[str, Deque[Frame]] = {}
+        self._resident_bytes = 0
+        self._dropped = 0
+        self.resize(size)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if history is being recorded."""
+        return self._size > 0
+
+    def resize(self, size: int) -> None:
+        """Change the number of frames kept per camera."""
+        size = max(0, size)
+        if size == self._size:
+            return
+        self._size = size
+        for uidd, frames in list(self._frames.items()):
+            kept = list(frames)[-size:] if size else []
+            self._resident_bytes -= sum(len(data) for _, data in frames) - sum(len(data) for _, data in kept)
+            if kept:
+                self._frames[uidd] = deque(kept, maxlen=size)
+            else:
+                del self._frames[uidd]
+
+    def add(self, uidd: str, timestamp: datetime, data: bytes) -> None:
+        """Append a thumbnail to a camera's ring buffer."""
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+        frames = self._frames.get(uidd)
+        if frames is None:
+            frames = self._frames[uidd] = deque(maxlen=self._size)
+        if frames and frames[-1][1] == data:
+            return
+        if len(frames) == frames.maxlen:
+            self._resident_bytes -= len(frames[0][1])
+        frames.append((timestamp, data))
+        self._resident_bytes += len(data)
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        while self._resident_bytes > self.max_bytes:
+            # Drop the oldest frame across all cameras
+            uidd = min(self._frames, key=lambda key: self._frames[key][0][0])
+            frames = self._frames[uidd]
+            _, data = frames.popleft()
+            self._resident_bytes -= len(data)
+            self._dropped += 1
+            if not frames:
+                del self._frames[uidd]
+
+    def get_frames(self, uidd: str, since: Optional[datetime] = None) -> List[Frame]:
+        """Return a camera's frames, oldest first, optionally only those after ``since``."""
+        frames = list(self._frames.get(uidd, ()))
+        if since is not None:
+            frames = [frame for frame in frames if frame[0] >= since]
+        return frames
+
+    def remove(self, uidd: str) -> None:
+        """Forget a camera's history."""
+        frames = self._frames.pop(uidd, None)
+        if frames:
+            self._resident_bytes -= sum(len(data) for _, data in frames)
+
+    def clear(self) -> None:
+        """Forget all history."""
+        self._frames.clear()
+        self._resident_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return history statistics."""
+        return {
+            "frames_per_camera": self._size,
+            "cameras": len(self._frames),
+            "frames": sum(len(frames) for frames in self._frames.values()),
+            "resident_bytes": self._resident_bytes,
+            "max_bytes": self.max_bytes,
+            "dropped_for_budget": self._dropped,
+        }
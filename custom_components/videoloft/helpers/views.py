@@ -5,14 +5,21 @@ import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, List, Tuple
 
-from aiohttp import web, WSCloseCode
+from aiohttp import web, WSCloseCode, MultipartWriter
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import dt as dt_util
 
 from .api import VideoloftAPI
-from ..const import DOMAIN
+from .device_index import DeviceIndex
+from .image import IMAGE_FORMAT_JPEG, IMAGE_FORMAT_WEBP, content_digest
+from ..const import (
+    AI_SEARCH_PREFETCH_COUNT,
+    DOMAIN,
+    THUMBNAIL_SAVE_DATA_QUALITY,
+    THUMBNAIL_TIMELAPSE_FRAME_MS,
+)
 from homeassistant.components.websocket_api import (
     async_register_command,
     WebSocketCommandHandler,
@@ -34,6 +41,13 @@ def get_entry(hass: HomeAssistant) -> Optional[ConfigEntry]:
     return entries[0] if entries else None
 
 
+def get_device_index(hass: HomeAssistant) -> DeviceIndex:
+    """Retrieve the camera index of the first configured entry."""
+    entry = get_entry(hass)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}) if entry else {}
+    return entry_data.get("device_index") or DeviceIndex()
+
+
 def get_device_data(hass: HomeAssistant, uidd: str) -> Optional[Dict[str, Any]]:
     """Retrieve device data based on UIDD."""
     entry = get_entry(hass)
@@ -41,17 +55,92 @@ def get_device_data(hass: HomeAssistant, uidd: str) -> Optional[Dict[str, Any]]:
         _LOGGER.error("No configuration entry found for domain '%s'.", DOMAIN)
         return None
 
-    cameras_info = hass.data[DOMAIN][entry.entry_id].get("devices", []) # Changed from "devices" dict to "cameras_info" list
-    
-    # Iterate through the flat list to find the matching camera
-    for camera_data in cameras_info:
-        if f"{camera_data['uid']}.{camera_data['id']}" == uidd:
-            return camera_data
+    camera_data = get_device_index(hass).get(uidd)
+    if camera_data is None:
+        _LOGGER.error("Camera with UIDD '%s' not found.", uidd)
+    return camera_data
 
-    _LOGGER.error("Camera with UIDD '%s' not found.", uidd)
+
+def get_coordinator(hass: HomeAssistant):
+    """Retrieve the thumbnail/trigger coordinator of the first configured entry."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and "coordinator" in entry_data:
+            return entry_data["coordinator"]
     return None
 
 
+def _parse_positive_int(value: Optional[str]) -> Optional[int]:
+    """Parse an optional positive integer (size, quality) from a query string."""
+    try:
+        dimension = int(value) if value else None
+    except ValueError:
+        return None
+    return dimension if dimension and dimension > 0 else None
+
+
+def negotiate_image_format(request: web.Request) -> Tuple[str, Optional[int]]:
+    """Pick a thumbnail encoding and quality for a request.
+
+    An explicit ``?format=webp|jpeg`` wins over the ``Accept`` header. JPEGs
+    are only re-quantised when ``?quality=`` is given or the client sends
+    ``Save-Data: on``; otherwise the camera's original JPEG is served.
+    """
+    requested = request.query.get("format", "").lower()
+    if requested in (IMAGE_FORMAT_JPEG, IMAGE_FORMAT_WEBP):
+        image_format = requested
+    elif "image/webp" in request.headers.get("Accept", ""):
+        image_format = IMAGE_FORMAT_WEBP
+    else:
+        image_format = IMAGE_FORMAT_JPEG
+
+    quality = _parse_positive_int(request.query.get("quality"))
+    if quality is not None:
+        quality = min(quality, 95)
+    elif request.headers.get("Save-Data", "").lower() == "on":
+        quality = THUMBNAIL_SAVE_DATA_QUALITY
+    return image_format, quality
+
+
+async def respond_with_thumbnail(
+    request: web.Request,
+    coordinator,
+    uidd: str,
+    data: bytes,
+    digest: str,
+    cache_control: str,
+) -> web.Response:
+    """Serve the negotiated variant of a thumbnail with a precomputed strong ETag.
+
+    The ETag is derived from the cached content hash, so a matching
+    ``If-None-Match`` is answered before any variant is encoded.
+    """
+    image_format, quality = negotiate_image_format(request)
+    width = _parse_positive_int(request.query.get("width"))
+    height = _parse_positive_int(request.query.get("height"))
+    etag = coordinator.get_variant_etag(digest, width, height, image_format, quality)
+    headers = {
+        "Cache-Control": cache_control,
+        "Vary": "Accept, Save-Data",
+        "ETag": etag,
+    }
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers=headers)
+
+    body, content_type = await coordinator.async_get_thumbnail_variant(
+        uidd, data, width, height, image_format, quality
+    )
+    headers["Content-Type"] = content_type
+    return web.Response(body=body, headers=headers)
+
+
+def get_stream_view(hass: HomeAssistant):
+    """Retrieve the registered stream proxy view, if the integration is set up."""
+    entry = get_entry(hass)
+    if not entry:
+        return None
+    return hass.data[DOMAIN].get(entry.entry_id, {}).get("views", {}).get("camera_stream")
+
+
 class VideoloftCamerasView(HomeAssistantView):
     """Handle fetching the list of cameras."""
 
@@ -68,11 +157,9 @@ class VideoloftCamerasView(HomeAssistantView):
         if not entry:
             return web.json_response({"cameras": []})
 
-        cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", []) # Changed from "devices" dict to "cameras_info" list
         cameras = []
         
-        for camera_data in cameras_info:
-            uidd = f"{camera_data['uid']}.{camera_data['id']}"
+        for uidd, camera_data in get_device_index(self.hass).items():
             # Debug logging to see what fields are available
             _LOGGER.debug(f"Camera data for {uidd}: {camera_data}")
             
@@ -89,12 +176,24 @@ class VideoloftCamerasView(HomeAssistantView):
             }
             cameras.append(camera)
 
+        # The panel starts streams right after loading the list, so warm the
+        # proxy's connections to each camera's current Wowza edge now
+        stream_view = get_stream_view(self.hass)
+        if stream_view:
+            stream_view.schedule_prewarm(
+                stream_view.get_known_wowza_host(camera["uidd"]) for camera in cameras
+            )
+
         _LOGGER.info(f"Returning {len(cameras)} cameras to frontend")
         return web.json_response({"cameras": cameras})
 
 
 class VideoloftThumbnailView(HomeAssistantView):
-    """A view that returns the latest thumbnail image for a camera with caching."""
+    """A view that returns the latest thumbnail image for a camera with caching.
+
+    Optional ``width``/``height`` query parameters return a downscaled variant,
+    and the encoding is negotiated with ``negotiate_image_format``.
+    """
 
     url = "/api/videoloft/thumbnail/{uidd}"
     name = "api:videoloft:thumbnail"
@@ -106,9 +205,6 @@ class VideoloftThumbnailView(HomeAssistantView):
     async def get(self, request: web.Request, uidd: str) -> web.Response:
         """Handle the GET request for the thumbnail image with enhanced caching."""
         try:
-            # Check for conditional request headers
-            if_none_match = request.headers.get('If-None-Match')
-            
             # Get coordinator for caching
             coordinator = None
             for entry_id, entry_data in self.hass.data.get(DOMAIN, {}).items():
@@ -119,23 +215,9 @@ class VideoloftThumbnailView(HomeAssistantView):
             thumbnail_data = None
             
             if coordinator:
-                # For immediate display, try to get cached thumbnail (even if slightly stale)
-                thumbnail_data = await coordinator.get_cached_thumbnail_immediate(uidd)
-                
-                if not thumbnail_data:
-                    # If no cached data at all, ensure we get a thumbnail
-                    thumbnail_data = await coordinator.ensure_thumbnail_available(uidd)
-                else:
-                    # We have cached data - start a background refresh if needed
-                    cache_entry = coordinator._thumbnail_cache.get(uidd)
-                    if cache_entry:
-                        cached_time = cache_entry.get("timestamp")
-                        if cached_time:
-                            cache_age = dt_util.utcnow() - cached_time
-                            # If cache is older than 1 minute, trigger background refresh
-                            if cache_age > coordinator._thumbnail_refresh_interval:
-                                # Async background refresh - don't wait for it
-                                self.hass.async_create_task(coordinator.refresh_thumbnail(uidd, force=True))
+                # Serves cached data (even if slightly stale) and revalidates it in the
+                # background; only a camera with nothing cached waits for the fetch
+                thumbnail_data = await coordinator.ensure_thumbnail_available(uidd)
             
             # Fallback to direct API call if coordinator not available
             if not thumbnail_data:
@@ -152,22 +234,21 @@ class VideoloftThumbnailView(HomeAssistantView):
             
             # Ensure we have valid bytes data before returning
             if thumbnail_data and isinstance(thumbnail_data, bytes):
-                # Generate ETag based on content hash
-                import hashlib
-                etag = f'"{hashlib.md5(thumbnail_data).hexdigest()}"'
-                
-                # Check if client has the same version
-                if if_none_match == etag:
-                    return web.Response(status=304)  # Not Modified
-                
-                # Set appropriate cache headers for fast loading
-                headers = {
-                    'Content-Type': 'image/jpeg',
-                    'Cache-Control': 'public, max-age=60, stale-while-revalidate=120',  # Cache for 1 minute, allow stale for 2 minutes
-                    'ETag': etag,
-                    'Last-Modified': dt_util.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
-                }
-                return web.Response(body=thumbnail_data, headers=headers)
+                if coordinator:
+                    # Serve a resized/re-encoded variant matching what the client asked for
+                    return await respond_with_thumbnail(
+                        request,
+                        coordinator,
+                        uidd,
+                        thumbnail_data,
+                        coordinator.get_thumbnail_digest(uidd, thumbnail_data),
+                        "public, max-age=60, stale-while-revalidate=120",  # Cache for 1 minute, allow stale for 2 minutes
+                    )
+                return web.Response(
+                    body=thumbnail_data,
+                    content_type="image/jpeg",
+                    headers={"Cache-Control": "no-cache"},
+                )
             else:
                 _LOGGER.warning(f"No thumbnail data available for {uidd}")
                 return web.Response(status=404, text="Thumbnail not available")
@@ -177,6 +258,237 @@ class VideoloftThumbnailView(HomeAssistantView):
             return web.Response(status=500, text="Internal server error")
 
 
+class VideoloftThumbnailVersionView(HomeAssistantView):
+    """Serve a thumbnail by content hash as an immutable resource.
+
+    ``/api/videoloft/thumbnail/{uidd}/{digest}`` never changes content, so
+    browsers cache it without revalidating. A hash that is no longer current
+    redirects to the current one. Clients learn hashes from the manifest.
+    """
+
+    url = "/api/videoloft/thumbnail/{uidd}/{digest}"
+    name = "api:videoloft:thumbnail_version"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request, uidd: str, digest: str) -> web.Response:
+        """Serve the thumbnail if ``digest`` is current, otherwise redirect."""
+        try:
+            coordinator = get_coordinator(self.hass)
+            if not coordinator:
+                return web.Response(status=404, text="Coordinator not found")
+
+            thumbnail_data = await coordinator.ensure_thumbnail_available(uidd)
+            if not thumbnail_data:
+                return web.Response(status=404, text="Thumbnail not available")
+
+            current = coordinator.get_thumbnail_digest(uidd, thumbnail_data)
+            if current != digest:
+                location = f"/api/videoloft/thumbnail/{uidd}/{current}"
+                if request.query_string:
+                    location = f"{location}?{request.query_string}"
+                return web.Response(
+                    status=302, headers={"Location": location, "Cache-Control": "no-cache"}
+                )
+
+            return await respond_with_thumbnail(
+                request,
+                coordinator,
+                uidd,
+                thumbnail_data,
+                digest,
+                "public, max-age=31536000, immutable",
+            )
+
+        except Exception as e:
+            _LOGGER.error("Error serving thumbnail %s for %s: %s", digest, uidd, e)
+            return web.Response(status=500, text="Internal server error")
+
+
+class VideoloftThumbnailManifestView(HomeAssistantView):
+    """A view that returns the current content hash and URL of each thumbnail.
+
+    Clients poll this small document and only fetch the immutable
+    ``/api/videoloft/thumbnail/{uidd}/{digest}`` URLs whose hash changed.
+    """
+
+    url = "/api/videoloft/thumbnail_manifest"
+    name = "api:videoloft:thumbnail_manifest"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return ``{"thumbnails": {uidd: {hash, url, lastthumb, timestamp}}}``."""
+        coordinator = get_coordinator(self.hass)
+        if not coordinator:
+            return web.json_response({"thumbnails": {}}, status=404)
+
+        uidds = [uidd for uidd in request.query.get("uidds", "").split(",") if uidd]
+        if not uidds:
+            uidds = get_device_index(self.hass).uidds
+
+        manifest = coordinator.get_thumbnail_manifest(uidds)
+        # Polling keeps watched thumbnails fresh; missing ones are fetched for the next poll
+        for uidd in uidds:
+            coordinator.record_thumbnail_view(uidd)
+            if uidd in manifest:
+                coordinator.schedule_refresh_if_stale(uidd)
+            else:
+                self.hass.async_create_task(coordinator.ensure_thumbnail_available(uidd))
+
+        etag = '"{}"'.format(
+            content_digest("|".join(f"{uidd}:{item['hash']}" for uidd, item in sorted(manifest.items())).encode())
+        )
+        headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        return web.json_response({"thumbnails": manifest}, headers=headers)
+
+
+class VideoloftThumbnailBatchView(HomeAssistantView):
+    """A view that returns thumbnails for many cameras in a single response.
+
+    ``?uidds=a,b,c`` selects cameras (all cameras when omitted). The default
+    ``format=multipart`` returns ``multipart/form-data`` with one JPEG part per
+    camera, named by UIDD, so browsers can read it with ``Response.formData()``.
+    ``format=sprite`` returns one composited JPEG and its offset map as JSON in
+    the ``X-Videoloft-Sprite-Map`` header.
+    """
+
+    url = "/api/videoloft/thumbnails"
+    name = "api:videoloft:thumbnails"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Handle the GET request for a batch of thumbnails."""
+        try:
+            coordinator = get_coordinator(self.hass)
+            if not coordinator:
+                return web.Response(status=404, text="Coordinator not found")
+
+            requested = request.query.get("uidds", "")
+            uidds = [uidd for uidd in (part.strip() for part in requested.split(",")) if uidd]
+            if not uidds:
+                uidds = get_device_index(self.hass).uidds
+            # Preserve request order while dropping duplicates
+            uidds = list(dict.fromkeys(uidds))
+
+            headers = {"Cache-Control": "no-cache"}
+
+            if request.query.get("format") == "sprite":
+                sprite = await coordinator.async_get_thumbnail_sprite(uidds)
+                if not sprite:
+                    return web.Response(status=404, text="Thumbnails not available")
+                headers["Content-Type"] = "image/jpeg"
+                headers["X-Videoloft-Sprite-Map"] = json.dumps(sprite["offsets"], separators=(",", ":"))
+                return web.Response(body=sprite["data"], headers=headers)
+
+            thumbnails = await coordinator.async_get_thumbnails(uidds)
+            if not thumbnails:
+                return web.Response(status=404, text="Thumbnails not available")
+
+            writer = MultipartWriter("form-data")
+            for uidd in uidds:
+                if uidd not in thumbnails:
+                    continue
+                part = writer.append(thumbnails[uidd], {"Content-Type": "image/jpeg"})
+                part.set_content_disposition("form-data", name=uidd, filename=f"{uidd}.jpg")
+
+            _LOGGER.debug(f"Returning {len(thumbnails)}/{len(uidds)} thumbnails in one response")
+            return web.Response(body=writer, headers=headers)
+
+        except Exception as e:
+            _LOGGER.error("Error fetching thumbnail batch: %s", e)
+            return web.Response(status=500, text="Internal server error")
+
+
+class VideoloftThumbnailHistoryView(HomeAssistantView):
+    """A view that returns a camera's recent thumbnails as a time-lapse.
+
+    ``?minutes=`` limits the window (default 60). ``format`` selects the
+    output: ``json`` (default) lists the frame timestamps, ``strip`` returns a
+    JPEG grid with its offset map in ``X-Videoloft-Sprite-Map``, ``mjpeg``
+    plays the frames once as ``multipart/x-mixed-replace`` and ``gif`` returns
+    an animated GIF. Requires the thumbnail history option to be enabled.
+    """
+
+    url = "/api/videoloft/thumbnail_history/{uidd}"
+    name = "api:videoloft:thumbnail_history"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request, uidd: str) -> web.StreamResponse:
+        """Handle the GET request for a camera's thumbnail history."""
+        try:
+            coordinator = get_coordinator(self.hass)
+            if not coordinator:
+                return web.Response(status=404, text="Coordinator not found")
+            if not coordinator.thumbnail_history_enabled:
+                return web.Response(status=404, text="Thumbnail history is disabled")
+
+            minutes = _parse_positive_int(request.query.get("minutes")) or 60
+            frames = coordinator.get_thumbnail_history(uidd, dt_util.utcnow() - timedelta(minutes=minutes))
+            output = request.query.get("format", "json")
+
+            if output == "json":
+                return web.json_response({
+                    "uidd": uidd,
+                    "frames": [
+                        {"timestamp": timestamp.isoformat(), "size": len(data)}
+                        for timestamp, data in frames
+                    ],
+                })
+
+            if not frames:
+                return web.Response(status=404, text="No thumbnails recorded in this window")
+
+            headers = {"Cache-Control": "no-cache"}
+
+            if output == "strip":
+                strip, offsets = await coordinator.async_get_history_strip(frames)
+                headers["X-Videoloft-Sprite-Map"] = json.dumps(offsets, separators=(",", ":"))
+                return web.Response(body=strip, content_type="image/jpeg", headers=headers)
+
+            if output == "gif":
+                animation = await coordinator.async_get_history_gif(frames)
+                return web.Response(body=animation, content_type="image/gif", headers=headers)
+
+            if output == "mjpeg":
+                # The frames are already JPEGs, so MJPEG needs no re-encoding
+                response = web.StreamResponse(headers={
+                    **headers,
+                    "Content-Type": "multipart/x-mixed-replace; boundary=frame",
+                })
+                await response.prepare(request)
+                for _, data in frames:
+                    await response.write(
+                        b"--frame\r\nContent-Type: image/jpeg\r\n"
+                        + f"Content-Length: {len(data)}\r\n\r\n".encode()
+                        + data
+                        + b"\r\n"
+                    )
+                    await asyncio.sleep(THUMBNAIL_TIMELAPSE_FRAME_MS / 1000)
+                await response.write_eof()
+                return response
+
+            return web.Response(status=400, text="format must be json, strip, mjpeg or gif")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Error building thumbnail history for %s: %s", uidd, e)
+            return web.Response(status=500, text="Internal server error")
+
+
 class VideoloftEventsView(HomeAssistantView):
     """A view that returns the list of events."""
 
@@ -204,7 +516,7 @@ class VideoloftEventsView(HomeAssistantView):
             return web.json_response({"events": []}, status=500)
 
 class EventThumbnailView(HomeAssistantView):
-    """Serve event thumbnails."""
+    """Serve event thumbnails, negotiating WebP or re-quantised JPEG variants."""
     url = "/api/videoloft/event_thumbnail/{event_id}"
     name = "api:videoloft:event_thumbnail"
     requires_auth = False
@@ -212,19 +524,11 @@ class EventThumbnailView(HomeAssistantView):
     def __init__(self, hass: HomeAssistant):
         """Initialize the view."""
         self.hass = hass
-        self._cache = {}  # Simple in-memory cache
         super().__init__()
 
     async def get(self, request: web.Request, event_id: str) -> web.Response:
         """Handle GET request to serve event thumbnail."""
         try:
-            # Try cache first
-            if event_id in self._cache:
-                return web.Response(
-                    body=self._cache[event_id], 
-                    content_type='image/jpeg'
-                )
-
             # Get coordinator from domain data
             entry = get_entry(self.hass)
             if not entry:
@@ -234,41 +538,30 @@ class EventThumbnailView(HomeAssistantView):
             if not coordinator:
                 raise ValueError("Coordinator not found")
 
-            # Get event info from descriptions
-            descriptions = await coordinator.async_load_descriptions()
-            event_info = descriptions.get(event_id)
-            
-            if not event_info:
-                _LOGGER.warning(f"No event info found for event {event_id}")
+            # The coordinator's event thumbnail cache downloads on a miss
+            cache_entry = await coordinator.async_get_event_thumbnail(event_id)
+            if not cache_entry:
                 return web.Response(status=404)
 
-            logger_server = event_info.get('logger_server')
-            uidd = event_info.get('uidd')
-            
-            if not logger_server or not uidd:
-                _LOGGER.error(f"Missing required event info for {event_id}")
-                return web.Response(status=404)
-
-            # Get API instance from coordinator instead
-            api = coordinator.api  # Changed this line
-            if not api:
-                raise ValueError("API not initialized")
+            image_format, quality = negotiate_image_format(request)
+            width = _parse_positive_int(request.query.get("width"))
+            height = _parse_positive_int(request.query.get("height"))
+            # Event images never change, so the hash-derived ETag is stable
+            headers = {
+                "Vary": "Accept, Save-Data",
+                "ETag": coordinator.get_variant_etag(cache_entry["digest"], width, height, image_format, quality),
+            }
+            if request.headers.get("If-None-Match") == headers["ETag"]:
+                return web.Response(status=304, headers=headers)
 
-            # Download thumbnail
-            image_data = await api.download_event_thumbnail(
-                logger_server, uidd, event_id
+            body, content_type = await coordinator.async_get_event_thumbnail_variant(
+                event_id, cache_entry, width, height, image_format, quality
             )
 
-            if not image_data:
-                _LOGGER.warning(f"No thumbnail available for event {event_id}")
-                return web.Response(status=404)
-
-            # Cache the thumbnail
-            self._cache[event_id] = image_data
-
             return web.Response(
-                body=image_data,
-                content_type='image/jpeg'
+                body=body,
+                content_type=content_type,
+                headers=headers,
             )
 
         except ValueError as e:
@@ -618,11 +911,7 @@ class ProcessEventsView(HomeAssistantView):
             if not selected_cameras:
                 # If no specific cameras are selected, process all available cameras
                 # The 'devices' now directly contains the list of camera objects
-                cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", [])
-                selected_cameras = [
-                    f"{camera_data['uid']}.{camera_data['id']}"
-                    for camera_data in cameras_info
-                ]
+                selected_cameras = get_device_index(self.hass).uidds
 
             if not selected_cameras:
                 _LOGGER.warning("No cameras available to process events.")
@@ -720,8 +1009,6 @@ class SearchEventsView(HomeAssistantView):
 
             descriptions = await coordinator.async_load_descriptions()
             matching_events = []
-            # Reuse a single thumbnail token per request
-            thumb_token = await self.get_thumbnail_token(coordinator)
 
             for event_id, info in descriptions.items():
                 description = info.get("description", "")
@@ -748,6 +1035,11 @@ class SearchEventsView(HomeAssistantView):
             # Sort by relevance score then timestamp
             matching_events.sort(key=lambda x: (-x["relevance"], -x["startt"]))
 
+            self.hass.async_create_task(coordinator.async_prefetch_event_thumbnails([
+                (event["event_id"], descriptions[event["event_id"]])
+                for event in matching_events[:AI_SEARCH_PREFETCH_COUNT]
+            ]))
+
             _LOGGER.debug(
                 "Search query '%s' found %d relevant matches", 
                 query, 
@@ -814,8 +1106,7 @@ class AISearchProcessView(HomeAssistantView):
                 cameras_to_process = [selected_camera]
             else:
                 # Get all cameras
-                cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", [])
-                cameras_to_process = [f"{cam['uid']}.{cam['id']}" for cam in cameras_info]
+                cameras_to_process = get_device_index(self.hass).uidds
             
             if not cameras_to_process:
                 return web.json_response(
@@ -915,33 +1206,67 @@ class VideoloftThumbnailStatsView(HomeAssistantView):
             if not coordinator:
                 return web.json_response({"status": "error", "message": "Coordinator not found"}, status=404)
             
-            refreshed_count = 0
-            
-            if uidds:
-                # Refresh specific cameras
-                for uidd in uidds:
-                    result = await coordinator.refresh_thumbnail(uidd, force=True)
-                    if result:
-                        refreshed_count += 1
-            else:
-                # Refresh all cameras
-                devices = self.hass.data[DOMAIN][get_entry(self.hass).entry_id].get("devices", [])
-                for device in devices:
-                    uidd = f"{device['uid']}.{device['id']}"
-                    result = await coordinator.refresh_thumbnail(uidd, force=True)
-                    if result:
-                        refreshed_count += 1
+            # Runs as a bounded-concurrency background job; a duplicate request joins the running one
+            job = coordinator.async_start_bulk_refresh(uidds)
             
             return web.json_response({
                 "status": "success", 
-                "message": f"Refreshed {refreshed_count} thumbnails"
-            })
+                "message": f"Refreshing {job['total']} thumbnails",
+                "job_id": job["job_id"],
+                "status_url": f"/api/videoloft/thumbnail_refresh/{job['job_id']}",
+            }, status=202)
             
         except Exception as e:
             _LOGGER.error("Error refreshing thumbnails: %s", e)
             return web.json_response({"status": "error", "message": str(e)}, status=500)
 
 
+class VideoloftThumbnailRefreshJobView(HomeAssistantView):
+    """A view that reports the progress of a bulk thumbnail refresh job."""
+
+    url = "/api/videoloft/thumbnail_refresh/{job_id}"
+    name = "api:videoloft:thumbnail_refresh"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request, job_id: str) -> web.Response:
+        """Get the progress of a bulk refresh job."""
+        coordinator = get_coordinator(self.hass)
+        if not coordinator:
+            return web.json_response({"status": "error", "message": "Coordinator not found"}, status=404)
+
+        job = coordinator.get_refresh_job(job_id)
+        if not job:
+            return web.json_response({"status": "error", "message": "Unknown job"}, status=404)
+        return web.json_response({"status": "success", "job": job})
+
+
+class VideoloftStreamPoolStatsView(HomeAssistantView):
+    """A view that returns stream proxy connection pool statistics."""
+
+    url = "/api/videoloft/stream_pool_stats"
+    name = "api:videoloft:stream_pool_stats"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Get connection pool occupancy for the stream proxy."""
+        try:
+            stream_view = get_stream_view(self.hass)
+            if not stream_view:
+                return web.json_response({"status": "error", "message": "Stream proxy not found"}, status=404)
+
+            return web.json_response({"status": "success", "stats": stream_view.get_pool_stats()})
+
+        except Exception as e:
+            _LOGGER.error("Error getting stream pool stats: %s", e)
+            return web.json_response({"status": "error", "message": str(e)}, status=500)
+
+
 class VideoloftCameraDiagnosticView(HomeAssistantView):
     """A view that provides camera diagnostic information."""
 
@@ -991,7 +1316,7 @@ class VideoloftCameraDiagnosticView(HomeAssistantView):
                 }
             
             if coordinator:
-                cache_entry = coordinator._thumbnail_cache.get(uidd)
+                cache_entry = coordinator._thumbnail_cache.peek(uidd)
                 if cache_entry:
                     diagnostic_info["cache_info"] = {
                         "cached": True,
@@ -1095,8 +1420,7 @@ class AIEventPreviewView(HomeAssistantView):
                 cameras_to_process = [selected_camera]
             else:
                 # Get all cameras
-                cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", [])
-                cameras_to_process = [f"{cam['uid']}.{cam['id']}" for cam in cameras_info]
+                cameras_to_process = get_device_index(self.hass).uidds
             
             # Use enhanced cost estimation
             result = await coordinator.gemini_api.estimate_processing_cost(
@@ -1222,8 +1546,7 @@ class AIAnalysisView(HomeAssistantView):
                 cameras_to_process = [camera]
             else:
                 # Get all cameras
-                cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", [])
-                cameras_to_process = [f"{cam['uid']}.{cam['id']}" for cam in cameras_info]
+                cameras_to_process = get_device_index(self.hass).uidds
 
             if not cameras_to_process:
                 _LOGGER.warning("No cameras found to process")
@@ -1285,15 +1608,6 @@ class AISearchView(HomeAssistantView):
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
 
-    async def get_thumbnail_token(self, coordinator):
-        """Get authentication token for thumbnail URLs."""
-        try:
-            if hasattr(coordinator, 'api') and coordinator.api:
-                return await coordinator.api.get_token()
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get thumbnail token: {e}")
-        return ""
-
     async def post(self, request: web.Request) -> web.Response:
         """Handle POST request to search events using stored analysis data."""
         try:
@@ -1329,9 +1643,7 @@ class AISearchView(HomeAssistantView):
             
             matching_events = []
 
-            # Ensure we have a valid thumbnail token for constructing URLs
-            thumb_token = await self.get_thumbnail_token(coordinator)
-
+            device_index = get_device_index(self.hass)
             query_lower = query.lower()
             for event_id, info in descriptions.items():
                 description = info.get("description", "")
@@ -1342,14 +1654,7 @@ class AISearchView(HomeAssistantView):
                 if query_lower in description.lower():
                     # Get camera name
                     camera_uidd = info.get('uidd', '')
-                    camera_name = "Unknown Camera"
-                    
-                    # Try to find camera name from devices
-                    cameras_info = self.hass.data[DOMAIN][entry.entry_id].get("devices", [])
-                    for camera_data in cameras_info:
-                        if f"{camera_data['uid']}.{camera_data['id']}" == camera_uidd:
-                            camera_name = camera_data.get("name", camera_data.get("phonename", f"Camera {camera_uidd}"))
-                            break
+                    camera_name = device_index.get_name(camera_uidd, "Unknown Camera")
 
                     # Create event result
                     event_result = {
@@ -1359,13 +1664,20 @@ class AISearchView(HomeAssistantView):
                         "timestamp": info.get("startt"),
                         "confidence": 0.8,  # Static confidence for now
                         "url": f"https://app.videoloft.com/cameras/{camera_uidd}?uidd={camera_uidd}&eventId={event_id}&logger={info.get('logger_server', '')}&startTime={info.get('startt', 0)}",
-                        "thumbnail": f"https://{info.get('logger_server', '')}/alertthumb/{camera_uidd}/{event_id}/{thumb_token}"
+                        # Served from the local event thumbnail cache rather than the logger server
+                        "thumbnail": f"/api/videoloft/event_thumbnail/{event_id}"
                     }
                     matching_events.append(event_result)
 
             # Sort by timestamp (newest first)
             matching_events.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
 
+            # Warm the cache for the first screen of results while the response is sent
+            self.hass.async_create_task(coordinator.async_prefetch_event_thumbnails([
+                (event["event_id"], descriptions[event["event_id"]])
+                for event in matching_events[:AI_SEARCH_PREFETCH_COUNT]
+            ]))
+
             _LOGGER.debug(f"Found {len(matching_events)} matching events for query '{query}'")
 
             return web.json_response({
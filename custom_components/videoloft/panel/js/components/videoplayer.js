@@ -56,7 +56,6 @@ class VideoloftPlayer {
           <div class="video-container">
             <img id="thumb-${camera.uidd}" 
                  class="thumbnail" 
-                 src="/api/videoloft/thumbnail/${camera.uidd}?t=${Date.now()}" 
                  alt="Loading thumbnail..." 
                  style="display: block;" />
             <div class="loading-spinner" id="spinner-${camera.uidd}" style="display: none;"></div>
@@ -64,7 +63,6 @@ class VideoloftPlayer {
                    playsinline 
                    muted 
                    preload="none"
-                   poster="/api/videoloft/thumbnail/${camera.uidd}?t=${Date.now()}"
                    style="display: none; position: absolute; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover;"></video>
             
             <div class="camera-header">
@@ -87,20 +85,55 @@ class VideoloftPlayer {
       .join("");
     
     this.setupFullscreenHandlers();
+    this.loadThumbnailsBatch();
     this.setupThumbnailRefresh();
     this.setupOverlayToggle();
   }
 
+  async loadThumbnailsBatch() {
+    // Fetch every camera's thumbnail in one multipart request instead of one per camera
+    const uidds = this.cameras.map((camera) => camera.uidd);
+    const loaded = new Set();
+    try {
+      const response = await fetch(`/api/videoloft/thumbnails?uidds=${encodeURIComponent(uidds.join(","))}`);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const parts = await response.formData();
+      for (const [uidd, file] of parts.entries()) {
+        if (file instanceof Blob) {
+          this.setThumbnailSource(uidd, URL.createObjectURL(file));
+          loaded.add(uidd);
+        }
+      }
+    } catch (error) {
+      console.warn("Batched thumbnail load failed, falling back to per-camera requests:", error);
+    }
+    // Anything missing from the batch is requested individually
+    uidds.filter((uidd) => !loaded.has(uidd)).forEach((uidd) => this.refreshThumbnail(uidd));
+  }
+
+  setThumbnailSource(uidd, src) {
+    const thumbnail = document.getElementById(`thumb-${uidd}`);
+    const videoElement = document.getElementById(`video-${uidd}`);
+    if (thumbnail) {
+      if (thumbnail.src && thumbnail.src.startsWith("blob:")) {
+        URL.revokeObjectURL(thumbnail.src);
+      }
+      thumbnail.src = src;
+    }
+    if (videoElement) {
+      videoElement.poster = src;
+    }
+  }
+
   setupThumbnailRefresh() {
-    // Set up thumbnail refresh for all cameras
+    // Poll the small hash manifest; only thumbnails whose hash changed are
+    // fetched, from immutable URLs the browser never has to revalidate
+    this.thumbnailHashes = {};
+    setInterval(() => this.refreshThumbnailsFromManifest(), 30000);
+
     this.cameras.forEach((camera) => {
       const thumbnail = document.getElementById(`thumb-${camera.uidd}`);
       if (thumbnail) {
-        // Refresh thumbnail every 2 minutes
-        setInterval(() => {
-          this.refreshThumbnail(camera.uidd);
-        }, 120000);
-        
         // Handle thumbnail loading errors
         thumbnail.onerror = () => {
           console.warn(`Failed to load thumbnail for ${camera.name}, retrying...`);
@@ -110,16 +143,28 @@ class VideoloftPlayer {
     });
   }
 
-  refreshThumbnail(uidd) {
-    const thumbnail = document.getElementById(`thumb-${uidd}`);
-    if (thumbnail) {
-      // Add timestamp to bypass cache and get fresh thumbnail
-      const currentSrc = thumbnail.src;
-      const baseSrc = currentSrc.split('?')[0];
-      thumbnail.src = `${baseSrc}?t=${Date.now()}`;
+  async refreshThumbnailsFromManifest() {
+    const uidds = this.cameras.map((camera) => camera.uidd);
+    try {
+      const response = await fetch(`/api/videoloft/thumbnail_manifest?uidds=${encodeURIComponent(uidds.join(","))}`);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const { thumbnails } = await response.json();
+      Object.entries(thumbnails).forEach(([uidd, entry]) => {
+        if (this.thumbnailHashes[uidd] !== entry.hash) {
+          this.thumbnailHashes[uidd] = entry.hash;
+          this.setThumbnailSource(uidd, entry.url);
+        }
+      });
+    } catch (error) {
+      console.warn("Thumbnail manifest poll failed:", error);
     }
   }
 
+  refreshThumbnail(uidd) {
+    // Add timestamp to bypass cache and get fresh thumbnail
+    this.setThumbnailSource(uidd, `/api/videoloft/thumbnail/${uidd}?t=${Date.now()}`);
+  }
+
   setupFullscreenHandlers() {
     this.cameras.forEach((camera) => {
       const container = document.getElementById(`card-${camera.uidd}`);
@@ -10,6 +10,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
+from .helpers.entity import VideoloftDeviceEntity
+from .helpers.status_coordinator import VideoloftStatusCoordinator
 from .helpers.device_info import create_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,35 +27,48 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up VideLoft select entities."""
-    devices = hass.data[DOMAIN][entry.entry_id]["devices"]
-    api = hass.data[DOMAIN][entry.entry_id]["api"]
-    
-    entities = []
-    for device_data in devices:
-        uidd = f"{device_data['uid']}.{device_data['id']}"
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: VideoloftStatusCoordinator = entry_data["status_coordinator"]
+    api = entry_data["api"]
+
+    def _create_entities(uidd: str, device_data: Dict[str, Any]) -> List[SelectEntity]:
+        entities = []
         
         # Add analytics scheme selector if analytics is enabled
         if device_data.get("analyticsEnabled", 0):
-            entities.append(VideoloftAnalyticsSchemeSelect(uidd, device_data, api))
+            entities.append(VideoloftAnalyticsSchemeSelect(coordinator, uidd, device_data, api))
         
         # Add video codec selector (informational/future use)
-        entities.append(VideoloftVideoCodecSelect(uidd, device_data, api))
+        entities.append(VideoloftVideoCodecSelect(coordinator, uidd, device_data, api))
+        return entities
+    
+    entities = []
+    for uidd, device_data in entry_data["device_index"].items():
+        entities.extend(_create_entities(uidd, device_data))
 
     if entities:
         async_add_entities(entities)
 
+    # Cameras added to the account later get their entities without a reload
+    entry.async_on_unload(
+        entry_data["inventory"].async_add_camera_listener(
+            lambda uidd, device_data: async_add_entities(_create_entities(uidd, device_data))
+        )
+    )
+
 # ----------------------------------------------------------
 # BASE SELECT ENTITY CLASS
 # ----------------------------------------------------------
 
 
-class VideoloftSelectBase(SelectEntity):
+class VideoloftSelectBase(VideoloftDeviceEntity, SelectEntity):
     """Base class for VideLoft select entities."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api, select_type: str) -> None:
+    def __init__(
+        self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api, select_type: str
+    ) -> None:
         """Initialize the select entity."""
-        self.uidd = uidd
-        self.device_data = device_data
+        super().__init__(coordinator, uidd, device_data)
         self.api = api
         self.select_type = select_type
         
@@ -62,21 +77,19 @@ class VideoloftSelectBase(SelectEntity):
         self._attr_device_info = create_device_info(uidd, device_data)
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            "device_id": self.uidd,
-            "select_type": self.select_type,
-        }
+        attrs = super()._build_attributes()
+        attrs["select_type"] = self.select_type
+        return attrs
 
 
 class VideoloftAnalyticsSchemeSelect(VideoloftSelectBase):
     """Select entity for analytics scheme."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the analytics scheme selector."""
-        super().__init__(uidd, device_data, api, "analytics_scheme")
+        super().__init__(coordinator, uidd, device_data, api, "analytics_scheme")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Analytics Scheme"
@@ -111,9 +124,9 @@ class VideoloftAnalyticsSchemeSelect(VideoloftSelectBase):
 class VideoloftVideoCodecSelect(VideoloftSelectBase):
     """Select entity for video codec (informational)."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the video codec selector."""
-        super().__init__(uidd, device_data, api, "video_codec")
+        super().__init__(coordinator, uidd, device_data, api, "video_codec")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Video Codec"
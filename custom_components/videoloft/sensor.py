@@ -8,6 +8,7 @@ from datetime import timedelta, datetime, timezone
 from typing import Any, Dict, List, Optional
 import asyncio
 import json
+import time
 import aiohttp
 
 from homeassistant.helpers.storage import Store
@@ -15,17 +16,20 @@ from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySen
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import PERCENTAGE
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
-    UpdateFailed,
 )
 from homeassistant.helpers import storage
 from homeassistant.util import dt as dt_util
 
 from .helpers.api import VideoloftAPI
+from .helpers.entity import VideoloftDeviceEntity
+from .helpers.lpr_matcher import get_lpr_matcher, set_lpr_triggers
+from .helpers.status_coordinator import VideoloftStatusCoordinator
 from .const import (
     DOMAIN,
     ICON_CAMERA,
@@ -45,7 +49,10 @@ from .const import (
     ATTR_RECORDING_URL,
     DEFAULT_POLL_INTERVAL,
     LOOKBACK_PERIOD_HOURS,
-    LPR_TRIGGER_STORAGE_KEY,
+    LPR_MAX_POLL_INTERVAL,
+    LPR_MIN_POLL_INTERVAL,
+    LPR_SEEN_DETECTION_HISTORY,
+    STATUS_FLAP_COUNT_WINDOW,
     LPR_STORAGE_VERSION,
     LPR_STORAGE_KEY,
 )
@@ -73,34 +80,12 @@ async def async_setup_entry(
         _LOGGER.error("Entry data not found for %s", entry.entry_id)
         return
         
-    api: VideoloftAPI = hass.data[DOMAIN][entry.entry_id]["api"]
-    devices: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]["devices"]
-
-    # Set up DataUpdateCoordinator for Camera Status Sensors
-    async def async_update_status_data():
-        """Fetch updated device info from the Videoloft API."""
-        try:
-            cameras_info = await api.get_cameras_info()
-            if not cameras_info: # Now expects a list, not a dict with "result"
-                raise UpdateFailed("Invalid camera information received.")
-            return cameras_info
-        except Exception as e:
-            _LOGGER.error(f"Error fetching camera info: {e}")
-            raise UpdateFailed(f"Error fetching camera info: {e}")
-
-    status_coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="videoloft_status_sensors",
-        update_method=async_update_status_data,
-        update_interval=timedelta(hours=1),  # Reduced from 5 minutes to 1 hour
-    )
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    # Camera info is kept current by the camera inventory, status by the status coordinator
+    status_coordinator: VideoloftStatusCoordinator = entry_data["status_coordinator"]
 
     # Set up DataUpdateCoordinator for LPR Sensors
     lpr_coordinator = LPRUpdateCoordinator(hass, entry)
-
-    # Fetch initial data for both coordinators
-    await status_coordinator.async_config_entry_first_refresh()
     await lpr_coordinator.async_config_entry_first_refresh()
 
     # Initialize sensor entities
@@ -108,11 +93,8 @@ async def async_setup_entry(
     lpr_entities = []
 
     # Create Status Sensors for each camera
-    # Iterate directly over the list of camera objects
-    for device_data in status_coordinator.data:
-        uidd = f"{device_data['uid']}.{device_data['id']}"
-        status_sensor = VideoloftStatusSensor(status_coordinator, uidd, device_data)
-        status_entities.append(status_sensor)
+    for uidd, device_data in entry_data["device_index"].items():
+        status_entities.extend(_create_camera_sensors(status_coordinator, uidd, device_data))
 
     # Create LPR Sensors (one per integration entry)
     lpr_sensor = VideoloftLPRSensor(lpr_coordinator, entry)
@@ -121,6 +103,15 @@ async def async_setup_entry(
     # Add all sensors to Home Assistant
     async_add_entities(status_entities + lpr_entities)
 
+    # Cameras added to the account later get their sensors without a reload
+    entry.async_on_unload(
+        entry_data["inventory"].async_add_camera_listener(
+            lambda uidd, device_data: async_add_entities(
+                _create_camera_sensors(status_coordinator, uidd, device_data)
+            )
+        )
+    )
+
 
 class LPRUpdateCoordinator(DataUpdateCoordinator):
     """Coordinator to manage LPR data updates."""
@@ -137,6 +128,10 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
         self.matched_event: Optional[Dict[str, Any]] = None
         self._clear_task: Optional[asyncio.Task] = None  # Initialize the clear task
         self._processed_vehicle_ids: List[str] = []
+        # Every detection ID returned so far, matched or not, oldest first; drives activity
+        self._seen_vehicle_ids: Dict[str, None] = {}
+        # "idle" (no triggers), "quiet" (no detections), "active" or "error"; drives the poll interval
+        self._poll_activity = "idle"
         self._store = storage.Store(
             hass,
             LPR_STORAGE_VERSION,
@@ -147,13 +142,13 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
         """Load triggers from persistent storage."""
         data = await self._store.async_load()
         if data:
-            self.hass.data[DOMAIN][self.entry.entry_id]["lpr_triggers"] = data
+            set_lpr_triggers(self.hass.data[DOMAIN][self.entry.entry_id], data)
         return data or []
 
     async def async_save_triggers(self, triggers):
         """Save triggers to persistent storage."""
         await self._store.async_save(triggers)
-        self.hass.data[DOMAIN][self.entry.entry_id]["lpr_triggers"] = triggers
+        set_lpr_triggers(self.hass.data[DOMAIN][self.entry.entry_id], triggers)
 
     def _generate_lpr_recording_url(self, license_plate: str, timestamp: int, camera_uidd: str) -> str:
         """Generate the recording URL for LPR detection notifications."""
@@ -189,27 +184,38 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
         self.async_set_updated_data(self.matched_event)  # Update the sensor
         _LOGGER.debug("Cleared matched event state after delay")
 
+    def _adapt_poll_interval(self) -> None:
+        """Poll quickly while vehicles are being detected and back off when quiet."""
+        current = self.update_interval.total_seconds()
+        if self._poll_activity == "active":
+            seconds = LPR_MIN_POLL_INTERVAL
+        elif self._poll_activity in ("quiet", "error"):
+            # A failed poll says nothing about activity, so only back off one step
+            seconds = min(max(current * 1.5, DEFAULT_POLL_INTERVAL), LPR_MAX_POLL_INTERVAL)
+        else:
+            seconds = LPR_MAX_POLL_INTERVAL
+        if seconds != current:
+            _LOGGER.debug(f"LPR poll interval now {seconds:.0f}s ({self._poll_activity})")
+            self.update_interval = timedelta(seconds=seconds)
+
     async def async_update_lpr(self):
         """Fetch LPR events and check against triggers."""
+        self._poll_activity = "idle"
         try:
             _LOGGER.info("Starting Videoloft vehicle event monitoring.")
             api: VideoloftAPI = self.hass.data[DOMAIN][self.entry.entry_id]["api"]
 
-            # Get LPR triggers
-            lpr_triggers = self.hass.data[DOMAIN][self.entry.entry_id].get(
-                LPR_TRIGGER_STORAGE_KEY, []
-            )
-            if not lpr_triggers:
-                _LOGGER.info("No LPR triggers defined.")
+            # Get the compiled LPR trigger matcher
+            matcher = get_lpr_matcher(self.hass.data[DOMAIN][self.entry.entry_id])
+            if not matcher:
+                _LOGGER.info("No enabled LPR triggers defined.")
                 self.matched_event = None
                 return
 
-            # Get all unique camera UIDs from triggers
-            camera_uids = list(set(trigger["uidd"] for trigger in lpr_triggers if "uidd" in trigger))
-            if not camera_uids:
-                _LOGGER.info("No camera UIDs found in LPR triggers.")
-                self.matched_event = None
-                return
+            self._poll_activity = "quiet"
+
+            # Cameras with enabled triggers
+            camera_uids = list(matcher.uidds)
 
             # Calculate start time for the last 5 minutes
             start_time_ms = int((datetime.now() - timedelta(minutes=5)).timestamp() * 1000)
@@ -224,6 +230,15 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
                 self.matched_event = None
                 return
 
+            # Only vehicles not returned by an earlier poll count as activity
+            for detection in lpr_event_data:
+                vehicle_id = detection.get("vehicleId")
+                if vehicle_id and vehicle_id not in self._seen_vehicle_ids:
+                    self._poll_activity = "active"
+                    self._seen_vehicle_ids[vehicle_id] = None
+            while len(self._seen_vehicle_ids) > LPR_SEEN_DETECTION_HISTORY:
+                del self._seen_vehicle_ids[next(iter(self._seen_vehicle_ids))]
+
             # Process each detection
             for detection in lpr_event_data:
                 vehicle_id = detection.get("vehicleId")
@@ -234,88 +249,70 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
 
                 if lpr_info:
                     _LOGGER.info(f"Vehicle event detected: {lpr_info}")
-                    # Process matches...
-                    for trigger in lpr_triggers:
-                        vehicle_data = lpr_info
-                        matches = False  # Reset matches for each trigger
-
-                        def normalize(value):
-                            return value.strip().lower() if isinstance(value, str) else value
-
-                        # Check license plate
-                        if trigger.get("license_plate"):
-                            if normalize(trigger["license_plate"]) == normalize(vehicle_data.get("license_plate", "")):
-                                matches = True
-
-                        # If no license plate match, check make, model, and color
-                        if not matches:
-                            make_trigger = normalize(trigger.get("make", ""))
-                            model_trigger = normalize(trigger.get("model", ""))
-                            color_trigger = normalize(trigger.get("color", ""))
-                            if make_trigger and model_trigger and color_trigger:
-                                if (make_trigger == normalize(vehicle_data.get("make", "")) and
-                                    model_trigger == normalize(vehicle_data.get("model", "")) and
-                                    color_trigger == normalize(vehicle_data.get("color", ""))):
-                                    matches = True
-
-                        if matches:
-                            # Generate the recording URL using detection data
-                            recording_url = self._generate_lpr_recording_url(
-                                license_plate=vehicle_data.get("license_plate", ""),
-                                timestamp=vehicle_data.get("timestamp", 0),
-                                camera_uidd=trigger["uidd"]
-                            )
+                    # Match against the triggers for the detecting camera
+                    vehicle_data = lpr_info
+                    detection_uidd = (
+                        f"{detection['uid']}.{detection['deviceId']}"
+                        if detection.get("uid") and detection.get("deviceId")
+                        else None
+                    )
+                    trigger = matcher.match(vehicle_data, detection_uidd)
+                    if trigger:
+                        # Generate the recording URL using detection data
+                        recording_url = self._generate_lpr_recording_url(
+                            license_plate=vehicle_data.get("license_plate", ""),
+                            timestamp=vehicle_data.get("timestamp", 0),
+                            camera_uidd=trigger["uidd"]
+                        )
                             
-                            # Store the matched event details
-                            self.matched_event = {
-                                "license_plate": vehicle_data.get("license_plate", ""),
-                                "make": vehicle_data.get("make", ""),
-                                "model": vehicle_data.get("model", ""),
-                                "color": vehicle_data.get("color", ""),
-                                "timestamp": vehicle_data.get("timestamp"),
-                                "alertid": vehicle_data.get("alertid"),
-                                "direction": vehicle_data.get("direction", "unknown"),
-                                "recording_url": recording_url
-                            }
-                            self.async_set_updated_data(self.matched_event)
-                            _LOGGER.info(f"LPR trigger match found! Trigger: {trigger}")
-                            _LOGGER.info(f"Generated notification with URL: {recording_url}")
-
-                            # Fetch and save the LPR event thumbnail
-                            if detection.get("uid") and detection.get("deviceId") and detection.get("stillTimeMs") and detection.get("vehicleId"):
-                                thumbnail_image = await api.get_lpr_event_thumbnail(
-                                    str(detection["uid"]),
-                                    str(detection["deviceId"]),
-                                    str(detection["stillTimeMs"]),
-                                    str(detection["vehicleId"])
-                                )
-                                if thumbnail_image:
-                                    thumbnail_filename = "/config/www/lpr.jpg"
-                                    with open(thumbnail_filename, "wb") as f:
-                                        f.write(thumbnail_image)
-                                    _LOGGER.info(f"LPR event thumbnail saved to {thumbnail_filename}")
-                                    self.matched_event["lpr_thumbnail_path"] = thumbnail_filename
-                                else:
-                                    _LOGGER.error(f"Failed to fetch LPR event thumbnail for event {detection.get('eventId')}")
+                        # Store the matched event details
+                        self.matched_event = {
+                            "license_plate": vehicle_data.get("license_plate", ""),
+                            "make": vehicle_data.get("make", ""),
+                            "model": vehicle_data.get("model", ""),
+                            "color": vehicle_data.get("color", ""),
+                            "timestamp": vehicle_data.get("timestamp"),
+                            "alertid": vehicle_data.get("alertid"),
+                            "direction": vehicle_data.get("direction", "unknown"),
+                            "recording_url": recording_url
+                        }
+                        self.async_set_updated_data(self.matched_event)
+                        _LOGGER.info(f"LPR trigger match found! Trigger: {trigger}")
+                        _LOGGER.info(f"Generated notification with URL: {recording_url}")
+
+                        # Fetch and save the LPR event thumbnail
+                        if detection.get("uid") and detection.get("deviceId") and detection.get("stillTimeMs") and detection.get("vehicleId"):
+                            thumbnail_image = await api.get_lpr_event_thumbnail(
+                                str(detection["uid"]),
+                                str(detection["deviceId"]),
+                                str(detection["stillTimeMs"]),
+                                str(detection["vehicleId"])
+                            )
+                            if thumbnail_image:
+                                thumbnail_filename = "/config/www/lpr.jpg"
+                                with open(thumbnail_filename, "wb") as f:
+                                    f.write(thumbnail_image)
+                                _LOGGER.info(f"LPR event thumbnail saved to {thumbnail_filename}")
+                                self.matched_event["lpr_thumbnail_path"] = thumbnail_filename
                             else:
-                                _LOGGER.error(f"Missing data required to fetch LPR event thumbnail for event {detection.get('eventId')}")
-
-                            # Cancel any existing clear task and schedule clearing of the matched event state
-                            if self._clear_task and not self._clear_task.done():
-                                self._clear_task.cancel()
-                                try:
-                                    await self._clear_task
-                                except asyncio.CancelledError:
-                                    pass  # Expected when canceling
-                            self._clear_task = self.hass.loop.create_task(self.clear_matched_event(delay=10))
-
-                            # Add vehicleId to processed list and limit size
-                            if vehicle_id:
-                                self._processed_vehicle_ids.append(vehicle_id)
-                                if len(self._processed_vehicle_ids) > 100:
-                                    self._processed_vehicle_ids.pop(0)
-
-                            break  # Exit trigger loop after match
+                                _LOGGER.error(f"Failed to fetch LPR event thumbnail for event {detection.get('eventId')}")
+                        else:
+                            _LOGGER.error(f"Missing data required to fetch LPR event thumbnail for event {detection.get('eventId')}")
+
+                        # Cancel any existing clear task and schedule clearing of the matched event state
+                        if self._clear_task and not self._clear_task.done():
+                            self._clear_task.cancel()
+                            try:
+                                await self._clear_task
+                            except asyncio.CancelledError:
+                                pass  # Expected when canceling
+                        self._clear_task = self.hass.loop.create_task(self.clear_matched_event(delay=10))
+
+                        # Add vehicleId to processed list and limit size
+                        if vehicle_id:
+                            self._processed_vehicle_ids.append(vehicle_id)
+                            if len(self._processed_vehicle_ids) > 100:
+                                self._processed_vehicle_ids.pop(0)
 
             # If no match found after processing all detections, clear the matched event
             if not self.matched_event:
@@ -325,8 +322,11 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error(f"Error in LPR update: {e}")
             self.matched_event = None
+            self._poll_activity = "error"
             import traceback
             _LOGGER.error(f"Traceback: {traceback.format_exc()}")
+        finally:
+            self._adapt_poll_interval()
 
     async def async_cleanup(self):
         """Clean up coordinator resources."""
@@ -344,6 +344,7 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
             # Clear state
             self.matched_event = None
             self._processed_vehicle_ids = []
+            self._seen_vehicle_ids.clear()
             
             _LOGGER.debug("LPR coordinator cleanup completed")
             
@@ -354,23 +355,23 @@ class LPRUpdateCoordinator(DataUpdateCoordinator):
 # SENSOR ENTITY CLASSES
 # ----------------------------------------------------------
 
-class VideoloftStatusSensor(CoordinatorEntity, SensorEntity):
+class VideoloftStatusSensor(VideoloftDeviceEntity, SensorEntity):
     """Representation of a Videoloft status sensor."""
 
+    # High-cardinality values that would otherwise add a recorder row per thumbnail
+    _unrecorded_attributes = frozenset({"uptime", "motion_score", "motion_updated"})
+
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: VideoloftStatusCoordinator,
         uidd: str,
         device_data: Dict[str, Any],
     ) -> None:
         """Initialize the status sensor."""
-        super().__init__(coordinator)
-        self.uidd = uidd
-        self.device_data = device_data
+        super().__init__(coordinator, uidd, device_data)
         self._attr_name = f"{device_data.get('phonename', 'Camera')} Status"
         self._attr_unique_id = f"videoloft_status_{uidd}"
         self._attr_icon = ICON_CAMERA
-        self.stream_start_time: Optional[datetime] = None  # Track the start time of the stream
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, uidd)},
@@ -387,42 +388,140 @@ class VideoloftStatusSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes for the sensor."""
-        attributes = {
-            "model": self.device_data.get("model"),
-            "resolution": self.device_data.get("recordingResolution"),
-            "mac_address": self.device_data.get("macAddress"),
-            "cloud_recording": self.device_data.get("cloudRecordingEnabled"),
-            "ptz_capabilities": self.device_data.get("ptzEnabled"),
-            "audio_enabled": self.device_data.get("audioEnabled"),
-            "analytics_enabled": self.device_data.get("analyticsEnabled"),
-        }
-        if self.device_data.get("status") == "online" and self.stream_start_time:
-            attributes["uptime"] = self.calculate_uptime()
+        """Return additional attributes for the sensor.
+
+        The dict is rebuilt only when the camera's data or the motion score
+        changes, so unchanged writes reuse the same attributes.
+        """
+        thumbnail_coordinator = self._get_thumbnail_coordinator()
+        motion = thumbnail_coordinator.get_motion(self.uidd) if thumbnail_coordinator else {}
+        key = (self.coordinator.get_device_version(self.uidd), motion.get("motion_updated"))
+        if self._attributes is None or self._attributes[0] != key:
+            attributes = {
+                "model": self.device_data.get("model"),
+                "resolution": self.device_data.get("recordingResolution"),
+                "mac_address": self.device_data.get("macAddress"),
+                "cloud_recording": self.device_data.get("cloudRecordingEnabled"),
+                "ptz_capabilities": self.device_data.get("ptzEnabled"),
+                "audio_enabled": self.device_data.get("audioEnabled"),
+                "analytics_enabled": self.device_data.get("analyticsEnabled"),
+                **motion,
+            }
+            self._attributes = (key, attributes)
+        attributes = self._attributes[1]
+        if self.coordinator.status_history.get_online_since(self.uidd) is not None:
+            attributes = {**attributes, "uptime": self.calculate_uptime()}
         return attributes
 
+    def _get_thumbnail_coordinator(self):
+        """Return the thumbnail coordinator that scores motion between thumbnails."""
+        return self.hass.data[DOMAIN][self.coordinator.entry.entry_id].get("coordinator")
+
+    async def async_added_to_hass(self) -> None:
+        """Update the motion attributes whenever a new thumbnail is scored."""
+        await super().async_added_to_hass()
+        thumbnail_coordinator = self._get_thumbnail_coordinator()
+        if thumbnail_coordinator:
+            self.async_on_remove(
+                thumbnail_coordinator.async_add_motion_listener(self.uidd, self.async_write_ha_state)
+            )
+
     def calculate_uptime(self) -> str:
-        """Calculate how long the stream has been live."""
-        if self.stream_start_time:
-            delta = datetime.now() - self.stream_start_time
-            return str(delta).split(".")[0]  # Remove microseconds
+        """Calculate how long the camera has been online."""
+        online_since = self.coordinator.status_history.get_online_since(self.uidd)
+        if online_since is not None:
+            delta = timedelta(seconds=int(time.time() - online_since))
+            return str(delta)
         return "unknown"
 
+
+class VideoloftHistorySensor(VideoloftDeviceEntity, SensorEntity):
+    """Base for sensors derived from a camera's status transition history."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: VideoloftStatusCoordinator,
+        uidd: str,
+        device_data: Dict[str, Any],
+        sensor_type: str,
+        label: str,
+    ) -> None:
+        """Initialize the history sensor."""
+        super().__init__(coordinator, uidd, device_data)
+        camera_name = device_data.get("name", device_data.get("phonename", f"Camera {uidd}"))
+        self._attr_name = f"{camera_name} {label}"
+        self._attr_unique_id = f"videoloft_{sensor_type}_{uidd}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, uidd)})
+        self.history = coordinator.status_history
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh periodically, since these figures drift with time."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.history.async_add_listener(self.async_write_ha_state))
+
+
+class VideoloftUptimeSensor(VideoloftHistorySensor):
+    """When the camera last came online."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
+        """Initialize the uptime sensor."""
+        super().__init__(coordinator, uidd, device_data, "uptime", "Uptime")
+
+    @property
+    def native_value(self) -> Optional[datetime]:
+        """Return the time the camera came online, or None while offline."""
+        online_since = self.history.get_online_since(self.uidd)
+        return datetime.fromtimestamp(online_since, tz=timezone.utc) if online_since is not None else None
+
+
+class VideoloftAvailabilitySensor(VideoloftHistorySensor):
+    """Percentage of tracked time the camera was online."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:percent-circle-outline"
+
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
+        """Initialize the availability sensor."""
+        super().__init__(coordinator, uidd, device_data, "availability", "Availability")
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the availability percentage."""
+        return self.history.get_availability(self.uidd)
+
+
+class VideoloftFlapCountSensor(VideoloftHistorySensor):
+    """Number of online/offline transitions in the last day."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:swap-vertical"
+
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
+        """Initialize the flap count sensor."""
+        super().__init__(coordinator, uidd, device_data, "status_changes", "Status Changes (24h)")
+
     @property
-    def should_poll(self) -> bool:
-        """Disable polling, updates are controlled via the coordinator."""
-        return False
-
-    async def async_update(self):
-        """Update the sensor data."""
-        await self.coordinator.async_request_refresh()
-        # Update device_data with the latest information
-        # Iterate directly over the list of camera objects
-        for device_data in self.coordinator.data:
-            uidd = f"{device_data['uid']}.{device_data['id']}"
-            if uidd == self.uidd:
-                self.device_data = device_data
-                break
+    def native_value(self) -> int:
+        """Return the number of status transitions in the window."""
+        return self.history.get_flap_count(self.uidd, STATUS_FLAP_COUNT_WINDOW)
+
+
+def _create_camera_sensors(
+    coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]
+) -> List[SensorEntity]:
+    """Create the per-camera sensors."""
+    return [
+        VideoloftStatusSensor(coordinator, uidd, device_data),
+        VideoloftUptimeSensor(coordinator, uidd, device_data),
+        VideoloftAvailabilitySensor(coordinator, uidd, device_data),
+        VideoloftFlapCountSensor(coordinator, uidd, device_data),
+    ]
 
 
 class VideoloftLPRSensor(CoordinatorEntity, SensorEntity):
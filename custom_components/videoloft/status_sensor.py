@@ -16,6 +16,8 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
 from .helpers.device_info import create_device_info, get_technical_specs, get_network_info
+from .helpers.entity import VideoloftDeviceEntity
+from .helpers.status_coordinator import VideoloftStatusCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,19 +32,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up VideLoft status sensors."""
-    devices = hass.data[DOMAIN][entry.entry_id]["devices"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: VideoloftStatusCoordinator = entry_data["status_coordinator"]
     
     entities = []
-    for device_data in devices:
-        uidd = f"{device_data['uid']}.{device_data['id']}"
+    for uidd, device_data in entry_data["device_index"].items():
         
         # Create status sensors for each camera
         entities.extend([
-            VideoloftLastSeenSensor(uidd, device_data),
-            VideoloftFirmwareVersionSensor(uidd, device_data),
-            VideoloftResolutionSensor(uidd, device_data),
-            VideoloftCodecSensor(uidd, device_data),
-            VideoloftAnalyticsSchemeSensor(uidd, device_data),
+            VideoloftLastSeenSensor(coordinator, uidd, device_data),
+            VideoloftFirmwareVersionSensor(coordinator, uidd, device_data),
+            VideoloftResolutionSensor(coordinator, uidd, device_data),
+            VideoloftCodecSensor(coordinator, uidd, device_data),
+            VideoloftAnalyticsSchemeSensor(coordinator, uidd, device_data),
         ])
 
     async_add_entities(entities)
@@ -52,13 +54,14 @@ async def async_setup_entry(
 # ----------------------------------------------------------
 
 
-class VideoloftStatusSensorBase(SensorEntity):
+class VideoloftStatusSensorBase(VideoloftDeviceEntity, SensorEntity):
     """Base class for VideLoft status sensors."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], sensor_type: str) -> None:
+    def __init__(
+        self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], sensor_type: str
+    ) -> None:
         """Initialize the status sensor."""
-        self.uidd = uidd
-        self.device_data = device_data
+        super().__init__(coordinator, uidd, device_data)
         self.sensor_type = sensor_type
         
         # Set up basic attributes
@@ -66,21 +69,14 @@ class VideoloftStatusSensorBase(SensorEntity):
         self._attr_device_info = create_device_info(uidd, device_data)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "device_id": self.uidd,
-            "last_updated": datetime.now().isoformat(),
-        }
 
 
 class VideoloftLastSeenSensor(VideoloftStatusSensorBase):
     """Sensor for last seen timestamp."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the last seen sensor."""
-        super().__init__(uidd, device_data, "last_seen")
+        super().__init__(coordinator, uidd, device_data, "last_seen")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Last Seen"
@@ -103,9 +99,9 @@ class VideoloftLastSeenSensor(VideoloftStatusSensorBase):
 class VideoloftFirmwareVersionSensor(VideoloftStatusSensorBase):
     """Sensor for firmware version."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the firmware version sensor."""
-        super().__init__(uidd, device_data, "firmware_version")
+        super().__init__(coordinator, uidd, device_data, "firmware_version")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Firmware Version"
@@ -120,9 +116,9 @@ class VideoloftFirmwareVersionSensor(VideoloftStatusSensorBase):
 class VideoloftResolutionSensor(VideoloftStatusSensorBase):
     """Sensor for recording resolution."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the resolution sensor."""
-        super().__init__(uidd, device_data, "resolution")
+        super().__init__(coordinator, uidd, device_data, "resolution")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Recording Resolution"
@@ -137,9 +133,9 @@ class VideoloftResolutionSensor(VideoloftStatusSensorBase):
 class VideoloftCodecSensor(VideoloftStatusSensorBase):
     """Sensor for video codec."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the codec sensor."""
-        super().__init__(uidd, device_data, "video_codec")
+        super().__init__(coordinator, uidd, device_data, "video_codec")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Video Codec"
@@ -154,9 +150,9 @@ class VideoloftCodecSensor(VideoloftStatusSensorBase):
 class VideoloftAnalyticsSchemeSensor(VideoloftStatusSensorBase):
     """Sensor for analytics scheme."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any]) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any]) -> None:
         """Initialize the analytics scheme sensor."""
-        super().__init__(uidd, device_data, "analytics_scheme")
+        super().__init__(coordinator, uidd, device_data, "analytics_scheme")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Analytics Scheme"
@@ -167,10 +163,9 @@ class VideoloftAnalyticsSchemeSensor(VideoloftStatusSensorBase):
         """Return the analytics scheme."""
         return self.device_data.get("analyticsScheme", "Unknown")
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "analytics_enabled": bool(self.device_data.get("analyticsEnabled", 0)),
         })
@@ -1,7 +1,7 @@
 """Switch platform for VideLoft integration."""
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -10,6 +10,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
+from .helpers.entity import VideoloftDeviceEntity
+from .helpers.status_coordinator import VideoloftStatusCoordinator
 from .helpers.device_info import create_device_info, get_camera_capabilities
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,47 +27,60 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up VideLoft switches."""
-    devices = hass.data[DOMAIN][entry.entry_id]["devices"]
-    api = hass.data[DOMAIN][entry.entry_id]["api"]
-    
-    entities = []
-    for device_data in devices:
-        uidd = f"{device_data['uid']}.{device_data['id']}"
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: VideoloftStatusCoordinator = entry_data["status_coordinator"]
+    api = entry_data["api"]
+
+    def _create_entities(uidd: str, device_data: Dict[str, Any]) -> List[SwitchEntity]:
         capabilities = get_camera_capabilities(device_data)
+        entities = []
         
         # Create capability-based switches
         if capabilities["ptz"]:
-            entities.append(VideoloftPTZSwitch(uidd, device_data, api))
+            entities.append(VideoloftPTZSwitch(coordinator, uidd, device_data, api))
         
         if capabilities["talkback"]:
-            entities.append(VideoloftTalkbackSwitch(uidd, device_data, api))
+            entities.append(VideoloftTalkbackSwitch(coordinator, uidd, device_data, api))
             
         if capabilities["rom"]:
-            entities.append(VideoloftROMSwitch(uidd, device_data, api))
+            entities.append(VideoloftROMSwitch(coordinator, uidd, device_data, api))
             
         # Always create recording control if supported
         if capabilities["cloud_recording"]:
-            entities.append(VideoloftRecordingSwitch(uidd, device_data, api))
+            entities.append(VideoloftRecordingSwitch(coordinator, uidd, device_data, api))
             
         # Analytics control
         if capabilities["analytics"]:
-            entities.append(VideoloftAnalyticsSwitch(uidd, device_data, api))
+            entities.append(VideoloftAnalyticsSwitch(coordinator, uidd, device_data, api))
+        return entities
+    
+    entities = []
+    for uidd, device_data in entry_data["device_index"].items():
+        entities.extend(_create_entities(uidd, device_data))
 
     if entities:
         async_add_entities(entities)
 
+    # Cameras added to the account later get their entities without a reload
+    entry.async_on_unload(
+        entry_data["inventory"].async_add_camera_listener(
+            lambda uidd, device_data: async_add_entities(_create_entities(uidd, device_data))
+        )
+    )
+
 # ----------------------------------------------------------
 # SWITCH ENTITY CLASSES
 # ----------------------------------------------------------
 
 
-class VideoloftSwitchBase(SwitchEntity):
+class VideoloftSwitchBase(VideoloftDeviceEntity, SwitchEntity):
     """Base class for VideLoft switches."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api, switch_type: str) -> None:
+    def __init__(
+        self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api, switch_type: str
+    ) -> None:
         """Initialize the switch."""
-        self.uidd = uidd
-        self.device_data = device_data
+        super().__init__(coordinator, uidd, device_data)
         self.api = api
         self.switch_type = switch_type
         
@@ -74,13 +89,11 @@ class VideoloftSwitchBase(SwitchEntity):
         self._attr_device_info = create_device_info(uidd, device_data)
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            "device_id": self.uidd,
-            "switch_type": self.switch_type,
-        }
+        attrs = super()._build_attributes()
+        attrs["switch_type"] = self.switch_type
+        return attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -96,9 +109,9 @@ class VideoloftSwitchBase(SwitchEntity):
 class VideoloftPTZSwitch(VideoloftSwitchBase):
     """Switch for PTZ control."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the PTZ switch."""
-        super().__init__(uidd, device_data, api, "ptz_control")
+        super().__init__(coordinator, uidd, device_data, api, "ptz_control")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} PTZ Control"
@@ -131,9 +144,9 @@ class VideoloftPTZSwitch(VideoloftSwitchBase):
 class VideoloftTalkbackSwitch(VideoloftSwitchBase):
     """Switch for talkback control."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the talkback switch."""
-        super().__init__(uidd, device_data, api, "talkback")
+        super().__init__(coordinator, uidd, device_data, api, "talkback")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Talkback"
@@ -148,9 +161,9 @@ class VideoloftTalkbackSwitch(VideoloftSwitchBase):
 class VideoloftROMSwitch(VideoloftSwitchBase):
     """Switch for ROM feature control."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the ROM switch."""
-        super().__init__(uidd, device_data, api, "rom")
+        super().__init__(coordinator, uidd, device_data, api, "rom")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} ROM Feature"
@@ -165,9 +178,9 @@ class VideoloftROMSwitch(VideoloftSwitchBase):
 class VideoloftRecordingSwitch(VideoloftSwitchBase):
     """Switch for cloud recording control."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the recording switch."""
-        super().__init__(uidd, device_data, api, "cloud_recording")
+        super().__init__(coordinator, uidd, device_data, api, "cloud_recording")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Cloud Recording"
@@ -182,9 +195,9 @@ class VideoloftRecordingSwitch(VideoloftSwitchBase):
 class VideoloftAnalyticsSwitch(VideoloftSwitchBase):
     """Switch for analytics control."""
 
-    def __init__(self, uidd: str, device_data: Dict[str, Any], api) -> None:
+    def __init__(self, coordinator: VideoloftStatusCoordinator, uidd: str, device_data: Dict[str, Any], api) -> None:
         """Initialize the analytics switch."""
-        super().__init__(uidd, device_data, api, "analytics")
+        super().__init__(coordinator, uidd, device_data, api, "analytics")
         
         camera_name = device_data.get("name", f"Camera {uidd}")
         self._attr_name = f"{camera_name} Analytics"
@@ -195,10 +208,9 @@ class VideoloftAnalyticsSwitch(VideoloftSwitchBase):
         """Return True if analytics is enabled."""
         return bool(self.device_data.get("analyticsEnabled", 0))
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        attrs = super().extra_state_attributes
+        attrs = super()._build_attributes()
         attrs.update({
             "analytics_scheme": self.device_data.get("analyticsScheme", "Unknown"),
         })
@@ -0,0 +1 @@
+"""Tests for the Videoloft integration."""
@@ -0,0 +1,3 @@
+"""Fixtures for Videoloft tests."""
+
+pytest_plugins = "pytest_homeassistant_custom_component"
@@ -0,0 +1,46 @@
+"""Tests for the UIDD device index."""
+
+from custom_components.videoloft.helpers.device_index import DeviceIndex, make_uidd
+
+CAMERAS = [
+    {"uid": "owner", "id": "1", "name": "Front", "logger": "logger1.example.com"},
+    {"uid": "owner", "id": "2", "phonename": "Back"},
+    {"uid": "owner", "id": "3"},
+]
+
+
+def test_make_uidd():
+    assert make_uidd(CAMERAS[0]) == "owner.1"
+
+
+def test_lookups():
+    index = DeviceIndex(CAMERAS)
+
+    assert len(index) == 3
+    assert index.uidds == ["owner.1", "owner.2", "owner.3"]
+    assert index.get("owner.1") is CAMERAS[0]
+    assert index.get("owner.9") is None
+    assert "owner.2" in index
+    assert index.get_logger("owner.1") == "logger1.example.com"
+    assert index.get_logger("owner.2") is None
+
+
+def test_names_fall_back_to_phonename_then_uidd():
+    index = DeviceIndex(CAMERAS)
+
+    assert index.get_name("owner.1") == "Front"
+    assert index.get_name("owner.2") == "Back"
+    assert index.get_name("owner.3") == "Camera owner.3"
+    assert index.get_name("owner.9", "Unknown") == "Unknown"
+
+
+def test_replace_swaps_the_whole_camera_list():
+    index = DeviceIndex(CAMERAS)
+    items_before = index.items()
+    index.replace([{"uid": "owner", "id": "4", "name": "Gate"}])
+
+    assert index.version == 1
+    assert index.uidds == ["owner.4"]
+    assert "owner.1" not in index
+    # An iterator taken before the swap still sees the old cameras
+    assert [uidd for uidd, _ in items_before] == ["owner.1", "owner.2", "owner.3"]
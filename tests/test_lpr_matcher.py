@@ -0,0 +1,86 @@
+"""Tests for the compiled LPR trigger matcher."""
+
+from custom_components.videoloft.const import LPR_TRIGGER_INDEX_KEY, LPR_TRIGGER_STORAGE_KEY
+from custom_components.videoloft.helpers.lpr_matcher import (
+    LPRTriggerMatcher,
+    get_lpr_matcher,
+    normalize,
+    set_lpr_triggers,
+)
+
+FRONT = "owner.1"
+BACK = "owner.2"
+
+
+def _trigger(uidd, license_plate="", make="", model="", color="", **extra):
+    return {"uidd": uidd, "license_plate": license_plate, "make": make, "model": model, "color": color, **extra}
+
+
+def test_normalize():
+    assert normalize("  AB12 CDE ") == "ab12 cde"
+    assert normalize(None) == ""
+
+
+def test_matches_plate_for_the_detecting_camera_only():
+    trigger = _trigger(FRONT, license_plate=" AB12CDE ")
+    matcher = LPRTriggerMatcher([trigger])
+
+    assert matcher.match({"license_plate": "ab12cde"}, FRONT) is trigger
+    assert matcher.match({"license_plate": "ab12cde"}, BACK) is None
+    assert matcher.match({"license_plate": "zz99zzz"}, FRONT) is None
+
+
+def test_vehicle_match_needs_make_model_and_color():
+    full = _trigger(FRONT, make="Ford", model="Focus", color="Red")
+    partial = _trigger(BACK, make="Ford", model="Focus")
+    matcher = LPRTriggerMatcher([full, partial])
+    vehicle = {"license_plate": "", "make": "ford", "model": "focus", "color": "red"}
+
+    assert matcher.match(vehicle, FRONT) is full
+    assert matcher.match(vehicle, BACK) is None
+    assert matcher.match({**vehicle, "color": "blue"}, FRONT) is None
+
+
+def test_earliest_trigger_wins():
+    by_vehicle = _trigger(FRONT, make="ford", model="focus", color="red")
+    by_plate = _trigger(FRONT, license_plate="ab12cde")
+    duplicate_plate = _trigger(FRONT, license_plate="AB12CDE")
+    matcher = LPRTriggerMatcher([by_vehicle, by_plate, duplicate_plate])
+    vehicle = {"license_plate": "ab12cde", "make": "ford", "model": "focus", "color": "red"}
+
+    assert matcher.match(vehicle, FRONT) is by_vehicle
+    assert matcher.match({"license_plate": "ab12cde"}, FRONT) is by_plate
+
+
+def test_disabled_triggers_are_ignored():
+    disabled = _trigger(FRONT, license_plate="ab12cde", enabled=False)
+    enabled = _trigger(BACK, license_plate="ab12cde", enabled=True)
+    matcher = LPRTriggerMatcher([disabled, enabled])
+
+    assert matcher.uidds == {BACK}
+    assert matcher.match({"license_plate": "ab12cde"}, FRONT) is None
+    assert matcher.match({"license_plate": "ab12cde"}, BACK) is enabled
+    assert not LPRTriggerMatcher([disabled])
+
+
+def test_detection_without_uidd_checks_every_camera():
+    back = _trigger(BACK, license_plate="ab12cde")
+    front = _trigger(FRONT, license_plate="ab12cde")
+    matcher = LPRTriggerMatcher([back, front])
+
+    assert matcher.match({"license_plate": "ab12cde"}) is back
+
+
+def test_matcher_is_recompiled_when_triggers_are_replaced():
+    entry_data = {}
+    triggers = [_trigger(FRONT, license_plate="ab12cde")]
+    matcher = set_lpr_triggers(entry_data, triggers)
+
+    assert entry_data[LPR_TRIGGER_STORAGE_KEY] is triggers
+    assert entry_data[LPR_TRIGGER_INDEX_KEY] is matcher
+    assert get_lpr_matcher(entry_data) is matcher
+
+    entry_data[LPR_TRIGGER_STORAGE_KEY] = [_trigger(BACK, license_plate="zz99zzz")]
+    recompiled = get_lpr_matcher(entry_data)
+    assert recompiled is not matcher
+    assert recompiled.uidds == {BACK}
@@ -0,0 +1,40 @@
+"""Tests for the LPR coordinator's adaptive poll interval."""
+
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.videoloft.const import DEFAULT_POLL_INTERVAL, DOMAIN, LPR_MAX_POLL_INTERVAL, LPR_MIN_POLL_INTERVAL
+from custom_components.videoloft.sensor import LPRUpdateCoordinator
+
+
+@pytest.fixture
+def coordinator(hass):
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    return LPRUpdateCoordinator(hass, entry)
+
+
+def test_activity_drives_the_interval(coordinator):
+    coordinator._poll_activity = "active"
+    coordinator._adapt_poll_interval()
+    assert coordinator.update_interval == timedelta(seconds=LPR_MIN_POLL_INTERVAL)
+
+    coordinator._poll_activity = "quiet"
+    coordinator._adapt_poll_interval()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_POLL_INTERVAL)
+
+    coordinator._poll_activity = "idle"
+    coordinator._adapt_poll_interval()
+    assert coordinator.update_interval == timedelta(seconds=LPR_MAX_POLL_INTERVAL)
+
+
+async def test_failed_poll_backs_off_one_step(coordinator):
+    coordinator.update_interval = timedelta(seconds=LPR_MIN_POLL_INTERVAL * 2)
+
+    # The entry has no API set up, so the poll fails
+    await coordinator.async_update_lpr()
+
+    assert coordinator._poll_activity == "error"
+    assert coordinator.update_interval == timedelta(seconds=LPR_MIN_POLL_INTERVAL * 3)
@@ -0,0 +1,69 @@
+"""Tests for the per-camera status history."""
+
+from types import SimpleNamespace
+
+from custom_components.videoloft.helpers import status_history
+from custom_components.videoloft.helpers.status_history import (
+    OFFLINE,
+    ONLINE,
+    StatusHistory,
+    _CameraHistory,
+)
+
+UIDD = "owner.1"
+
+
+def test_ring_buffer_keeps_the_newest_transitions():
+    history = _CameraHistory(capacity=3)
+    for timestamp in range(5):
+        history.append(float(timestamp), timestamp % 2)
+
+    assert history.count == 3
+    assert history.transitions() == [[2.0, OFFLINE], [3.0, ONLINE], [4.0, OFFLINE]]
+    assert history.time_at(0) == 2.0
+
+
+def test_accumulate_counts_online_time():
+    history = _CameraHistory(capacity=3)
+    history.accumulate(0)
+    history.status = ONLINE
+    history.accumulate(30)
+    history.status = OFFLINE
+    history.accumulate(40)
+
+    assert history.online == 30
+    assert history.tracked == 40
+
+
+async def test_availability_and_flap_count(hass, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(status_history, "time", SimpleNamespace(time=lambda: now[0]))
+    history = StatusHistory(hass, "entry", capacity=4)
+
+    assert history.record(UIDD, True)
+    assert not history.record(UIDD, True)
+    assert not history.record(UIDD, None)
+    now[0] += 75
+    assert history.record(UIDD, False)
+    now[0] += 25
+
+    assert history.get_availability(UIDD) == 75.0
+    assert history.get_online_since(UIDD) is None
+    assert history.get_flap_count(UIDD, 30) == 1
+    assert history.get_flap_count(UIDD, 1000) == 2
+    await history.async_flush()
+
+
+async def test_flap_count_after_ring_wraps(hass, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(status_history, "time", SimpleNamespace(time=lambda: now[0]))
+    history = StatusHistory(hass, "entry", capacity=4)
+    for step in range(6):
+        history.record(UIDD, step % 2 == 0)
+        now[0] += 10
+
+    # Only the 4 newest transitions are kept; the window covers the last 3
+    assert history.get_flap_count(UIDD, 1000) == 4
+    assert history.get_flap_count(UIDD, 30) == 3
+    assert history.get_online_since(UIDD) is None
+    await history.async_flush()
@@ -0,0 +1,107 @@
+"""Tests for the status coordinator's adaptive polling intervals."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.videoloft.const import (
+    DOMAIN,
+    STATUS_FLAP_WINDOW,
+    STATUS_MAX_INTERVAL,
+    STATUS_MIN_INTERVAL,
+    STATUS_OFFLINE_MAX_INTERVAL,
+    STATUS_UPDATE_INTERVAL,
+    STATUS_VIEWED_INTERVAL,
+)
+from custom_components.videoloft.helpers.status_coordinator import VideoloftStatusCoordinator
+
+UIDD = "owner.1"
+ONLINE = {"current_status": "online"}
+OFFLINE = {"current_status": "offline"}
+
+
+class _StatusApi:
+    async def get_camera_status(self, uidd: str, logger_server: str) -> dict:
+        return {"result": {"owner": {"devices": {"1": {"status": "online"}}}}}
+
+
+class _ViewedCoordinator:
+    def __init__(self, viewed: bool) -> None:
+        self.viewed = viewed
+
+    def is_recently_viewed(self, uidd: str, within: float) -> bool:
+        return self.viewed
+
+
+@pytest.fixture
+def coordinator(hass):
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": _ViewedCoordinator(False)}
+    return VideoloftStatusCoordinator(hass, entry, api=None)
+
+
+def test_stable_camera_backs_off_to_its_ceiling(coordinator):
+    assert coordinator._next_interval(UIDD, ONLINE, 0) == STATUS_UPDATE_INTERVAL
+
+    coordinator._intervals[UIDD] = STATUS_MAX_INTERVAL
+    assert coordinator._next_interval(UIDD, ONLINE, 0) == STATUS_MAX_INTERVAL
+
+    coordinator._intervals[UIDD] = STATUS_OFFLINE_MAX_INTERVAL
+    assert coordinator._next_interval(UIDD, OFFLINE, 0) == STATUS_OFFLINE_MAX_INTERVAL
+
+
+def test_status_change_polls_soon_then_eases_back(coordinator):
+    coordinator._device_data[UIDD] = dict(OFFLINE)
+    assert coordinator._next_interval(UIDD, ONLINE, 1000) == STATUS_MIN_INTERVAL
+
+    # Within the flap window the interval may only grow back to the base interval
+    coordinator._device_data[UIDD] = dict(ONLINE)
+    coordinator._intervals[UIDD] = STATUS_UPDATE_INTERVAL
+    assert coordinator._next_interval(UIDD, ONLINE, 1000 + STATUS_FLAP_WINDOW - 1) == STATUS_UPDATE_INTERVAL
+
+    # After the window it backs off towards the ceiling again
+    assert coordinator._next_interval(UIDD, ONLINE, 1000 + STATUS_FLAP_WINDOW) == 2 * STATUS_UPDATE_INTERVAL
+
+
+def test_stale_result_is_not_a_status_change(coordinator):
+    coordinator._device_data[UIDD] = dict(ONLINE)
+    stale = {**OFFLINE, "status_stale": True}
+
+    assert coordinator._next_interval(UIDD, stale, 1000) == STATUS_UPDATE_INTERVAL
+    assert UIDD not in coordinator._last_status_change
+
+
+def test_failed_poll_republishes_previous_data_as_stale(coordinator):
+    coordinator._device_data[UIDD] = {**ONLINE, "logger": "logger1.example.com"}
+
+    stale = coordinator._stale_device_data(UIDD, {"logger": "logger1.example.com"})
+    assert stale == {**ONLINE, "logger": "logger1.example.com", "status_stale": True}
+    assert "status_stale" not in coordinator._device_data[UIDD]
+
+
+def test_viewed_camera_uses_the_viewed_interval(hass, coordinator):
+    hass.data[DOMAIN][coordinator.entry.entry_id]["coordinator"].viewed = True
+    coordinator._intervals[UIDD] = STATUS_MAX_INTERVAL
+
+    assert coordinator._next_interval(UIDD, ONLINE, 0) == STATUS_VIEWED_INTERVAL
+
+
+def test_min_interval_is_the_floor(coordinator):
+    coordinator._intervals[UIDD] = 1
+    assert coordinator._next_interval(UIDD, ONLINE, 0) == STATUS_MIN_INTERVAL
+
+
+async def test_firmware_fields_carry_over_between_checks(coordinator):
+    coordinator.api = _StatusApi()
+    device = {"logger": "logger1.example.com"}
+    checked_at = datetime(2024, 1, 1)
+
+    first = await coordinator._async_poll_device_checks(UIDD, device, checked_at)
+    assert first["firmware_up_to_date"] is True
+    coordinator._device_data[UIDD] = first
+
+    second = await coordinator._async_poll_device_checks(UIDD, device, checked_at + timedelta(minutes=5))
+    assert second["firmware_up_to_date"] is True
+    assert second["firmware_check_time"] == first["firmware_check_time"]
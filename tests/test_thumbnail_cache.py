@@ -0,0 +1,70 @@
+"""Tests for the byte-budgeted thumbnail cache."""
+
+from types import SimpleNamespace
+
+from custom_components.videoloft.helpers import thumbnail_cache
+from custom_components.videoloft.helpers.thumbnail_cache import ThumbnailCache
+
+
+def _entry(size: int) -> dict:
+    return {"data": b"x" * size, "variants": {}}
+
+
+def test_evicts_least_recently_used_over_budget():
+    cache = ThumbnailCache("test", max_bytes=100)
+    cache.set("a", _entry(40))
+    cache.set("b", _entry(40))
+    cache.get("a")
+    cache.set("c", _entry(40))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.get_stats()["resident_bytes"] == 80
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_entry_larger_than_budget_is_not_cached():
+    cache = ThumbnailCache("test", max_bytes=100)
+    cache.set("a", _entry(101))
+
+    assert "a" not in cache
+    assert cache.get_stats()["resident_bytes"] == 0
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(thumbnail_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = ThumbnailCache("test", max_bytes=100, ttl=60)
+    cache.set("a", _entry(10))
+
+    now[0] += 59
+    assert cache.get("a") is not None
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_update_size_evicts_other_entries_first():
+    cache = ThumbnailCache("test", max_bytes=100)
+    cache.set("a", _entry(40))
+    cache.set("b", _entry(40))
+    cache.peek("b")["variants"]["small"] = b"v" * 30
+    cache.update_size("b")
+
+    assert "a" not in cache
+    assert cache.peek("b")["variants"] == {"small": b"v" * 30}
+    assert cache.get_stats()["resident_bytes"] == 70
+
+
+def test_update_size_trims_oldest_variants_of_kept_entry():
+    cache = ThumbnailCache("test", max_bytes=100)
+    cache.set("a", _entry(10))
+    variants = cache.peek("a")["variants"]
+    for key in ("first", "second", "third"):
+        variants[key] = b"v" * 40
+    cache.update_size("a")
+
+    assert list(variants) == ["second", "third"]
+    assert cache.get_stats()["resident_bytes"] == 90
+    assert cache.get_stats()["resident_bytes"] <= cache.max_bytes